@@ -46,6 +46,9 @@ autodoc_default_options = {
 }
 
 autosummary_generate = True
+# Don't rewrite existing stub files, so unchanged stubs keep their mtimes and
+# incremental builds (-d <doctrees>) only re-read what actually changed
+autosummary_generate_overwrite = False
 
 # MyST settings for markdown support
 myst_enable_extensions = [
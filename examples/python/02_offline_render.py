@@ -53,7 +53,7 @@ if success:
     print(f"Rendering {duration} seconds of audio ({num_frames} frames)...")
 
     input_buffer = np.zeros(0, dtype=np.float32)  # No input
-    output_buffer = np.zeros(num_frames * 2, dtype=np.float32)  # Stereo output
+    output_buffer = np.empty(num_frames * 2, dtype=np.float32)  # Stereo output, filled by the VM
 
     # Process audio (synchronous/offline)
     chuck.run(input_buffer, output_buffer, num_frames)
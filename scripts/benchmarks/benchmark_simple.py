@@ -3,30 +3,91 @@
 Simple performance benchmarks for numchuck.
 
 Measures basic operations to establish performance baselines.
+
+Each benchmark times an inner batch of calls several times over and
+reports the best (and median) per-call figure, as `timeit` does, so the
+timer overhead is amortized and one-off hiccups don't skew the result.
 """
 
-import time
+import gc
+import os
+import statistics
+from time import perf_counter_ns
+from typing import NamedTuple
+
 import numpy as np
-import numchuck
+
+import numchuck._numchuck as numchuck
+
+# Results whose measured loop/call overhead exceeds this share are flagged
+OVERHEAD_WARN_RATIO = 0.10
 
 
-def benchmark(name, func, iterations=100):
-    """Run a benchmark and print results."""
-    start = time.perf_counter()
-    for _ in range(iterations):
-        func()
-    end = time.perf_counter()
+class BenchResult(NamedTuple):
+    """Overhead-corrected timings from a single benchmark() run."""
 
-    total_time = end - start
-    avg_time = total_time / iterations
-    ops_per_sec = iterations / total_time if total_time > 0 else 0
+    best_ns: float  # per call
+    median_ns: float  # per call
+    calls: int  # calls per timed batch
+
+
+def _time_batches(func, inner, repeats):
+    """Time `repeats` batches of `inner` calls, returning elapsed ns per batch.
+
+    The garbage collector is paused while timing so a collection can't land
+    inside a batch.
+    """
+    times = []
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = perf_counter_ns()
+            for _ in range(inner):
+                func()
+            times.append(perf_counter_ns() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return times
+
+
+def pin_to_one_cpu():
+    """Pin the process to a single CPU where supported; return it or None."""
+    if not hasattr(os, "sched_setaffinity"):
+        return None
+    cpu = min(os.sched_getaffinity(0))
+    os.sched_setaffinity(0, {cpu})
+    return cpu
+
+
+def calibrate(inner=1000, repeats=5):
+    """Return the per-call cost (ns) of the timing loop around an empty call."""
+    return min(_time_batches(lambda: None, inner, repeats)) / inner
+
+
+def benchmark(name, func, inner=100, repeats=5, overhead_ns=0.0):
+    """Run a benchmark, print and return its results.
+
+    `overhead_ns` (see `calibrate()`) is subtracted from the reported times.
+    """
+    times = _time_batches(func, inner, repeats)
+
+    raw_ns = min(times) / inner
+    best_ns = max(raw_ns - overhead_ns, 0.0)
+    median_ns = max(statistics.median(times) / inner - overhead_ns, 0.0)
+    ops_per_sec = 1e9 / best_ns if best_ns > 0 else 0
 
     print(f"{name}:")
-    print(f"  Iterations:  {iterations}")
-    print(f"  Total time:  {total_time:.4f}s")
-    print(f"  Avg time:    {avg_time * 1000:.4f}ms")
+    print(f"  Iterations:  {inner} x {repeats}")
+    print(f"  Best time:   {best_ns / 1e6:.4f}ms")
+    print(f"  Median time: {median_ns / 1e6:.4f}ms")
     print(f"  Ops/sec:     {ops_per_sec:.2f}")
+    if raw_ns > 0 and overhead_ns / raw_ns > OVERHEAD_WARN_RATIO:
+        print(f"  WARN overhead {overhead_ns / raw_ns * 100:.1f}%")
     print()
+    return BenchResult(best_ns, median_ns, inner)
 
 
 def main():
@@ -35,6 +96,14 @@ def main():
     print("=" * 60)
     print()
 
+    cpu = pin_to_one_cpu()
+    if cpu is not None:
+        print(f"Pinned to CPU {cpu}")
+
+    overhead_ns = calibrate()
+    print(f"Loop overhead: {overhead_ns:.1f}ns per call (subtracted)")
+    print()
+
     #
     # 1. Compilation benchmark
     #
@@ -49,12 +118,18 @@ def main():
 
     code = "SinOsc s => dac; 440 => s.freq;"
 
-    def compile_and_remove():
-        success, shred_ids = chuck.compile_code(code)
+    # Hot callables are bound as default args so each call is a local
+    # (LOAD_FAST) lookup rather than a closure + attribute lookup.
+    def compile_and_remove(
+        _compile=chuck.compile_code, _remove=chuck.remove_shred, _code=code
+    ):
+        success, shred_ids = _compile(_code)
         if success and shred_ids:
-            chuck.remove_shred(shred_ids[0])
+            _remove(shred_ids[0])
 
-    benchmark("Simple code compilation", compile_and_remove, 100)
+    benchmark(
+        "Simple code compilation", compile_and_remove, 100, overhead_ns=overhead_ns
+    )
 
     #
     # 2. Audio rendering benchmark
@@ -72,23 +147,29 @@ def main():
     chuck.compile_code(code_with_time)
 
     frames = 512
-    input_buf = np.zeros(frames * 0, dtype=np.float32)
-    output_buf = np.zeros(frames * 2, dtype=np.float32)
-
-    def render_audio():
-        chuck.run(input_buf, output_buf, frames)
-
-    benchmark("Audio rendering (512 frames)", render_audio, 200)
-
-    # Calculate throughput
-    samples_per_call = frames * 2
-    bytes_per_call = samples_per_call * 4  # float32
-    iterations = 200
-    start = time.perf_counter()
-    for _ in range(iterations):
-        render_audio()
-    elapsed = time.perf_counter() - start
-    throughput_mb_s = (bytes_per_call * iterations) / elapsed / (1024 * 1024)
+    in_channels = chuck.get_param_int(numchuck.PARAM_INPUT_CHANNELS)
+    out_channels = chuck.get_param_int(numchuck.PARAM_OUTPUT_CHANNELS)
+
+    # Allocated once outside the timed region. The VM overwrites every
+    # output sample, so only the (silent) input needs zeroing, and neither
+    # buffer needs re-zeroing between calls.
+    input_buf = np.zeros(frames * in_channels, dtype=np.float32)
+    output_buf = np.empty(frames * out_channels, dtype=np.float32)
+
+    def render_audio(_run=chuck.run, _in=input_buf, _out=output_buf, _n=frames):
+        _run(_in, _out, _n)
+
+    render = benchmark(
+        "Audio rendering (512 frames)", render_audio, 200, overhead_ns=overhead_ns
+    )
+
+    # Throughput from the same measurement, not a second render loop
+    bytes_per_call = frames * out_channels * 4  # float32
+    throughput_mb_s = (
+        bytes_per_call * 1e9 / render.best_ns / (1024 * 1024)
+        if render.best_ns > 0
+        else 0
+    )
     print(f"  Throughput:  {throughput_mb_s:.2f} MB/s")
     print()
 
@@ -102,10 +183,10 @@ def main():
 
     chuck.compile_code("global int counter;")
 
-    def set_global():
-        chuck.set_global_int("counter", 42)
+    def set_global(_set=chuck.set_global_int):
+        _set("counter", 42)
 
-    benchmark("Set global int", set_global, 500)
+    benchmark("Set global int", set_global, 500, overhead_ns=overhead_ns)
 
     chuck.clear_vm()
 
@@ -117,10 +198,10 @@ def main():
 
     chuck.compile_code("global Event trigger;")
 
-    def signal_event():
-        chuck.signal_global_event("trigger")
+    def signal_event(_signal=chuck.signal_global_event):
+        _signal("trigger")
 
-    benchmark("Signal event", signal_event, 500)
+    benchmark("Signal event", signal_event, 500, overhead_ns=overhead_ns)
 
     chuck.clear_vm()
 
@@ -9,30 +9,41 @@ to prevent catching KeyboardInterrupt, SystemExit, etc.
 import re
 from pathlib import Path
 
-# Mapping of context to appropriate exception types
-FIXES = [
+# Mapping of the statement following a bare except to the exception types
+# it should catch
+FIXES = {
     # File I/O operations
-    (r"except:\s*\n\s*content = None", "except (OSError, UnicodeDecodeError):\n            content = None"),
+    "content = None": "(OSError, UnicodeDecodeError)",
 
     # ChucK operations
-    (r"except:\s*\n\s*current_time = 0\.0", "except (RuntimeError, AttributeError):\n                current_time = 0.0"),
-    (r"except:\s*\n\s*srate = 44100", "except (RuntimeError, AttributeError):\n                    srate = 44100"),
-    (r"except:\s*\n\s*sample_rate = 44100", "except (RuntimeError, AttributeError):\n                    sample_rate = 44100"),
+    "current_time = 0.0": "(RuntimeError, AttributeError)",
+    "srate = 44100": "(RuntimeError, AttributeError)",
+    "sample_rate = 44100": "(RuntimeError, AttributeError)",
 
     # Path operations
-    (r"except:\s*\n\s*name = full_name", "except (ValueError, OSError):\n                    name = full_name"),
+    "name = full_name": "(ValueError, OSError)",
 
     # Generic cleanup (last resort)
-    (r"except:\s*\n\s*pass", "except Exception:\n                pass"),
-]
+    "pass": "Exception",
+}
+
+# One alternation over every known statement, so each file is scanned once
+PATTERN = re.compile(
+    r"except:\s*\n(\s*)(" + "|".join(map(re.escape, FIXES)) + ")"
+)
+
+def _replace(match):
+    indent, statement = match.groups()
+    return f"except {FIXES[statement]}:\n{indent}{statement}"
 
 def fix_file(filepath):
     """Fix bare except clauses in a single file."""
     content = filepath.read_text()
+    if "except:" not in content:
+        return False
     original = content
 
-    for pattern, replacement in FIXES:
-        content = re.sub(pattern, replacement, content)
+    content = PATTERN.sub(_replace, content)
 
     if content != original:
         filepath.write_text(content)
@@ -3,6 +3,7 @@
 #include <nanobind/stl/vector.h>
 #include <nanobind/stl/list.h>
 #include <nanobind/stl/pair.h>
+#include <nanobind/stl/optional.h>
 #include <nanobind/ndarray.h>
 #include <nanobind/make_iterator.h>
 
@@ -12,8 +13,13 @@
 #include "chuck_vm.h"
 #include "util_platforms.h"  // For ck_usleep
 
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <cstring>
 #include <mutex>
 #include <stdexcept>
+#include <thread>
 #include <sstream>
 #include <unordered_map>
 #include <memory>
@@ -22,20 +28,338 @@
 namespace nb = nanobind;
 using namespace nb::literals;
 
+// Sample-conversion loops get AVX2/AVX-512 clones, picked at load time, on
+// x86-64 glibc builds with GCC so portable wheels still use wide vectors
+#if defined(__GNUC__) && !defined(__clang__) && defined(__x86_64__) && defined(__GLIBC__)
+#define NUMCHUCK_SIMD_CLONES __attribute__((target_clones("default", "avx2", "avx512f")))
+#else
+#define NUMCHUCK_SIMD_CLONES
+#endif
+
+// Explicit 4-wide stereo (de)interleave kernels: SSE2 is baseline on x86-64
+// and NEON on arm64, so neither needs runtime dispatch
+#if !defined(__CHUCK_USE_64_BIT_SAMPLE__) && (defined(__SSE2__) || defined(_M_X64))
+#include <emmintrin.h>
+#define NUMCHUCK_SSE2 1
+#elif !defined(__CHUCK_USE_64_BIT_SAMPLE__) && defined(__ARM_NEON)
+#include <arm_neon.h>
+#define NUMCHUCK_NEON 1
+#endif
+
 // Mutex for audio state protection
 static std::mutex g_audio_mutex;
 
 // Thread-local storage for current ChucK instance (used by chout/cherr callbacks)
 static thread_local ChucK* g_current_chuck = nullptr;
 
+// Lock-free view of a global int/float for metering. The thread that runs
+// the VM copies the global into an atomic after every block, so Python can
+// poll the value at its own rate without a callback or GIL round trip.
+class GlobalMeter {
+    const ChucK* m_chuck;
+    std::string m_name;
+    const t_CKINT* m_int_source;
+    const t_CKFLOAT* m_float_source;
+    std::atomic<t_CKINT> m_int{0};
+    std::atomic<t_CKFLOAT> m_float{0};
+
+public:
+    GlobalMeter(const ChucK* chuck, const std::string& name,
+                const t_CKINT* int_source, const t_CKFLOAT* float_source)
+        : m_chuck(chuck), m_name(name),
+          m_int_source(int_source), m_float_source(float_source) {}
+    ~GlobalMeter();
+
+    GlobalMeter(const GlobalMeter&) = delete;
+    GlobalMeter& operator=(const GlobalMeter&) = delete;
+
+    const ChucK* chuck() const { return m_chuck; }
+    const std::string& name() const { return m_name; }
+    bool is_float() const { return m_float_source != nullptr; }
+
+    // Only called by the thread running the VM (or while no thread is)
+    void update() {
+        if (m_float_source) {
+            m_float.store(*m_float_source, std::memory_order_relaxed);
+        } else {
+            m_int.store(*m_int_source, std::memory_order_relaxed);
+        }
+    }
+
+    t_CKINT int_value() const { return m_int.load(std::memory_order_relaxed); }
+    t_CKFLOAT float_value() const { return m_float.load(std::memory_order_relaxed); }
+};
+
+// Bound meters per instance. The rendering side only ever try_locks, so a
+// concurrent bind/unbind delays one update instead of blocking audio.
+static std::unordered_map<const ChucK*, std::vector<GlobalMeter*>> g_meters;
+static std::mutex g_meter_mutex;
+static std::atomic<size_t> g_meter_count{0};
+
+static void register_meter(GlobalMeter* meter) {
+    std::lock_guard<std::mutex> lock(g_meter_mutex);
+    g_meters[meter->chuck()].push_back(meter);
+    g_meter_count.fetch_add(1, std::memory_order_relaxed);
+}
+
+GlobalMeter::~GlobalMeter() {
+    std::lock_guard<std::mutex> lock(g_meter_mutex);
+    auto it = g_meters.find(m_chuck);
+    if (it == g_meters.end()) {
+        return;  // Instance already shut down
+    }
+    auto& meters = it->second;
+    auto found = std::find(meters.begin(), meters.end(), this);
+    if (found == meters.end()) {
+        return;  // Instance shut down and rebound since
+    }
+    meters.erase(found);
+    g_meter_count.fetch_sub(1, std::memory_order_relaxed);
+    if (meters.empty()) {
+        g_meters.erase(it);
+    }
+}
+
+// Helper: Stop updating an instance's meters (before its globals go away)
+static void remove_instance_meters(const ChucK* chuck) {
+    std::lock_guard<std::mutex> lock(g_meter_mutex);
+    auto it = g_meters.find(chuck);
+    if (it != g_meters.end()) {
+        g_meter_count.fetch_sub(it->second.size(), std::memory_order_relaxed);
+        g_meters.erase(it);
+    }
+}
+
+// Helper: Refresh an instance's meters after a block has been rendered
+static void update_meters(const ChucK* chuck) {
+    if (g_meter_count.load(std::memory_order_relaxed) == 0) {
+        return;
+    }
+    std::unique_lock<std::mutex> lock(g_meter_mutex, std::try_to_lock);
+    if (!lock.owns_lock()) {
+        return;
+    }
+    auto it = g_meters.find(chuck);
+    if (it != g_meters.end()) {
+        for (GlobalMeter* meter : it->second) {
+            meter->update();
+        }
+    }
+}
+
+// Per-instance render locks. A render holds its instance's lock, taken
+// after releasing the GIL, for as long as it runs the VM; direct globals
+// access takes the same lock, so no other thread touches the VM meanwhile.
+// Recursive, so a callback fired mid-render can reach the same instance.
+// An entry is erased when its instance shuts down or is destroyed; locks
+// are shared, so a thread still holding or waiting on one keeps it alive.
+static std::mutex g_render_locks_mutex;
+static std::unordered_map<const ChucK*, std::shared_ptr<std::recursive_mutex>> g_render_locks;
+
+static std::shared_ptr<std::recursive_mutex> render_lock(const ChucK& chuck) {
+    std::lock_guard<std::mutex> lock(g_render_locks_mutex);
+    std::shared_ptr<std::recursive_mutex>& entry = g_render_locks[&chuck];
+    if (!entry) {
+        entry = std::make_shared<std::recursive_mutex>();
+    }
+    return entry;
+}
+
+static void remove_render_lock(const ChucK* chuck) {
+    std::lock_guard<std::mutex> lock(g_render_locks_mutex);
+    g_render_locks.erase(chuck);
+}
+
+// Renders in progress on this thread. The VM calls back into Python
+// mid-render (chout/cherr, global callbacks), and a render started from
+// such a callback would grow this thread's scratch and silence blocks
+// while the outer render still writes through pointers into them, so
+// render calls refuse to start while it is nonzero.
+static thread_local int g_render_depth = 0;
+
+// Helper: Refuse a render from a callback fired during a render. Called
+// before the render touches any per-thread block.
+static void check_not_rendering() {
+    if (g_render_depth > 0) {
+        throw std::runtime_error("Cannot render from a callback fired during a render");
+    }
+}
+
+// Holds an instance's render lock for the duration of a render
+class RenderGuard {
+    std::shared_ptr<std::recursive_mutex> m_mutex;
+    std::lock_guard<std::recursive_mutex> m_lock;
+
+public:
+    explicit RenderGuard(const ChucK& chuck)
+        : m_mutex(render_lock(chuck)), m_lock(*m_mutex) {
+        ++g_render_depth;
+    }
+
+    ~RenderGuard() { --g_render_depth; }
+
+    RenderGuard(const RenderGuard&) = delete;
+    RenderGuard& operator=(const RenderGuard&) = delete;
+};
+
+// ChucK as created from Python: the same layout, but destroying it also
+// drops its render lock, so an instance that was never shut down leaves
+// nothing behind for a later instance at the same address
+class ChucKInstance : public ChucK {
+public:
+    ~ChucKInstance() override { remove_render_lock(this); }
+};
+static_assert(sizeof(ChucKInstance) == sizeof(ChucK),
+              "ChucKInstance is constructed in storage sized for ChucK");
+
+// Helper: Run the VM for one block and refresh its meters
+static void run_vm(ChucK& chuck, const SAMPLE* input, SAMPLE* output, t_CKINT num_frames) {
+    chuck.run(input, output, num_frames);
+    update_meters(&chuck);
+}
+
+// Helpers: Channel counts of an initialized VM, which fix the size of every
+// block ChucK::run() reads and writes. Read straight from the VM rather than
+// through getParamInt(), which parses the parameter's string value each call.
+static t_CKINT vm_input_channels(ChucK& chuck) {
+    return static_cast<t_CKINT>(chuck.vm()->m_num_adc_channels);
+}
+
+static t_CKINT vm_output_channels(ChucK& chuck) {
+    return static_cast<t_CKINT>(chuck.vm()->m_num_dac_channels);
+}
+
+// Helper: Look up the callbacks for fired events under one lock (GIL held)
+static std::vector<nb::callable> lookup_event_callbacks(const std::vector<t_CKINT>& ids);
+
+// Event callbacks fired while a render call runs the VM with the GIL
+// released are queued here and called once the VM has returned
+static thread_local std::vector<t_CKINT> g_fired_events;
+static thread_local bool g_defer_events = false;
+
+// RAII guard: queue event callbacks fired on this thread while it lives
+class EventDeferral {
+    bool m_previous;
+public:
+    EventDeferral() : m_previous(g_defer_events) { g_defer_events = true; }
+    ~EventDeferral() { g_defer_events = m_previous; }
+    EventDeferral(const EventDeferral&) = delete;
+    EventDeferral& operator=(const EventDeferral&) = delete;
+};
+
+// Helper: Call the event callbacks queued by the last render (GIL held)
+static void dispatch_fired_events() {
+    if (g_fired_events.empty()) {
+        return;
+    }
+    std::vector<t_CKINT> fired;
+    fired.swap(g_fired_events);
+    for (nb::callable& callback : lookup_event_callbacks(fired)) {
+        callback();
+    }
+}
+
+// Lock-free single-producer single-consumer queue of event callback ids
+class EventQueue {
+    std::vector<t_CKINT> m_ids;
+    size_t m_mask;
+    std::atomic<size_t> m_head{0};  // total ids pushed (producer)
+    std::atomic<size_t> m_tail{0};  // total ids popped (consumer)
+
+public:
+    // capacity must be a power of two
+    explicit EventQueue(size_t capacity) : m_ids(capacity), m_mask(capacity - 1) {}
+
+    // Producer side: returns false (dropping the id) if the queue is full
+    bool push(t_CKINT id) {
+        size_t head = m_head.load(std::memory_order_relaxed);
+        if (head - m_tail.load(std::memory_order_acquire) > m_mask) {
+            return false;
+        }
+        m_ids[head & m_mask] = id;
+        m_head.store(head + 1, std::memory_order_release);
+        return true;
+    }
+
+    // Consumer side: returns false if the queue is empty
+    bool pop(t_CKINT& id) {
+        size_t tail = m_tail.load(std::memory_order_relaxed);
+        if (tail == m_head.load(std::memory_order_acquire)) {
+            return false;
+        }
+        id = m_ids[tail & m_mask];
+        m_tail.store(tail + 1, std::memory_order_release);
+        return true;
+    }
+};
+
+// Calls event callbacks fired on the real-time audio thread from a
+// separate thread, so the audio callback never waits for the GIL. The
+// audio thread only pushes ids onto a lock-free queue; the dispatcher
+// drains everything pending and calls it under a single GIL acquisition.
+class EventDispatcher {
+    EventQueue m_queue{1024};
+    std::thread m_thread;
+    std::atomic<bool> m_running{false};
+
+    void loop() {
+        std::vector<t_CKINT> fired;
+        fired.reserve(1024);
+        while (m_running.load(std::memory_order_acquire)) {
+            fired.clear();
+            t_CKINT callback_id;
+            while (m_queue.pop(callback_id)) {
+                fired.push_back(callback_id);
+            }
+            if (fired.empty()) {
+                std::this_thread::sleep_for(std::chrono::milliseconds(1));
+                continue;
+            }
+            nb::gil_scoped_acquire acquire;
+            for (nb::callable& callback : lookup_event_callbacks(fired)) {
+                try {
+                    callback();
+                } catch (nb::python_error& e) {
+                    e.discard_as_unraisable("numchuck event callback");
+                }
+            }
+        }
+    }
+
+public:
+    ~EventDispatcher() { stop(); }
+
+    // Audio thread: queue a fired event (dropped if the dispatcher is behind)
+    void push(t_CKINT callback_id) { m_queue.push(callback_id); }
+
+    void start() {
+        if (!m_running.exchange(true)) {
+            m_thread = std::thread(&EventDispatcher::loop, this);
+        }
+    }
+
+    // Must be called without the GIL: the thread may be waiting for it
+    void stop() {
+        if (m_running.exchange(false) && m_thread.joinable()) {
+            m_thread.join();
+        }
+    }
+};
+
+static EventDispatcher g_event_dispatcher;
+
+// True on the real-time audio thread (set by audio_callback_func)
+static thread_local bool g_on_audio_thread = false;
+
 // Audio callback function - uses userData to get ChucK instance
 static void audio_callback_func(SAMPLE* input, SAMPLE* output, t_CKUINT numFrames,
                                 t_CKUINT numInChans, t_CKUINT numOutChans, void* userData) {
     ChucK* chuck = static_cast<ChucK*>(userData);
     if (chuck) {
+        g_on_audio_thread = true;
         // Set current ChucK instance for output callbacks
         g_current_chuck = chuck;
-        chuck->run(input, output, numFrames);
+        run_vm(*chuck, input, output, numFrames);
         g_current_chuck = nullptr;
     }
 }
@@ -45,9 +369,10 @@ class AudioContext {
 private:
     bool m_initialized;
     bool m_started;
+    ChucK* m_chuck;
 
 public:
-    AudioContext() : m_initialized(false), m_started(false) {}
+    AudioContext() : m_initialized(false), m_started(false), m_chuck(nullptr) {}
 
     ~AudioContext() {
         cleanup();
@@ -71,6 +396,7 @@ public:
             sample_rate, buffer_size, num_buffers, audio_callback_func,
             chuck, false, nullptr
         );
+        m_chuck = m_initialized ? chuck : nullptr;
 
         return m_initialized;
     }
@@ -80,7 +406,9 @@ public:
             return false;
         }
         m_started = ChuckAudio::start();
-        if (!m_started) {
+        if (m_started) {
+            g_event_dispatcher.start();
+        } else {
             cleanup();
         }
         return m_started;
@@ -89,6 +417,7 @@ public:
     void stop() {
         if (m_started) {
             ChuckAudio::stop();
+            g_event_dispatcher.stop();
             m_started = false;
         }
     }
@@ -96,6 +425,7 @@ public:
     void cleanup(t_CKUINT msWait = 0) {
         if (m_started) {
             ChuckAudio::stop();
+            g_event_dispatcher.stop();
 #ifdef _WIN32
             // Windows audio threads (WASAPI/DirectSound) need time to cleanly exit
             // after stop() before we can safely shutdown and release resources
@@ -115,6 +445,8 @@ public:
 
     bool is_initialized() const { return m_initialized; }
     bool is_started() const { return m_started; }
+    // True while the audio thread is running this instance's VM
+    bool drives(const ChucK* chuck) const { return m_started && m_chuck == chuck; }
 };
 
 // Global audio context with mutex protection
@@ -178,38 +510,42 @@ static void cleanup_instance_callbacks(ChucK* chuck) {
     }
 }
 
-// Global variable callback wrappers
+// Global variable callback wrappers.
+// These run on whichever thread drives the VM (the audio
+// thread, or a render() caller that released the GIL). They hold the GIL
+// for their whole body, since copying and dropping the stored callable
+// touches its reference count.
 static void cb_get_int_wrapper(t_CKINT callback_id, t_CKINT value) {
+    nb::gil_scoped_acquire acquire;
     nb::callable callback = get_callback(callback_id);
     if (callback.is_valid()) {
-        nb::gil_scoped_acquire acquire;
         callback(value);
     }
     remove_callback(callback_id);
 }
 
 static void cb_get_float_wrapper(t_CKINT callback_id, t_CKFLOAT value) {
+    nb::gil_scoped_acquire acquire;
     nb::callable callback = get_callback(callback_id);
     if (callback.is_valid()) {
-        nb::gil_scoped_acquire acquire;
         callback(value);
     }
     remove_callback(callback_id);
 }
 
 static void cb_get_string_wrapper(t_CKINT callback_id, const char* value) {
+    nb::gil_scoped_acquire acquire;
     nb::callable callback = get_callback(callback_id);
     if (callback.is_valid()) {
-        nb::gil_scoped_acquire acquire;
         callback(std::string(value));
     }
     remove_callback(callback_id);
 }
 
 static void cb_get_int_array_wrapper(t_CKINT callback_id, t_CKINT array[], t_CKUINT size) {
+    nb::gil_scoped_acquire acquire;
     nb::callable callback = get_callback(callback_id);
     if (callback.is_valid()) {
-        nb::gil_scoped_acquire acquire;
         std::vector<t_CKINT> vec(array, array + size);
         callback(vec);
     }
@@ -217,21 +553,42 @@ static void cb_get_int_array_wrapper(t_CKINT callback_id, t_CKINT array[], t_CKU
 }
 
 static void cb_get_float_array_wrapper(t_CKINT callback_id, t_CKFLOAT array[], t_CKUINT size) {
+    nb::gil_scoped_acquire acquire;
     nb::callable callback = get_callback(callback_id);
     if (callback.is_valid()) {
-        nb::gil_scoped_acquire acquire;
         std::vector<t_CKFLOAT> vec(array, array + size);
         callback(vec);
     }
     remove_callback(callback_id);
 }
 
-// Event listener callback wrapper (persistent callbacks)
+static std::vector<nb::callable> lookup_event_callbacks(const std::vector<t_CKINT>& ids) {
+    std::vector<nb::callable> callbacks;
+    callbacks.reserve(ids.size());
+    std::lock_guard<std::mutex> lock(g_callback_mutex);
+    for (t_CKINT id : ids) {
+        auto it = g_callbacks.find(static_cast<int>(id));
+        if (it != g_callbacks.end()) {
+            callbacks.push_back(it->second);
+        }
+    }
+    return callbacks;
+}
+
+// Event listener callback wrapper (persistent callbacks). Events fired by
+// the VM during a render or on the audio thread are queued rather than
+// calling into Python from inside the VM.
 static void cb_event_wrapper(t_CKINT callback_id) {
-    nb::callable callback = get_callback(callback_id);
-    if (callback.is_valid()) {
+    if (g_on_audio_thread) {
+        g_event_dispatcher.push(callback_id);
+    } else if (g_defer_events) {
+        g_fired_events.push_back(callback_id);
+    } else {
         nb::gil_scoped_acquire acquire;
-        callback();
+        nb::callable callback = get_callback(callback_id);
+        if (callback.is_valid()) {
+            callback();
+        }
     }
     // Note: Don't remove callback for events - they're persistent
 }
@@ -251,9 +608,9 @@ static void cb_chout_wrapper(const char* msg) {
     }
 
     if (callback_id > 0) {
+        nb::gil_scoped_acquire acquire;
         nb::callable callback = get_callback(callback_id);
         if (callback.is_valid()) {
-            nb::gil_scoped_acquire acquire;
             callback(msg);
         }
     }
@@ -274,9 +631,9 @@ static void cb_cherr_wrapper(const char* msg) {
     }
 
     if (callback_id > 0) {
+        nb::gil_scoped_acquire acquire;
         nb::callable callback = get_callback(callback_id);
         if (callback.is_valid()) {
-            nb::gil_scoped_acquire acquire;
             callback(msg);
         }
     }
@@ -296,6 +653,187 @@ public:
     ChuckContextGuard& operator=(const ChuckContextGuard&) = delete;
 };
 
+// Scoped direct access to an instance's globals. Holds the instance's
+// render lock, so no render on another thread runs the VM meanwhile (the
+// GIL is released while waiting for one to finish), then applies queued
+// global messages so globals can be read directly, just as at the start of
+// a VM tick. globals() is nullptr while real-time audio owns the VM: its
+// audio thread takes no render lock and is the queue's only consumer.
+class GlobalsAccess {
+    std::shared_ptr<std::recursive_mutex> m_mutex;
+    std::unique_lock<std::recursive_mutex> m_lock;
+    Chuck_Globals_Manager* m_globals = nullptr;
+
+public:
+    explicit GlobalsAccess(ChucK& self) {
+        if (!self.isInit()) {
+            throw std::runtime_error("ChucK instance not initialized. Call init() first.");
+        }
+        if (g_audio_context && g_audio_context->drives(&self)) {
+            return;
+        }
+        m_mutex = render_lock(self);
+        m_lock = std::unique_lock<std::recursive_mutex>(*m_mutex, std::try_to_lock);
+        if (!m_lock.owns_lock()) {
+            // A render holds the lock; it may need the GIL for a callback
+            nb::gil_scoped_release release;
+            m_lock.lock();
+        }
+        // globals() is null until the VM is started, which run() otherwise
+        // does on the first block
+        self.start();
+        m_globals = self.globals();
+        ChuckContextGuard guard(&self);
+        m_globals->handle_global_queue_messages();
+    }
+
+    GlobalsAccess(const GlobalsAccess&) = delete;
+    GlobalsAccess& operator=(const GlobalsAccess&) = delete;
+
+    Chuck_Globals_Manager* globals() const { return m_globals; }
+};
+
+// Helper: Globals manager to queue a request on. globals() is null until
+// the VM is started, so start it (under the render lock) first if needed.
+// Queuing itself needs no lock: the request queue is single-producer
+// single-consumer, and the GIL serializes Python callers.
+static Chuck_Globals_Manager* queue_globals(ChucK& self) {
+    if (!self.globals()) {
+        GlobalsAccess access(self);
+    }
+    return self.globals();
+}
+
+// Bumped whenever an instance shuts down, invalidating resolved handles
+static std::atomic<size_t> g_globals_generation{1};
+
+// Pre-resolved handle to a global int or float. Reads and writes go
+// through a pointer into the globals manager instead of a by-name lookup
+// (and, for writes, a queued request) on every call.
+class GlobalHandle {
+    ChucK* m_chuck;
+    std::string m_name;
+    bool m_is_float;
+    void* m_ptr = nullptr;
+    size_t m_generation = 0;
+
+public:
+    GlobalHandle(ChucK* chuck, const std::string& name, bool is_float)
+        : m_chuck(chuck), m_name(name), m_is_float(is_float) {}
+
+    const std::string& name() const { return m_name; }
+    bool is_float() const { return m_is_float; }
+
+    // Pointer to the global, re-resolved after any shutdown (the old
+    // globals may be gone); nullptr while real-time audio runs the VM.
+    // Only valid while the caller's GlobalsAccess is held.
+    void* resolve(const GlobalsAccess& access) {
+        Chuck_Globals_Manager* globals = access.globals();
+        if (!globals) {
+            return nullptr;
+        }
+        size_t generation = g_globals_generation.load(std::memory_order_relaxed);
+        if (!m_ptr || m_generation != generation) {
+            // get_global_*_value() creates the global if it does not exist yet
+            if (m_is_float) {
+                globals->get_global_float_value(m_name);
+                m_ptr = globals->get_ptr_to_global_float(m_name);
+            } else {
+                globals->get_global_int_value(m_name);
+                m_ptr = globals->get_ptr_to_global_int(m_name);
+            }
+            m_generation = generation;
+        }
+        return m_ptr;
+    }
+
+    // Reads and writes hold the instance's render lock, so they never race
+    // a render on another thread
+    nb::object get() {
+        GlobalsAccess access(*m_chuck);
+        void* ptr = resolve(access);
+        if (!ptr) {
+            return nb::none();
+        }
+        if (m_is_float) {
+            return nb::float_(*static_cast<t_CKFLOAT*>(ptr));
+        }
+        return nb::int_(*static_cast<t_CKINT*>(ptr));
+    }
+
+    void set(nb::handle value) {
+        // Values are converted before the lock is taken
+        if (m_is_float) {
+            t_CKFLOAT v = nb::cast<t_CKFLOAT>(value);
+            GlobalsAccess access(*m_chuck);
+            if (void* ptr = resolve(access)) {
+                *static_cast<t_CKFLOAT*>(ptr) = v;
+            } else {
+                // Real-time audio owns the VM: queue the write for its next block
+                m_chuck->globals()->setGlobalFloat(m_name.c_str(), v);
+            }
+        } else {
+            t_CKINT v = nb::cast<t_CKINT>(value);
+            GlobalsAccess access(*m_chuck);
+            if (void* ptr = resolve(access)) {
+                *static_cast<t_CKINT*>(ptr) = v;
+            } else {
+                m_chuck->globals()->setGlobalInt(m_name.c_str(), v);
+            }
+        }
+    }
+};
+
+// Program compiled by compile_to_code(), holding a reference to its VM code
+// so it can be sporked again without re-running the compiler. References
+// are dropped when the instance shuts down.
+class CompiledCode {
+    ChucK* m_chuck;
+    Chuck_VM_Code* m_code;
+
+public:
+    CompiledCode(ChucK* chuck, Chuck_VM_Code* code);
+    ~CompiledCode();
+
+    CompiledCode(const CompiledCode&) = delete;
+    CompiledCode& operator=(const CompiledCode&) = delete;
+
+    ChucK* chuck() const { return m_chuck; }
+    Chuck_VM_Code* code() const { return m_code; }
+    void invalidate() { CK_SAFE_RELEASE(m_code); }
+};
+
+// Live compiled programs per instance (only touched with the GIL held)
+static std::unordered_map<const ChucK*, std::vector<CompiledCode*>> g_compiled;
+
+CompiledCode::CompiledCode(ChucK* chuck, Chuck_VM_Code* code) : m_chuck(chuck), m_code(code) {
+    m_code->add_ref();
+    g_compiled[chuck].push_back(this);
+}
+
+CompiledCode::~CompiledCode() {
+    auto it = g_compiled.find(m_chuck);
+    if (it != g_compiled.end()) {
+        auto& programs = it->second;
+        programs.erase(std::remove(programs.begin(), programs.end(), this), programs.end());
+        if (programs.empty()) {
+            g_compiled.erase(it);
+        }
+    }
+    invalidate();
+}
+
+// Helper: Drop an instance's compiled programs (before its VM goes away)
+static void invalidate_instance_code(const ChucK* chuck) {
+    auto it = g_compiled.find(chuck);
+    if (it != g_compiled.end()) {
+        for (CompiledCode* program : it->second) {
+            program->invalidate();
+        }
+        g_compiled.erase(it);
+    }
+}
+
 // Helper function to validate numpy array for audio processing
 template<typename T>
 static void validate_audio_buffer(const T& array, const char* name,
@@ -318,6 +856,249 @@ static void validate_audio_buffer(const T& array, const char* name,
     // Output arrays use ndarray<SAMPLE, ..., nb::c_contig> (writable, contiguous)
 }
 
+// Array types for audio buffers exchanged with the VM
+using InputArray = nb::ndarray<const SAMPLE, nb::ndim<1>, nb::device::cpu, nb::c_contig>;
+using OutputArray = nb::ndarray<SAMPLE, nb::ndim<1>, nb::device::cpu, nb::c_contig>;
+using NumpyArray = nb::ndarray<nb::numpy, SAMPLE, nb::ndim<1>, nb::c_contig>;
+using Int16OutputArray = nb::ndarray<int16_t, nb::ndim<1>, nb::device::cpu, nb::c_contig>;
+using NumpyInt16Array = nb::ndarray<nb::numpy, int16_t, nb::ndim<1>, nb::c_contig>;
+using PlanarArray = nb::ndarray<SAMPLE, nb::ndim<2>, nb::device::cpu, nb::c_contig>;
+using PlanarInputArray = nb::ndarray<const SAMPLE, nb::ndim<2>, nb::device::cpu, nb::c_contig>;
+
+// Helpers: convert between interleaved frames and planar [channel][frame]
+// blocks. Mono is a plain copy and stereo uses the 4-wide kernels above with
+// a scalar tail; the generic loop is unit-stride on the planar side so the
+// compiler can vectorize it.
+NUMCHUCK_SIMD_CLONES
+static void deinterleave_block(const SAMPLE* src, SAMPLE* dst,
+                               size_t channels, size_t frames) {
+    if (channels == 1) {
+        std::memcpy(dst, src, frames * sizeof(SAMPLE));
+    } else if (channels == 2) {
+        SAMPLE* left = dst;
+        SAMPLE* right = dst + frames;
+        size_t i = 0;
+#if defined(NUMCHUCK_SSE2)
+        for (; i + 4 <= frames; i += 4) {
+            __m128 a = _mm_loadu_ps(src + 2 * i);      // l0 r0 l1 r1
+            __m128 b = _mm_loadu_ps(src + 2 * i + 4);  // l2 r2 l3 r3
+            _mm_storeu_ps(left + i, _mm_shuffle_ps(a, b, _MM_SHUFFLE(2, 0, 2, 0)));
+            _mm_storeu_ps(right + i, _mm_shuffle_ps(a, b, _MM_SHUFFLE(3, 1, 3, 1)));
+        }
+#elif defined(NUMCHUCK_NEON)
+        for (; i + 4 <= frames; i += 4) {
+            float32x4x2_t lr = vld2q_f32(src + 2 * i);
+            vst1q_f32(left + i, lr.val[0]);
+            vst1q_f32(right + i, lr.val[1]);
+        }
+#endif
+        for (; i < frames; ++i) {
+            left[i] = src[2 * i];
+            right[i] = src[2 * i + 1];
+        }
+    } else {
+        for (size_t c = 0; c < channels; ++c) {
+            SAMPLE* plane = dst + c * frames;
+            for (size_t i = 0; i < frames; ++i) {
+                plane[i] = src[i * channels + c];
+            }
+        }
+    }
+}
+
+NUMCHUCK_SIMD_CLONES
+static void interleave_block(const SAMPLE* src, SAMPLE* dst,
+                             size_t channels, size_t frames) {
+    if (channels == 1) {
+        std::memcpy(dst, src, frames * sizeof(SAMPLE));
+    } else if (channels == 2) {
+        const SAMPLE* left = src;
+        const SAMPLE* right = src + frames;
+        size_t i = 0;
+#if defined(NUMCHUCK_SSE2)
+        for (; i + 4 <= frames; i += 4) {
+            __m128 l = _mm_loadu_ps(left + i);
+            __m128 r = _mm_loadu_ps(right + i);
+            _mm_storeu_ps(dst + 2 * i, _mm_unpacklo_ps(l, r));      // l0 r0 l1 r1
+            _mm_storeu_ps(dst + 2 * i + 4, _mm_unpackhi_ps(l, r));  // l2 r2 l3 r3
+        }
+#elif defined(NUMCHUCK_NEON)
+        for (; i + 4 <= frames; i += 4) {
+            float32x4x2_t lr = {{vld1q_f32(left + i), vld1q_f32(right + i)}};
+            vst2q_f32(dst + 2 * i, lr);
+        }
+#endif
+        for (; i < frames; ++i) {
+            dst[2 * i] = left[i];
+            dst[2 * i + 1] = right[i];
+        }
+    } else {
+        for (size_t c = 0; c < channels; ++c) {
+            const SAMPLE* plane = src + c * frames;
+            for (size_t i = 0; i < frames; ++i) {
+                dst[i * channels + c] = plane[i];
+            }
+        }
+    }
+}
+
+// Helper: Check an interleaved buffer holds exactly the frames of a planar one
+template<typename T>
+static void validate_interleaved(const T& interleaved, size_t channels, size_t frames) {
+    if (interleaved.size() != channels * frames) {
+        std::ostringstream oss;
+        oss << "interleaved size mismatch: expected " << channels * frames
+            << " elements for " << channels << " x " << frames << " planes, got "
+            << interleaved.size();
+        throw std::invalid_argument(oss.str());
+    }
+}
+
+// Zeroed input for render() calls that don't supply one.
+// The VM only reads its input, so one buffer (grown as needed) serves all
+// instances rendered on a thread. It is per thread because render() runs
+// the VM with the GIL released.
+static thread_local std::vector<SAMPLE> g_silent_input;
+
+// Stand-in for input_channels == 0, so the common no-input configuration
+// never touches the shared buffer (and never hands the VM a null pointer)
+static const SAMPLE g_no_input[1] = {0};
+
+static const SAMPLE* silent_input(size_t num_samples) {
+    if (num_samples == 0) {
+        return g_no_input;
+    }
+    if (g_silent_input.size() < num_samples) {
+        g_silent_input.assign(num_samples, 0);
+    }
+    return g_silent_input.data();
+}
+
+// Single-producer single-consumer ring of interleaved audio frames.
+// One thread writes and one thread reads: each index is only advanced by
+// its own side and published with release/acquire ordering, so neither side
+// locks or allocates. Capacity is rounded up to a power of two so wrapping
+// is a mask.
+class AudioRing {
+    std::vector<SAMPLE> m_buffer;
+    size_t m_channels;
+    size_t m_mask;
+    std::atomic<size_t> m_head{0};  // total frames written (producer)
+    std::atomic<size_t> m_tail{0};  // total frames read (consumer)
+
+    void copy_in(size_t start, const SAMPLE* src, size_t frames) {
+        size_t first = std::min(frames, capacity() - start);
+        std::memcpy(&m_buffer[start * m_channels], src,
+                    first * m_channels * sizeof(SAMPLE));
+        std::memcpy(m_buffer.data(), src + first * m_channels,
+                    (frames - first) * m_channels * sizeof(SAMPLE));
+    }
+
+    void copy_out(size_t start, SAMPLE* dst, size_t frames) const {
+        size_t first = std::min(frames, capacity() - start);
+        std::memcpy(dst, &m_buffer[start * m_channels],
+                    first * m_channels * sizeof(SAMPLE));
+        std::memcpy(dst + first * m_channels, m_buffer.data(),
+                    (frames - first) * m_channels * sizeof(SAMPLE));
+    }
+
+public:
+    AudioRing(size_t capacity_frames, size_t channels) : m_channels(channels) {
+        if (capacity_frames == 0) {
+            throw std::invalid_argument("capacity_frames must be positive");
+        }
+        if (channels == 0) {
+            throw std::invalid_argument("channels must be positive");
+        }
+        size_t capacity = 1;
+        while (capacity < capacity_frames) {
+            capacity <<= 1;
+        }
+        m_buffer.assign(capacity * channels, 0);
+        m_mask = capacity - 1;
+    }
+
+    AudioRing(const AudioRing&) = delete;
+    AudioRing& operator=(const AudioRing&) = delete;
+
+    size_t capacity() const { return m_mask + 1; }
+    size_t channels() const { return m_channels; }
+    size_t readable() const {
+        return m_head.load(std::memory_order_acquire) - m_tail.load(std::memory_order_acquire);
+    }
+    size_t writable() const { return capacity() - readable(); }
+
+    // Producer side: copy up to `frames` frames in, returning how many fit
+    size_t write(const SAMPLE* src, size_t frames) {
+        size_t head = m_head.load(std::memory_order_relaxed);
+        size_t tail = m_tail.load(std::memory_order_acquire);
+        size_t count = std::min(frames, capacity() - (head - tail));
+        copy_in(head & m_mask, src, count);
+        m_head.store(head + count, std::memory_order_release);
+        return count;
+    }
+
+    // Consumer side: copy up to `frames` frames out, returning how many were available
+    size_t read(SAMPLE* dst, size_t frames) {
+        size_t tail = m_tail.load(std::memory_order_relaxed);
+        size_t head = m_head.load(std::memory_order_acquire);
+        size_t count = std::min(frames, head - tail);
+        copy_out(tail & m_mask, dst, count);
+        m_tail.store(tail + count, std::memory_order_release);
+        return count;
+    }
+};
+
+// Helper: Frame count of an interleaved buffer for `ring`
+template<typename T>
+static size_t ring_frames(const AudioRing& ring, const T& array, const char* name) {
+    if (array.size() % ring.channels() != 0) {
+        std::ostringstream oss;
+        oss << name << " size " << array.size() << " is not a multiple of "
+            << ring.channels() << " channels";
+        throw std::invalid_argument(oss.str());
+    }
+    return array.size() / ring.channels();
+}
+
+// Interleaved scratch blocks for render_ring() and render_planar(), grown
+// as needed (per thread, like the silent input, since the VM runs with the
+// GIL released)
+static thread_local std::vector<SAMPLE> g_scratch_input;
+static thread_local std::vector<SAMPLE> g_scratch_output;
+
+// Helper: Input samples for a render call: the caller's buffer (held in
+// `holder` for the duration of the call), or shared silence for None
+static const SAMPLE* resolve_input(nb::handle input, InputArray& holder, size_t expected_size) {
+    if (input.is_none()) {
+        return silent_input(expected_size);
+    }
+    if (!nb::try_cast(input, holder, false)) {
+        throw nb::type_error("input must be a C-contiguous, 1-dimensional float32 array");
+    }
+    validate_audio_buffer(holder, "input", expected_size);
+    return holder.data();
+}
+
+// Helper: Convert samples to 16-bit PCM, saturating at full scale. Written
+// without branches or libm calls so the compiler can vectorize it.
+NUMCHUCK_SIMD_CLONES
+static void quantize_int16(const SAMPLE* src, int16_t* dst, size_t num_samples) {
+    for (size_t i = 0; i < num_samples; ++i) {
+        float value = src[i] * 32767.0f;
+        value = std::min(std::max(value, -32768.0f), 32767.0f);
+        dst[i] = static_cast<int16_t>(value < 0.0f ? value - 0.5f : value + 0.5f);
+    }
+}
+
+// Helper: Grow a scratch block to hold num_samples and return it (never null)
+static SAMPLE* scratch(std::vector<SAMPLE>& block, size_t num_samples) {
+    if (block.size() < std::max<size_t>(num_samples, 1)) {
+        block.resize(std::max<size_t>(num_samples, 1));
+    }
+    return block.data();
+}
+
 NB_MODULE(_numchuck, m) {
     m.doc() = "Python bindings for ChucK audio programming language";
 
@@ -359,8 +1140,61 @@ NB_MODULE(_numchuck, m) {
     m.attr("PARAM_WORKING_DIRECTORY") = CHUCK_PARAM_WORKING_DIRECTORY;
 
     // Main ChucK class
+    nb::class_<GlobalMeter>(m, "GlobalMeter",
+        "Lock-free meter tracking a ChucK global int or float")
+        .def_prop_ro("name", &GlobalMeter::name, "Name of the tracked global")
+        .def_prop_ro("value",
+            [](const GlobalMeter& self) -> nb::object {
+                if (self.is_float()) {
+                    return nb::float_(self.float_value());
+                }
+                return nb::int_(self.int_value());
+            },
+            "Value of the global as of the last rendered block");
+
+    nb::class_<CompiledCode>(m, "CompiledCode",
+        "ChucK program compiled by ChucK.compile_to_code(), ready to spork")
+        .def_prop_ro("valid", [](const CompiledCode& self) { return self.code() != nullptr; },
+            "False once the owning instance has shut down");
+
+    nb::class_<GlobalHandle>(m, "GlobalHandle",
+        "Pre-resolved handle to a ChucK global int or float")
+        .def_prop_ro("name", &GlobalHandle::name, "Name of the global")
+        .def_prop_rw("value", &GlobalHandle::get, &GlobalHandle::set,
+            "Current value of the global (None during real-time audio); "
+            "writes take effect immediately, or are queued during real-time audio");
+
+    nb::class_<AudioRing>(m, "AudioRing",
+        "Lock-free single-producer single-consumer ring of interleaved audio frames")
+        .def(nb::init<size_t, size_t>(), "capacity_frames"_a, "channels"_a,
+            "Create a ring holding at least capacity_frames frames (rounded up to a power of two)")
+        .def("write",
+            [](AudioRing& self, InputArray samples) {
+                size_t frames = ring_frames(self, samples, "samples");
+                const SAMPLE* src = samples.data();
+                nb::gil_scoped_release release;
+                return self.write(src, frames);
+            },
+            "samples"_a,
+            "Write interleaved frames (producer side); returns the number of frames that fit")
+        .def("read",
+            [](AudioRing& self, OutputArray out) {
+                size_t frames = ring_frames(self, out, "out");
+                SAMPLE* dst = out.data();
+                nb::gil_scoped_release release;
+                return self.read(dst, frames);
+            },
+            "out"_a,
+            "Read interleaved frames into out (consumer side); returns the number of frames read")
+        .def_prop_ro("capacity", &AudioRing::capacity, "Capacity in frames")
+        .def_prop_ro("channels", &AudioRing::channels, "Number of interleaved channels")
+        .def_prop_ro("readable", &AudioRing::readable, "Frames available to read")
+        .def_prop_ro("writable", &AudioRing::writable, "Frames of free space to write");
+
     nb::class_<ChucK>(m, "ChucK", "ChucK virtual machine and compiler")
-        .def(nb::init<>(), "Create a new ChucK instance")
+        .def("__init__",
+            [](ChucK* self) { new (self) ChucKInstance(); },
+            "Create a new ChucK instance")
 
         // Parameter methods
         .def("set_param",
@@ -379,6 +1213,33 @@ NB_MODULE(_numchuck, m) {
             nb::overload_cast<const std::string&, const std::list<std::string>&>(&ChucK::setParam),
             "name"_a, "value"_a,
             "Set a string list parameter")
+        .def("set_params",
+            [](ChucK& self, nb::dict params) {
+                // One crossing for the whole dict; the values' Python types
+                // pick the setParam overload
+                bool all_set = true;
+                for (auto [key, value] : params) {
+                    std::string name = nb::cast<std::string>(key);
+                    if (nb::isinstance<nb::bool_>(value)) {
+                        all_set &= self.setParam(name, (t_CKINT)(value.ptr() == Py_True)) != 0;
+                    } else if (nb::isinstance<nb::int_>(value)) {
+                        all_set &= self.setParam(name, nb::cast<t_CKINT>(value)) != 0;
+                    } else if (nb::isinstance<nb::float_>(value)) {
+                        all_set &= self.setParamFloat(name, nb::cast<t_CKFLOAT>(value)) != 0;
+                    } else if (nb::isinstance<nb::str>(value)) {
+                        all_set &= self.setParam(name, nb::cast<std::string>(value)) != 0;
+                    } else if (nb::isinstance<nb::list>(value) || nb::isinstance<nb::tuple>(value)) {
+                        all_set &= self.setParam(name, nb::cast<std::list<std::string>>(value)) != 0;
+                    } else {
+                        throw nb::type_error(
+                            ("Unsupported value type for parameter '" + name + "'").c_str());
+                    }
+                }
+                return all_set;
+            },
+            "params"_a,
+            "Set several parameters from a {name: value} dict in one call.\n"
+            "Returns True if ChucK accepted every parameter.")
         .def("get_param_int",
             &ChucK::getParamInt,
             "name"_a,
@@ -445,6 +1306,47 @@ NB_MODULE(_numchuck, m) {
             },
             "code"_a, "args"_a = "", "count"_a = 1, "immediate"_a = false, "filepath"_a = "",
             "Compile ChucK code and return (success, shred_ids)")
+        .def("compile_to_code",
+            [](ChucK& self, const std::string& code) -> CompiledCode* {
+                if (code.empty()) {
+                    throw std::invalid_argument("Code cannot be empty");
+                }
+                if (!self.isInit()) {
+                    throw std::runtime_error("ChucK instance not initialized. Call init() first.");
+                }
+
+                // The front half of ChucK::compileCode(), without sporking
+                ChuckContextGuard guard(&self);
+                Chuck_Compiler* compiler = self.compiler();
+                compiler->m_originHint = ckte_origin_USERDEFINED;
+                t_CKBOOL ok = compiler->compileCode(code);
+                compiler->m_originHint = ckte_origin_UNKNOWN;
+                if (!ok) {
+                    return nullptr;
+                }
+                Chuck_VM_Code* vm_code = compiler->output();
+                vm_code->name = CHUCK_CODE_LITERAL_SIGNIFIER;
+                return new CompiledCode(&self, vm_code);
+            },
+            "code"_a, nb::rv_policy::take_ownership, nb::keep_alive<0, 1>(),
+            "Compile ChucK code without running it; returns None on error")
+        .def("spork_code",
+            [](ChucK& self, const CompiledCode& program, t_CKUINT count, bool immediate) {
+                if (count == 0) {
+                    throw std::invalid_argument("Count must be at least 1");
+                }
+                if (program.chuck() != &self || !program.code()) {
+                    throw std::runtime_error("Compiled code belongs to another or a shut down instance");
+                }
+                std::vector<t_CKUINT> shred_ids;
+                for (t_CKUINT i = 0; i < count; ++i) {
+                    Chuck_VM_Shred* shred = self.vm()->spork(program.code(), nullptr, immediate);
+                    shred_ids.push_back(shred->xid);
+                }
+                return shred_ids;
+            },
+            "program"_a, "count"_a = 1, "immediate"_a = false,
+            "Spork shreds from code compiled by compile_to_code() and return their IDs")
 
         // Audio processing method with validation
         .def("run",
@@ -454,13 +1356,14 @@ NB_MODULE(_numchuck, m) {
                 if (!self.isInit()) {
                     throw std::runtime_error("ChucK instance not initialized. Call init() first.");
                 }
+                check_not_rendering();
                 if (num_frames <= 0) {
                     throw std::invalid_argument("num_frames must be positive");
                 }
 
-                // Get channel counts from ChucK parameters
-                t_CKINT num_in_channels = self.getParamInt(CHUCK_PARAM_INPUT_CHANNELS);
-                t_CKINT num_out_channels = self.getParamInt(CHUCK_PARAM_OUTPUT_CHANNELS);
+                // Get channel counts from the VM
+                t_CKINT num_in_channels = vm_input_channels(self);
+                t_CKINT num_out_channels = vm_output_channels(self);
 
                 // Validate buffer sizes
                 size_t expected_input_size = num_frames * num_in_channels;
@@ -470,10 +1373,267 @@ NB_MODULE(_numchuck, m) {
                 validate_audio_buffer(output, "output", expected_output_size);
 
                 ChuckContextGuard guard(&self);
-                self.run(input.data(), output.data(), num_frames);
+                {
+                    EventDeferral defer;
+                    nb::gil_scoped_release release;
+                    RenderGuard guard(self);
+                    run_vm(self, input.data(), output.data(), num_frames);
+                }
+                dispatch_fired_events();
             },
             "input"_a, "output"_a, "num_frames"_a,
             "Run ChucK audio processing for num_frames")
+        .def("render",
+            [](ChucK& self, t_CKINT num_frames, nb::handle output, nb::handle input) {
+                if (!self.isInit()) {
+                    throw std::runtime_error("ChucK instance not initialized. Call init() first.");
+                }
+                check_not_rendering();
+                if (num_frames <= 0) {
+                    throw std::invalid_argument("num_frames must be positive");
+                }
+
+                t_CKINT num_in_channels = vm_input_channels(self);
+                t_CKINT num_out_channels = vm_output_channels(self);
+                size_t expected_input_size = num_frames * num_in_channels;
+                size_t expected_output_size = num_frames * num_out_channels;
+
+                // Input: caller's buffer, or shared silence
+                InputArray in_array;
+                const SAMPLE* in_ptr = resolve_input(input, in_array, expected_input_size);
+
+                // Output: caller's buffer (returned as-is), or a new array.
+                // No zero-fill needed: the VM clears the block before mixing.
+                // Either way the VM writes straight into the memory NumPy
+                // sees: a new block is handed to NumPy with a capsule owning
+                // it, so nothing is copied between ChucK and Python.
+                OutputArray out_array;
+                SAMPLE* out_ptr;
+                nb::object result;
+                if (output.is_none()) {
+                    out_ptr = new SAMPLE[expected_output_size];
+                    nb::capsule owner(out_ptr, [](void* p) noexcept {
+                        delete[] static_cast<SAMPLE*>(p);
+                    });
+                    result = nb::cast(NumpyArray(out_ptr, {expected_output_size}, owner));
+                } else {
+                    if (!nb::try_cast(output, out_array, false)) {
+                        throw nb::type_error(
+                            "output must be a writable, C-contiguous, 1-dimensional float32 array");
+                    }
+                    validate_audio_buffer(out_array, "output", expected_output_size);
+                    out_ptr = out_array.data();
+                    result = nb::borrow(output);
+                }
+
+                ChuckContextGuard guard(&self);
+                {
+                    EventDeferral defer;
+                    nb::gil_scoped_release release;
+                    RenderGuard guard(self);
+                    run_vm(self, in_ptr, out_ptr, num_frames);
+                }
+                dispatch_fired_events();
+                return result;
+            },
+            "num_frames"_a, "output"_a = nb::none(), "input"_a = nb::none(),
+            "Run ChucK for num_frames and return the output buffer.\n\n"
+            "Allocates the output array if none is given, and uses silence "
+            "if no input is given. Every output sample is written, so the "
+            "output buffer need not be zeroed (np.empty is enough). The GIL "
+            "is released while the VM runs.")
+        .def("render_int16",
+            [](ChucK& self, t_CKINT num_frames, nb::handle output, nb::handle input) {
+                if (!self.isInit()) {
+                    throw std::runtime_error("ChucK instance not initialized. Call init() first.");
+                }
+                check_not_rendering();
+                if (num_frames <= 0) {
+                    throw std::invalid_argument("num_frames must be positive");
+                }
+
+                t_CKINT num_in_channels = vm_input_channels(self);
+                t_CKINT num_out_channels = vm_output_channels(self);
+                size_t expected_input_size = num_frames * num_in_channels;
+                size_t expected_output_size = num_frames * num_out_channels;
+
+                InputArray in_array;
+                const SAMPLE* in_ptr = resolve_input(input, in_array, expected_input_size);
+
+                // Output: caller's int16 buffer (returned as-is), or a new array
+                Int16OutputArray out_array;
+                int16_t* out_ptr;
+                nb::object result;
+                if (output.is_none()) {
+                    out_ptr = new int16_t[expected_output_size];
+                    nb::capsule owner(out_ptr, [](void* p) noexcept {
+                        delete[] static_cast<int16_t*>(p);
+                    });
+                    result = nb::cast(NumpyInt16Array(out_ptr, {expected_output_size}, owner));
+                } else {
+                    if (!nb::try_cast(output, out_array, false)) {
+                        throw nb::type_error(
+                            "output must be a writable, C-contiguous, 1-dimensional int16 array");
+                    }
+                    validate_audio_buffer(out_array, "output", expected_output_size);
+                    out_ptr = out_array.data();
+                    result = nb::borrow(output);
+                }
+
+                ChuckContextGuard guard(&self);
+                {
+                    EventDeferral defer;
+                    nb::gil_scoped_release release;
+                    RenderGuard guard(self);
+                    SAMPLE* block = scratch(g_scratch_output, expected_output_size);
+                    run_vm(self, in_ptr, block, num_frames);
+                    quantize_int16(block, out_ptr, expected_output_size);
+                }
+                dispatch_fired_events();
+                return result;
+            },
+            "num_frames"_a, "output"_a = nb::none(), "input"_a = nb::none(),
+            "Run ChucK for num_frames and return the output as 16-bit PCM.\n\n"
+            "Like render(), but output is an int16 array with samples scaled "
+            "to full scale and clipped.")
+        .def("render_planar",
+            [](ChucK& self, PlanarArray output, std::optional<PlanarInputArray> input) {
+                if (!self.isInit()) {
+                    throw std::runtime_error("ChucK instance not initialized. Call init() first.");
+                }
+                check_not_rendering();
+                size_t num_in_channels = vm_input_channels(self);
+                size_t num_out_channels = vm_output_channels(self);
+                size_t frames = output.shape(1);
+                if (output.shape(0) != num_out_channels || frames == 0) {
+                    std::ostringstream oss;
+                    oss << "output must have shape (" << num_out_channels
+                        << ", num_frames) with num_frames > 0, got ("
+                        << output.shape(0) << ", " << frames << ")";
+                    throw std::invalid_argument(oss.str());
+                }
+                if (input && (input->shape(0) != num_in_channels || input->shape(1) != frames)) {
+                    std::ostringstream oss;
+                    oss << "input must have shape (" << num_in_channels << ", " << frames
+                        << "), got (" << input->shape(0) << ", " << input->shape(1) << ")";
+                    throw std::invalid_argument(oss.str());
+                }
+
+                const SAMPLE* in_planes = input ? input->data() : nullptr;
+                SAMPLE* out_planes = output.data();
+                ChuckContextGuard guard(&self);
+                {
+                    EventDeferral defer;
+                    nb::gil_scoped_release release;
+                    RenderGuard guard(self);
+
+                    // The VM works on interleaved frames: convert on either
+                    // side of the run, all within this one call
+                    const SAMPLE* in_ptr;
+                    if (in_planes && num_in_channels > 0) {
+                        SAMPLE* in_block = scratch(g_scratch_input, frames * num_in_channels);
+                        interleave_block(in_planes, in_block, num_in_channels, frames);
+                        in_ptr = in_block;
+                    } else {
+                        in_ptr = silent_input(frames * num_in_channels);
+                    }
+                    SAMPLE* out_block = scratch(g_scratch_output, frames * num_out_channels);
+                    run_vm(self, in_ptr, out_block, frames);
+                    deinterleave_block(out_block, out_planes, num_out_channels, frames);
+                }
+                dispatch_fired_events();
+            },
+            "output"_a, "input"_a.none() = nb::none(),
+            "Run ChucK for output.shape[1] frames, writing planar output.\n\n"
+            "output has shape (output_channels, num_frames) and input, if "
+            "given, (input_channels, num_frames).")
+        .def("render_ring",
+            [](ChucK& self, t_CKINT num_frames, AudioRing* input_ring, AudioRing* output_ring) {
+                if (!self.isInit()) {
+                    throw std::runtime_error("ChucK instance not initialized. Call init() first.");
+                }
+                check_not_rendering();
+                if (num_frames <= 0) {
+                    throw std::invalid_argument("num_frames must be positive");
+                }
+
+                size_t num_in_channels = vm_input_channels(self);
+                size_t num_out_channels = vm_output_channels(self);
+                if (input_ring && input_ring->channels() != num_in_channels) {
+                    throw std::invalid_argument("input_ring channels must match input channels");
+                }
+                if (output_ring && output_ring->channels() != num_out_channels) {
+                    throw std::invalid_argument("output_ring channels must match output channels");
+                }
+                size_t frames = static_cast<size_t>(num_frames);
+
+                // Input: drain the ring, padding an underrun with silence
+                const SAMPLE* in_ptr;
+                if (input_ring && num_in_channels > 0) {
+                    SAMPLE* in_block = scratch(g_scratch_input, frames * num_in_channels);
+                    size_t got = input_ring->read(in_block, frames);
+                    std::fill(in_block + got * num_in_channels,
+                              in_block + frames * num_in_channels, SAMPLE(0));
+                    in_ptr = in_block;
+                } else {
+                    in_ptr = silent_input(frames * num_in_channels);
+                }
+                SAMPLE* out_block = scratch(g_scratch_output, frames * num_out_channels);
+
+                ChuckContextGuard guard(&self);
+                size_t written;
+                {
+                    EventDeferral defer;
+                    nb::gil_scoped_release release;
+                    RenderGuard guard(self);
+                    run_vm(self, in_ptr, out_block, num_frames);
+
+                    // Output: push what fits; frames beyond a full ring are dropped
+                    written = output_ring ? output_ring->write(out_block, frames) : 0;
+                }
+                dispatch_fired_events();
+                return written;
+            },
+            "num_frames"_a, "input_ring"_a.none() = nb::none(), "output_ring"_a.none() = nb::none(),
+            "Run ChucK for num_frames, reading input from and writing output to AudioRings.\n\n"
+            "Missing input frames are treated as silence. Returns the number of "
+            "frames written to output_ring.")
+        .def("advance",
+            [](ChucK& self, t_CKINT num_frames) {
+                if (!self.isInit()) {
+                    throw std::runtime_error("ChucK instance not initialized. Call init() first.");
+                }
+                check_not_rendering();
+                if (num_frames <= 0) {
+                    throw std::invalid_argument("num_frames must be positive");
+                }
+
+                size_t num_in_channels = vm_input_channels(self);
+                size_t num_out_channels = vm_output_channels(self);
+
+                // The VM always mixes into an output block, so render in
+                // bounded chunks into one scratch block that is never returned:
+                // long advances cost no output allocation or copy
+                constexpr t_CKINT max_chunk = 4096;
+                t_CKINT chunk = std::min(num_frames, max_chunk);
+                const SAMPLE* in_ptr = silent_input(chunk * num_in_channels);
+                SAMPLE* out_block = scratch(g_scratch_output, chunk * num_out_channels);
+
+                ChuckContextGuard guard(&self);
+                {
+                    EventDeferral defer;
+                    nb::gil_scoped_release release;
+                    RenderGuard guard(self);
+                    for (t_CKINT done = 0; done < num_frames; done += chunk) {
+                        run_vm(self, in_ptr, out_block, std::min(chunk, num_frames - done));
+                    }
+                }
+                dispatch_fired_events();
+            },
+            "num_frames"_a,
+            "Run ChucK for num_frames with silent input, discarding the output.\n\n"
+            "Renders into an internal scratch block, so nothing is allocated "
+            "or returned. The GIL is released while the VM runs.")
 
         // Shred management
         .def("remove_all_shreds",
@@ -500,6 +1660,10 @@ NB_MODULE(_numchuck, m) {
 
                 // Clean up instance-specific callbacks before VM shutdown
                 cleanup_instance_callbacks(&self);
+                remove_instance_meters(&self);
+                invalidate_instance_code(&self);
+                remove_render_lock(&self);
+                g_globals_generation.fetch_add(1, std::memory_order_relaxed);
 
                 // Clear chout/cherr callbacks on the ChucK instance itself
                 self.setChoutCallback(nullptr);
@@ -523,44 +1687,50 @@ NB_MODULE(_numchuck, m) {
 
         // Callback methods (per-instance storage)
         .def("set_chout_callback",
-            [](ChucK& self, nb::callable callback) {
+            [](ChucK& self, std::optional<nb::callable> callback) {
                 std::uintptr_t key = reinterpret_cast<std::uintptr_t>(&self);
-                int callback_id = store_callback(callback);
+                int callback_id = callback ? store_callback(*callback) : 0;
                 {
                     std::lock_guard<std::mutex> lock(g_output_callback_mutex);
                     // Remove old callback if exists
                     auto it = g_chout_callbacks.find(key);
                     if (it != g_chout_callbacks.end()) {
                         remove_callback(it->second);
+                        g_chout_callbacks.erase(it);
+                    }
+                    if (callback_id) {
+                        g_chout_callbacks[key] = callback_id;
                     }
-                    g_chout_callbacks[key] = callback_id;
                 }
-                return self.setChoutCallback(cb_chout_wrapper);
+                return self.setChoutCallback(callback_id ? cb_chout_wrapper : nullptr);
             },
-            "callback"_a,
-            "Set callback for chout output (per-instance)")
+            "callback"_a.none(),
+            "Set callback for chout output (per-instance), or None to clear it")
         .def("set_cherr_callback",
-            [](ChucK& self, nb::callable callback) {
+            [](ChucK& self, std::optional<nb::callable> callback) {
                 std::uintptr_t key = reinterpret_cast<std::uintptr_t>(&self);
-                int callback_id = store_callback(callback);
+                int callback_id = callback ? store_callback(*callback) : 0;
                 {
                     std::lock_guard<std::mutex> lock(g_output_callback_mutex);
                     // Remove old callback if exists
                     auto it = g_cherr_callbacks.find(key);
                     if (it != g_cherr_callbacks.end()) {
                         remove_callback(it->second);
+                        g_cherr_callbacks.erase(it);
+                    }
+                    if (callback_id) {
+                        g_cherr_callbacks[key] = callback_id;
                     }
-                    g_cherr_callbacks[key] = callback_id;
                 }
-                return self.setCherrCallback(cb_cherr_wrapper);
+                return self.setCherrCallback(callback_id ? cb_cherr_wrapper : nullptr);
             },
-            "callback"_a,
-            "Set callback for cherr output (per-instance)")
+            "callback"_a.none(),
+            "Set callback for cherr output (per-instance), or None to clear it")
 
         // Global variable management - primitives
         .def("set_global_int",
             [](ChucK& self, const std::string& name, t_CKINT value) {
-                if (!self.globals()->setGlobalInt(name.c_str(), value)) {
+                if (!queue_globals(self)->setGlobalInt(name.c_str(), value)) {
                     throw std::runtime_error("Failed to set global int '" + name + "'");
                 }
             },
@@ -568,16 +1738,19 @@ NB_MODULE(_numchuck, m) {
             "Set a global int variable")
         .def("set_global_float",
             [](ChucK& self, const std::string& name, t_CKFLOAT value) {
-                if (!self.globals()->setGlobalFloat(name.c_str(), value)) {
+                if (!queue_globals(self)->setGlobalFloat(name.c_str(), value)) {
                     throw std::runtime_error("Failed to set global float '" + name + "'");
                 }
             },
             "name"_a, "value"_a,
             "Set a global float variable")
         .def("set_global_string",
-            [](ChucK& self, const std::string& name, const std::string& value) {
-                if (!self.globals()->setGlobalString(name.c_str(), value.c_str())) {
-                    throw std::runtime_error("Failed to set global string '" + name + "'");
+            [](ChucK& self, nb::str name, nb::str value) {
+                // Pass the str objects' cached UTF-8 straight to ChucK, which
+                // copies it into its request queue: no std::string in between
+                if (!queue_globals(self)->setGlobalString(name.c_str(), value.c_str())) {
+                    throw std::runtime_error(
+                        std::string("Failed to set global string '") + name.c_str() + "'");
                 }
             },
             "name"_a, "value"_a,
@@ -585,7 +1758,7 @@ NB_MODULE(_numchuck, m) {
         .def("get_global_int",
             [](ChucK& self, const std::string& name, nb::callable callback) {
                 int id = store_callback(callback);
-                if (!self.globals()->getGlobalInt(name.c_str(), id, cb_get_int_wrapper)) {
+                if (!queue_globals(self)->getGlobalInt(name.c_str(), id, cb_get_int_wrapper)) {
                     remove_callback(id);
                     throw std::runtime_error("Failed to get global int '" + name + "'");
                 }
@@ -595,7 +1768,7 @@ NB_MODULE(_numchuck, m) {
         .def("get_global_float",
             [](ChucK& self, const std::string& name, nb::callable callback) {
                 int id = store_callback(callback);
-                if (!self.globals()->getGlobalFloat(name.c_str(), id, cb_get_float_wrapper)) {
+                if (!queue_globals(self)->getGlobalFloat(name.c_str(), id, cb_get_float_wrapper)) {
                     remove_callback(id);
                     throw std::runtime_error("Failed to get global float '" + name + "'");
                 }
@@ -605,18 +1778,95 @@ NB_MODULE(_numchuck, m) {
         .def("get_global_string",
             [](ChucK& self, const std::string& name, nb::callable callback) {
                 int id = store_callback(callback);
-                if (!self.globals()->getGlobalString(name.c_str(), id, cb_get_string_wrapper)) {
+                if (!queue_globals(self)->getGlobalString(name.c_str(), id, cb_get_string_wrapper)) {
                     remove_callback(id);
                     throw std::runtime_error("Failed to get global string '" + name + "'");
                 }
             },
             "name"_a, "callback"_a,
             "Get a global string variable (async via callback)")
+        .def("get_global_int_sync",
+            [](ChucK& self, const std::string& name) -> std::optional<t_CKINT> {
+                GlobalsAccess access(self);
+                Chuck_Globals_Manager* globals = access.globals();
+                if (!globals) return std::nullopt;
+                return globals->get_global_int_value(name);
+            },
+            "name"_a,
+            "Get a global int variable immediately (None during real-time audio)")
+        .def("get_global_float_sync",
+            [](ChucK& self, const std::string& name) -> std::optional<t_CKFLOAT> {
+                GlobalsAccess access(self);
+                Chuck_Globals_Manager* globals = access.globals();
+                if (!globals) return std::nullopt;
+                return globals->get_global_float_value(name);
+            },
+            "name"_a,
+            "Get a global float variable immediately (None during real-time audio)")
+        .def("get_global_string_sync",
+            [](ChucK& self, const std::string& name) -> nb::object {
+                GlobalsAccess access(self);
+                Chuck_Globals_Manager* globals = access.globals();
+                if (!globals) return nb::none();
+                Chuck_String* value = globals->get_global_string(name);
+                if (!value) return nb::str("");
+                // Decode ChucK's buffer directly into the result str
+                const std::string& text = value->str();
+                return nb::str(text.data(), text.size());
+            },
+            "name"_a,
+            "Get a global string variable immediately (None during real-time audio)")
+        .def("bind_global_int_meter",
+            [](ChucK& self, const std::string& name) {
+                GlobalsAccess access(self);
+                Chuck_Globals_Manager* globals = access.globals();
+                if (!globals) {
+                    throw std::runtime_error("Cannot bind a meter while real-time audio is running");
+                }
+                globals->get_global_int_value(name);  // ensure it exists
+                auto* meter = new GlobalMeter(&self, name, globals->get_ptr_to_global_int(name), nullptr);
+                meter->update();
+                register_meter(meter);
+                return meter;
+            },
+            "name"_a, nb::rv_policy::take_ownership, nb::keep_alive<0, 1>(),
+            "Bind a lock-free meter that tracks a global int after every rendered block")
+        .def("bind_global_float_meter",
+            [](ChucK& self, const std::string& name) {
+                GlobalsAccess access(self);
+                Chuck_Globals_Manager* globals = access.globals();
+                if (!globals) {
+                    throw std::runtime_error("Cannot bind a meter while real-time audio is running");
+                }
+                globals->get_global_float_value(name);  // ensure it exists
+                auto* meter = new GlobalMeter(&self, name, nullptr, globals->get_ptr_to_global_float(name));
+                meter->update();
+                register_meter(meter);
+                return meter;
+            },
+            "name"_a, nb::rv_policy::take_ownership, nb::keep_alive<0, 1>(),
+            "Bind a lock-free meter that tracks a global float after every rendered block")
+        .def("global_int_handle",
+            [](ChucK& self, const std::string& name) {
+                auto handle = std::make_unique<GlobalHandle>(&self, name, false);
+                handle->resolve(GlobalsAccess(self));  // create the global and check the instance
+                return handle.release();
+            },
+            "name"_a, nb::rv_policy::take_ownership, nb::keep_alive<0, 1>(),
+            "Resolve a global int once, for fast repeated reads and writes")
+        .def("global_float_handle",
+            [](ChucK& self, const std::string& name) {
+                auto handle = std::make_unique<GlobalHandle>(&self, name, true);
+                handle->resolve(GlobalsAccess(self));  // create the global and check the instance
+                return handle.release();
+            },
+            "name"_a, nb::rv_policy::take_ownership, nb::keep_alive<0, 1>(),
+            "Resolve a global float once, for fast repeated reads and writes")
 
         // Global variable management - arrays
         .def("set_global_int_array",
             [](ChucK& self, const std::string& name, const std::vector<t_CKINT>& values) {
-                if (!self.globals()->setGlobalIntArray(name.c_str(),
+                if (!queue_globals(self)->setGlobalIntArray(name.c_str(),
                     const_cast<t_CKINT*>(values.data()), values.size())) {
                     throw std::runtime_error("Failed to set global int array '" + name + "'");
                 }
@@ -625,7 +1875,7 @@ NB_MODULE(_numchuck, m) {
             "Set a global int array variable")
         .def("set_global_float_array",
             [](ChucK& self, const std::string& name, const std::vector<t_CKFLOAT>& values) {
-                if (!self.globals()->setGlobalFloatArray(name.c_str(),
+                if (!queue_globals(self)->setGlobalFloatArray(name.c_str(),
                     const_cast<t_CKFLOAT*>(values.data()), values.size())) {
                     throw std::runtime_error("Failed to set global float array '" + name + "'");
                 }
@@ -634,7 +1884,7 @@ NB_MODULE(_numchuck, m) {
             "Set a global float array variable")
         .def("set_global_int_array_value",
             [](ChucK& self, const std::string& name, t_CKUINT index, t_CKINT value) {
-                if (!self.globals()->setGlobalIntArrayValue(name.c_str(), index, value)) {
+                if (!queue_globals(self)->setGlobalIntArrayValue(name.c_str(), index, value)) {
                     throw std::runtime_error("Failed to set global int array value '" + name + "[" + std::to_string(index) + "]'");
                 }
             },
@@ -642,7 +1892,7 @@ NB_MODULE(_numchuck, m) {
             "Set a global int array element by index")
         .def("set_global_float_array_value",
             [](ChucK& self, const std::string& name, t_CKUINT index, t_CKFLOAT value) {
-                if (!self.globals()->setGlobalFloatArrayValue(name.c_str(), index, value)) {
+                if (!queue_globals(self)->setGlobalFloatArrayValue(name.c_str(), index, value)) {
                     throw std::runtime_error("Failed to set global float array value '" + name + "[" + std::to_string(index) + "]'");
                 }
             },
@@ -650,7 +1900,7 @@ NB_MODULE(_numchuck, m) {
             "Set a global float array element by index")
         .def("set_global_associative_int_array_value",
             [](ChucK& self, const std::string& name, const std::string& key, t_CKINT value) {
-                if (!self.globals()->setGlobalAssociativeIntArrayValue(name.c_str(), key.c_str(), value)) {
+                if (!queue_globals(self)->setGlobalAssociativeIntArrayValue(name.c_str(), key.c_str(), value)) {
                     throw std::runtime_error("Failed to set global associative int array value '" + name + "[\"" + key + "\"]'");
                 }
             },
@@ -658,7 +1908,7 @@ NB_MODULE(_numchuck, m) {
             "Set a global associative int array element by key")
         .def("set_global_associative_float_array_value",
             [](ChucK& self, const std::string& name, const std::string& key, t_CKFLOAT value) {
-                if (!self.globals()->setGlobalAssociativeFloatArrayValue(name.c_str(), key.c_str(), value)) {
+                if (!queue_globals(self)->setGlobalAssociativeFloatArrayValue(name.c_str(), key.c_str(), value)) {
                     throw std::runtime_error("Failed to set global associative float array value '" + name + "[\"" + key + "\"]'");
                 }
             },
@@ -667,7 +1917,7 @@ NB_MODULE(_numchuck, m) {
         .def("get_global_int_array",
             [](ChucK& self, const std::string& name, nb::callable callback) {
                 int id = store_callback(callback);
-                if (!self.globals()->getGlobalIntArray(name.c_str(), id, cb_get_int_array_wrapper)) {
+                if (!queue_globals(self)->getGlobalIntArray(name.c_str(), id, cb_get_int_array_wrapper)) {
                     remove_callback(id);
                     throw std::runtime_error("Failed to get global int array '" + name + "'");
                 }
@@ -677,7 +1927,7 @@ NB_MODULE(_numchuck, m) {
         .def("get_global_float_array",
             [](ChucK& self, const std::string& name, nb::callable callback) {
                 int id = store_callback(callback);
-                if (!self.globals()->getGlobalFloatArray(name.c_str(), id, cb_get_float_array_wrapper)) {
+                if (!queue_globals(self)->getGlobalFloatArray(name.c_str(), id, cb_get_float_array_wrapper)) {
                     remove_callback(id);
                     throw std::runtime_error("Failed to get global float array '" + name + "'");
                 }
@@ -688,7 +1938,7 @@ NB_MODULE(_numchuck, m) {
         // Global event management
         .def("signal_global_event",
             [](ChucK& self, const std::string& name) {
-                if (!self.globals()->signalGlobalEvent(name.c_str())) {
+                if (!queue_globals(self)->signalGlobalEvent(name.c_str())) {
                     throw std::runtime_error("Failed to signal global event '" + name + "'");
                 }
             },
@@ -696,7 +1946,7 @@ NB_MODULE(_numchuck, m) {
             "Signal a global event (wakes one waiting shred)")
         .def("broadcast_global_event",
             [](ChucK& self, const std::string& name) {
-                if (!self.globals()->broadcastGlobalEvent(name.c_str())) {
+                if (!queue_globals(self)->broadcastGlobalEvent(name.c_str())) {
                     throw std::runtime_error("Failed to broadcast global event '" + name + "'");
                 }
             },
@@ -705,7 +1955,7 @@ NB_MODULE(_numchuck, m) {
         .def("listen_for_global_event",
             [](ChucK& self, const std::string& name, nb::callable callback, bool listen_forever = true) {
                 int id = store_callback(callback);
-                if (!self.globals()->listenForGlobalEvent(name.c_str(), id, cb_event_wrapper, listen_forever)) {
+                if (!queue_globals(self)->listenForGlobalEvent(name.c_str(), id, cb_event_wrapper, listen_forever)) {
                     remove_callback(id);
                     throw std::runtime_error("Failed to listen for global event '" + name + "'");
                 }
@@ -715,7 +1965,7 @@ NB_MODULE(_numchuck, m) {
             "Listen for a global event and call Python callback when triggered (returns listener ID)")
         .def("stop_listening_for_global_event",
             [](ChucK& self, const std::string& name, int callback_id) {
-                if (!self.globals()->stopListeningForGlobalEvent(name.c_str(), callback_id, cb_event_wrapper)) {
+                if (!queue_globals(self)->stopListeningForGlobalEvent(name.c_str(), callback_id, cb_event_wrapper)) {
                     throw std::runtime_error("Failed to stop listening for global event '" + name + "'");
                 }
                 remove_callback(callback_id);
@@ -727,7 +1977,10 @@ NB_MODULE(_numchuck, m) {
         .def("get_all_globals",
             [](ChucK& self) {
                 std::vector<Chuck_Globals_TypeValue> globals_list;
-                self.globals()->get_all_global_variables(globals_list);
+                GlobalsAccess access(self);
+                Chuck_Globals_Manager* globals = access.globals();
+                // Real-time audio owns the VM: read without the render lock
+                (globals ? globals : self.globals())->get_all_global_variables(globals_list);
 
                 std::vector<std::pair<std::string, std::string>> result;
                 for (const auto& gv : globals_list) {
@@ -823,10 +2076,15 @@ NB_MODULE(_numchuck, m) {
                 if (!self.globals()) {
                     throw std::runtime_error("Globals manager not initialized");
                 }
+                // The global containers are freed when the message is
+                // handled: detach meters and make handles re-resolve
+                remove_instance_meters(&self);
+                g_globals_generation.fetch_add(1, std::memory_order_relaxed);
+
                 Chuck_Msg* msg = new Chuck_Msg();
                 msg->type = CK_MSG_CLEARVM;
                 msg->reply_cb = nullptr;
-                if (!self.globals()->execute_chuck_msg_with_globals(msg)) {
+                if (!queue_globals(self)->execute_chuck_msg_with_globals(msg)) {
                     throw std::runtime_error("Failed to clear VM");
                 }
             },
@@ -836,10 +2094,15 @@ NB_MODULE(_numchuck, m) {
                 if (!self.globals()) {
                     throw std::runtime_error("Globals manager not initialized");
                 }
+                // The global containers are freed when the message is
+                // handled: detach meters and make handles re-resolve
+                remove_instance_meters(&self);
+                g_globals_generation.fetch_add(1, std::memory_order_relaxed);
+
                 Chuck_Msg* msg = new Chuck_Msg();
                 msg->type = CK_MSG_CLEARGLOBALS;
                 msg->reply_cb = nullptr;
-                if (!self.globals()->execute_chuck_msg_with_globals(msg)) {
+                if (!queue_globals(self)->execute_chuck_msg_with_globals(msg)) {
                     throw std::runtime_error("Failed to clear globals");
                 }
             },
@@ -852,7 +2115,7 @@ NB_MODULE(_numchuck, m) {
                 Chuck_Msg* msg = new Chuck_Msg();
                 msg->type = CK_MSG_RESET_ID;
                 msg->reply_cb = nullptr;
-                if (!self.globals()->execute_chuck_msg_with_globals(msg)) {
+                if (!queue_globals(self)->execute_chuck_msg_with_globals(msg)) {
                     throw std::runtime_error("Failed to reset shred ID");
                 }
             },
@@ -944,11 +2207,33 @@ NB_MODULE(_numchuck, m) {
     // Version function
     m.def("version", &ChucK::version, "Get ChucK version");
 
+    // Interleaved <-> planar conversion
+    m.def("deinterleave",
+        [](InputArray interleaved, PlanarArray planes) {
+            size_t channels = planes.shape(0);
+            size_t frames = planes.shape(1);
+            validate_interleaved(interleaved, channels, frames);
+            deinterleave_block(interleaved.data(), planes.data(), channels, frames);
+        },
+        "interleaved"_a, "planes"_a,
+        "Split interleaved frames into planes of shape (channels, frames)");
+    m.def("interleave",
+        [](PlanarInputArray planes, OutputArray interleaved) {
+            size_t channels = planes.shape(0);
+            size_t frames = planes.shape(1);
+            validate_interleaved(interleaved, channels, frames);
+            interleave_block(planes.data(), interleaved.data(), channels, frames);
+        },
+        "planes"_a, "interleaved"_a,
+        "Merge planes of shape (channels, frames) into interleaved frames");
+
     // Helper function to start real-time audio with RAII management
     m.def("start_audio",
         [](ChucK& chuck, t_CKUINT sample_rate, t_CKUINT num_dac_channels,
            t_CKUINT num_adc_channels, t_CKUINT dac_device, t_CKUINT adc_device,
            t_CKUINT buffer_size, t_CKUINT num_buffers) {
+            // Restarting stops the event dispatcher, which may need the GIL
+            nb::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(g_audio_mutex);
 
             if (!chuck.isInit()) {
@@ -995,6 +2280,7 @@ NB_MODULE(_numchuck, m) {
 
     m.def("stop_audio",
         []() {
+            nb::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(g_audio_mutex);
             if (g_audio_context) {
                 g_audio_context->stop();
@@ -1005,6 +2291,7 @@ NB_MODULE(_numchuck, m) {
 
     m.def("shutdown_audio",
         [](t_CKUINT msWait) {
+            nb::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(g_audio_mutex);
             if (g_audio_context) {
                 g_audio_context->cleanup(msWait);
@@ -1028,6 +2315,10 @@ NB_MODULE(_numchuck, m) {
     // Cleanup function to be called during module teardown
     m.def("_cleanup_callbacks",
         []() {
+            {
+                nb::gil_scoped_release release;
+                g_event_dispatcher.stop();
+            }
             {
                 std::lock_guard<std::mutex> lock(g_callback_mutex);
                 g_callbacks.clear();
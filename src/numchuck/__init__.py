@@ -20,11 +20,39 @@ Error Handling:
     - TypeError: Incorrect type passed to function
 """
 
+from typing import TYPE_CHECKING
+
 from ._version import __version__, __version_info__
-from .api import Chuck
+
+if TYPE_CHECKING:
+    from ._numchuck import AudioRing
+    from .api import Chuck
 
 __all__ = [
     "__version__",
     "__version_info__",
     "Chuck",
+    "AudioRing",
 ]
+
+# Public names resolved on first access (PEP 562), so importing numchuck
+# (e.g. for the CLI or the low-level _numchuck module) doesn't pull in
+# the high-level API and NumPy until they are used
+_LAZY = {
+    "Chuck": ".api",
+    "AudioRing": "._numchuck",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -13,8 +13,18 @@ For detailed help on each command:
     python -m numchuck <command> --help
 """
 
+import sys
+
 
 def main():
+    # `version` needs neither argparse nor the CLI handlers, so answer it
+    # before importing the CLI subsystem
+    if sys.argv[1:] == ["version"]:
+        from .cli.version import format_version
+
+        print(format_version())
+        return
+
     from .cli.main import main as cli_main
 
     cli_main()
@@ -4,6 +4,47 @@ from typing import Callable, List, Tuple, Dict, Any
 import numpy as np
 from numpy.typing import NDArray
 
+# Lock-free global meter
+class GlobalMeter:
+    """Lock-free meter tracking a ChucK global int or float."""
+
+    @property
+    def name(self) -> str: ...
+    @property
+    def value(self) -> int | float: ...
+
+class CompiledCode:
+    """ChucK program compiled by ChucK.compile_to_code(), ready to spork."""
+
+    @property
+    def valid(self) -> bool: ...
+
+class GlobalHandle:
+    """Pre-resolved handle to a ChucK global int or float."""
+
+    @property
+    def name(self) -> str: ...
+    @property
+    def value(self) -> int | float | None: ...
+    @value.setter
+    def value(self, value: int | float) -> None: ...
+
+# Lock-free audio ring
+class AudioRing:
+    """Lock-free single-producer single-consumer ring of interleaved audio frames."""
+
+    def __init__(self, capacity_frames: int, channels: int) -> None: ...
+    def write(self, samples: NDArray[np.float32]) -> int: ...
+    def read(self, out: NDArray[np.float32]) -> int: ...
+    @property
+    def capacity(self) -> int: ...
+    @property
+    def channels(self) -> int: ...
+    @property
+    def readable(self) -> int: ...
+    @property
+    def writable(self) -> int: ...
+
 # ChucK class
 class ChucK:
     """ChucK virtual machine and compiler."""
@@ -19,6 +60,7 @@ class ChucK:
     def set_param_float(self, name: str, value: float) -> None: ...
     def set_param_string(self, name: str, value: str) -> None: ...
     def set_param_string_list(self, name: str, value: List[str]) -> None: ...
+    def set_params(self, params: Dict[str, int | float | str | List[str]]) -> bool: ...
     def get_param_int(self, name: str) -> int: ...
     def get_param_float(self, name: str) -> float: ...
     def get_param_string(self, name: str) -> str: ...
@@ -36,11 +78,39 @@ class ChucK:
     def compile_file(
         self, path: str, args: str = "", count: int = 1, immediate: bool = False
     ) -> Tuple[bool, List[int]]: ...
+    def compile_to_code(self, code: str) -> CompiledCode | None: ...
+    def spork_code(
+        self, program: CompiledCode, count: int = 1, immediate: bool = False
+    ) -> List[int]: ...
 
     # Audio processing
     def run(
         self, input: NDArray[np.float32], output: NDArray[np.float32], num_frames: int
     ) -> None: ...
+    def render(
+        self,
+        num_frames: int,
+        output: NDArray[np.float32] | None = None,
+        input: NDArray[np.float32] | None = None,
+    ) -> NDArray[np.float32]: ...
+    def render_int16(
+        self,
+        num_frames: int,
+        output: NDArray[np.int16] | None = None,
+        input: NDArray[np.float32] | None = None,
+    ) -> NDArray[np.int16]: ...
+    def render_planar(
+        self,
+        output: NDArray[np.float32],
+        input: NDArray[np.float32] | None = None,
+    ) -> None: ...
+    def render_ring(
+        self,
+        num_frames: int,
+        input_ring: AudioRing | None = None,
+        output_ring: AudioRing | None = None,
+    ) -> int: ...
+    def advance(self, num_frames: int) -> None: ...
 
     # Global variables - primitives
     def set_global_int(self, name: str, value: int) -> None: ...
@@ -51,6 +121,13 @@ class ChucK:
         self, name: str, callback: Callable[[float], None]
     ) -> None: ...
     def get_global_string(self, name: str, callback: Callable[[str], None]) -> None: ...
+    def get_global_int_sync(self, name: str) -> int | None: ...
+    def get_global_float_sync(self, name: str) -> float | None: ...
+    def get_global_string_sync(self, name: str) -> str | None: ...
+    def bind_global_int_meter(self, name: str) -> GlobalMeter: ...
+    def bind_global_float_meter(self, name: str) -> GlobalMeter: ...
+    def global_int_handle(self, name: str) -> GlobalHandle: ...
+    def global_float_handle(self, name: str) -> GlobalHandle: ...
 
     # Global variables - arrays
     def set_global_int_array(self, name: str, values: List[int]) -> None: ...
@@ -101,8 +178,8 @@ class ChucK:
     def probe_chugins(self) -> None: ...
 
     # Callbacks
-    def set_chout_callback(self, callback: Callable[[str], None]) -> bool: ...
-    def set_cherr_callback(self, callback: Callable[[str], None]) -> bool: ...
+    def set_chout_callback(self, callback: Callable[[str], None] | None) -> bool: ...
+    def set_cherr_callback(self, callback: Callable[[str], None] | None) -> bool: ...
 
     # Static methods
     @staticmethod
@@ -128,6 +205,12 @@ class ChucK:
 
 # Module-level functions
 def version() -> str: ...
+def deinterleave(
+    interleaved: NDArray[np.float32], planes: NDArray[np.float32]
+) -> None: ...
+def interleave(
+    planes: NDArray[np.float32], interleaved: NDArray[np.float32]
+) -> None: ...
 def start_audio(
     chuck: ChucK,
     sample_rate: int = 44100,
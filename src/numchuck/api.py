@@ -25,21 +25,151 @@ Thread Safety:
     - Event signaling (signal_event, broadcast_event)
     - Read-only queries (shreds property, shred_info)
 
+    run() and the other render methods release the GIL. Separate instances
+    may render on separate threads at once; renders of one instance, and
+    global getters/setters on it, are serialized by a per-instance lock.
+    compile(), remove_shred() and clear() take no lock and must not overlap
+    a render of the same instance. A callback fired during a render (e.g.
+    a chout or global callback) cannot start another render on that thread:
+    the render call raises RuntimeError.
+
     See docs/architecture.md for detailed thread safety documentation.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import threading
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
 from . import _numchuck
+from ._numchuck import (
+    PARAM_AUTO_DEPEND,
+    PARAM_CHUGIN_ENABLE,
+    PARAM_COMPILER_HIGHLIGHT_ON_ERROR,
+    PARAM_DEPRECATE_LEVEL,
+    PARAM_DUMP_INSTRUCTIONS,
+    PARAM_INPUT_CHANNELS,
+    PARAM_IS_REALTIME_AUDIO_HINT,
+    PARAM_OTF_ENABLE,
+    PARAM_OTF_PORT,
+    PARAM_OTF_PRINT_WARNINGS,
+    PARAM_OUTPUT_CHANNELS,
+    PARAM_SAMPLE_RATE,
+    PARAM_TTY_COLOR,
+    PARAM_TTY_WIDTH_HINT,
+    PARAM_USER_CHUGINS,
+    PARAM_VERSION,
+    PARAM_VM_ADAPTIVE,
+    PARAM_VM_HALT,
+    PARAM_WORKING_DIRECTORY,
+)
 
 if TYPE_CHECKING:
-    from typing import Callable
+    from typing import Callable, Iterator, Literal, Sequence
 
     from numpy.typing import NDArray
+    from typing_extensions import Self
+
+# Sentinel marking the getter result slot as not yet filled
+_MISSING = object()
+
+# ChucK's built-in values for the parameters Chuck() exposes (see
+# initDefaultParams() in chuck.cpp)
+_VM_DEFAULTS: dict[str, int] = {
+    PARAM_SAMPLE_RATE: 44100,
+    PARAM_INPUT_CHANNELS: 2,
+    PARAM_OUTPUT_CHANNELS: 2,
+    PARAM_CHUGIN_ENABLE: 1,
+    PARAM_VM_ADAPTIVE: 0,
+    PARAM_VM_HALT: 0,
+    PARAM_AUTO_DEPEND: 0,
+    PARAM_DEPRECATE_LEVEL: 1,
+    PARAM_DUMP_INSTRUCTIONS: 0,
+    PARAM_OTF_ENABLE: 0,
+    PARAM_OTF_PORT: 8888,
+    PARAM_TTY_COLOR: 0,
+    PARAM_TTY_WIDTH_HINT: 80,
+}
+
+# Compiled programs kept per instance by compile()
+_CODE_CACHE_SIZE = 128
+
+# Python type -> (ChucK type name, sync getter, callback getter) for get_globals()
+_GLOBAL_GETTERS = {
+    int: ("int", "get_global_int_sync", "get_global_int"),
+    float: ("float", "get_global_float_sync", "get_global_float"),
+    str: ("string", "get_global_string_sync", "get_global_string"),
+}
+
+
+def _aligned_empty(size: int, alignment: int = 64) -> NDArray[np.float32]:
+    """Return an uninitialized float32 array aligned to `alignment` bytes.
+
+    Over-allocates and slices so the view starts on a cache-line boundary;
+    the view keeps the underlying allocation alive through its ``base``.
+    """
+    spare = alignment // 4
+    buf = np.empty(size + spare, dtype=np.float32)
+    offset = (-buf.ctypes.data % alignment) // 4
+    return buf[offset : offset + size]
+
+
+class PooledArray(np.ndarray):
+    """Output block from run(reuse="pool").
+
+    Behaves as a normal float32 array. Once done with it, call release()
+    (or use it as a context manager) to hand its memory back to the pool for
+    a later run() call; a block that is never released is simply freed.
+    Neither the block nor any view of it may be used after release().
+    """
+
+    def release(self) -> None:
+        """Return this block's memory to the calling thread's pool."""
+        base = self.base
+        if not isinstance(base, np.ndarray) or getattr(self, "_released", False):
+            return
+        if self.size != base.size:
+            raise ValueError("only a whole block returned by run() can be released")
+        self._released = True
+        _BufferPool.put(base)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.release()
+
+
+class _BufferPool:
+    """Per-thread free lists of float32 output blocks, keyed by size."""
+
+    # Blocks kept per size; extra returned blocks are simply freed
+    max_per_size = 8
+
+    _local = threading.local()
+
+    @classmethod
+    def _free(cls) -> dict[int, list[NDArray[np.float32]]]:
+        free = getattr(cls._local, "free", None)
+        if free is None:
+            free = cls._local.free = {}
+        return free
+
+    @classmethod
+    def get(cls, size: int) -> PooledArray:
+        """Return a size-sample block, reusing a freed one if available."""
+        blocks = cls._free().get(size)
+        block = blocks.pop() if blocks else np.empty(size, dtype=np.float32)
+        return block.view(PooledArray)
+
+    @classmethod
+    def put(cls, block: NDArray[np.float32]) -> None:
+        """Return a block's memory to the calling thread's free list."""
+        blocks = cls._free().setdefault(block.size, [])
+        if len(blocks) < cls.max_per_size:
+            blocks.append(block)
 
 
 class Chuck:
@@ -67,6 +197,26 @@ class Chuck:
         auto_init: Automatically call init() after setting params (default: True)
     """
 
+    __slots__ = (
+        "_chuck",
+        "_code_cache",
+        "_float_handles",
+        "_get_param_int",
+        "_get_slot",
+        "_in_channels",
+        "_input_ring",
+        "_int_handles",
+        "_out_channels",
+        "_output_ring",
+        "_planar_buf",
+        "_render",
+        "_reuse_input_storage",
+        "_reuse_num_frames",
+        "_reuse_output_buf",
+        "_reuse_storage",
+        "_store",
+    )
+
     def __init__(
         self,
         sample_rate: int = 44100,
@@ -88,37 +238,81 @@ class Chuck:
     ):
         self._chuck = _numchuck.ChucK()
 
-        # Set parameters before init
-        self._chuck.set_param(_numchuck.PARAM_SAMPLE_RATE, sample_rate)
-        self._chuck.set_param(_numchuck.PARAM_INPUT_CHANNELS, input_channels)
-        self._chuck.set_param(_numchuck.PARAM_OUTPUT_CHANNELS, output_channels)
+        # Bound methods used on hot paths (rendering, property reads), so
+        # each call skips the attribute lookup on the extension object
+        self._render = self._chuck.render
+        self._get_param_int = self._chuck.get_param_int
+
+        # Set parameters before init, in a single call into the extension.
+        # Values the VM already defaults to are left out, so the common
+        # Chuck() call doesn't cross into the extension at all here.
+        params: dict[str, int | str | list[str]] = {}
+        for key, value in (
+            (PARAM_SAMPLE_RATE, sample_rate),
+            (PARAM_INPUT_CHANNELS, input_channels),
+            (PARAM_OUTPUT_CHANNELS, output_channels),
+            (PARAM_CHUGIN_ENABLE, chugin_enable),
+            (PARAM_VM_ADAPTIVE, vm_adaptive),
+            (PARAM_VM_HALT, vm_halt),
+            (PARAM_AUTO_DEPEND, auto_depend),
+            (PARAM_DEPRECATE_LEVEL, deprecate_level),
+            (PARAM_DUMP_INSTRUCTIONS, dump_instructions),
+            (PARAM_OTF_ENABLE, otf_enable),
+            (PARAM_OTF_PORT, otf_port),
+            (PARAM_TTY_COLOR, tty_color),
+            (PARAM_TTY_WIDTH_HINT, tty_width_hint),
+        ):
+            if value != _VM_DEFAULTS[key]:
+                params[key] = value
         if working_directory:
-            self._chuck.set_param_string(
-                _numchuck.PARAM_WORKING_DIRECTORY, working_directory
-            )
-        self._chuck.set_param(_numchuck.PARAM_CHUGIN_ENABLE, int(chugin_enable))
+            params[PARAM_WORKING_DIRECTORY] = working_directory
         if user_chugins:
-            self._chuck.set_param_string_list(
-                _numchuck.PARAM_USER_CHUGINS, user_chugins
-            )
-        self._chuck.set_param(_numchuck.PARAM_VM_ADAPTIVE, int(vm_adaptive))
-        self._chuck.set_param(_numchuck.PARAM_VM_HALT, int(vm_halt))
-        self._chuck.set_param(_numchuck.PARAM_AUTO_DEPEND, int(auto_depend))
-        self._chuck.set_param(_numchuck.PARAM_DEPRECATE_LEVEL, deprecate_level)
-        self._chuck.set_param(_numchuck.PARAM_DUMP_INSTRUCTIONS, int(dump_instructions))
-        self._chuck.set_param(_numchuck.PARAM_OTF_ENABLE, int(otf_enable))
-        self._chuck.set_param(_numchuck.PARAM_OTF_PORT, otf_port)
-        self._chuck.set_param(_numchuck.PARAM_TTY_COLOR, int(tty_color))
-        self._chuck.set_param(_numchuck.PARAM_TTY_WIDTH_HINT, tty_width_hint)
+            params[PARAM_USER_CHUGINS] = user_chugins
+        if params:
+            self._chuck.set_params(params)
 
         if auto_init:
             self._chuck.init()
 
-        # Internal buffers for run_reuse() - lazily allocated
-        self._reuse_input_buf: NDArray[np.float32] | None = None
+        # Channel counts are fixed at construction; cache them so run()
+        # doesn't query the VM on every audio block
+        self._in_channels: int = self._get_param_int(PARAM_INPUT_CHANNELS)
+        self._out_channels: int = self._get_param_int(PARAM_OUTPUT_CHANNELS)
+
+        # Internal output buffer for run(reuse=True):
+        # growable storage plus the view handed out for the current size
+        self._reuse_storage: NDArray[np.float32] = np.empty(0, dtype=np.float32)
         self._reuse_output_buf: NDArray[np.float32] | None = None
         self._reuse_num_frames: int = 0
 
+        # Internal input buffer for run(reuse=True), created on first use
+        # by input_memoryview()
+        self._reuse_input_storage: NDArray[np.float32] = np.empty(0, dtype=np.float32)
+
+        # (channels, frames) scratch returned by run_planar()
+        self._planar_buf: NDArray[np.float32] | None = None
+
+        # Compiled programs by source, so compile() can skip the compiler
+        self._code_cache: dict[str, _numchuck.CompiledCode] = {}
+
+        # Resolved global handles by name, used by get/set_int and get/set_float
+        self._int_handles: dict[str, _numchuck.GlobalHandle] = {}
+        self._float_handles: dict[str, _numchuck.GlobalHandle] = {}
+
+        # Rings attached for run_ring()
+        self._input_ring: _numchuck.AudioRing | None = None
+        self._output_ring: _numchuck.AudioRing | None = None
+
+        # Single result slot and store callback shared by the sync getters,
+        # so get_int() etc. don't build a new list and lambda per call
+        slot: list[Any] = [_MISSING]
+
+        def _store(value: Any, _slot: list[Any] = slot) -> None:
+            _slot[0] = value
+
+        self._get_slot = slot
+        self._store = _store
+
     # -------------------------------------------------------------------------
     # Core operations
     # -------------------------------------------------------------------------
@@ -135,14 +329,22 @@ class Chuck:
 
         Safe to call multiple times.
         """
+        self._code_cache.clear()
         self._chuck.shutdown()
 
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def compile(
         self,
         code: str,
         args: str = "",
         count: int = 1,
         immediate: bool = False,
+        cache: bool = False,
     ) -> tuple[bool, list[int]]:
         """Compile and run ChucK code.
 
@@ -151,15 +353,34 @@ class Chuck:
             args: Arguments to pass to the shred
             count: Number of shreds to spawn (default: 1)
             immediate: If True, compile immediately without queuing
+            cache: If True, keep the compiled program and spork it again
+                when the same source is compiled with cache=True, skipping
+                the compiler. Ignored when args are given
 
         Returns:
             Tuple of (success, list of shred IDs)
 
+        A cached program is sporked as it was first compiled, so only cache
+        code that does not define classes: the compiler's side effects,
+        such as registering a public class, happen once and are not
+        repeated. clear() empties the cache.
+
         Warning:
             Not thread-safe during real-time audio playback.
             Call stop_audio() before compiling new code.
         """
-        return self._chuck.compile_code(code, args, count, immediate)
+        if args or not cache:
+            return self._chuck.compile_code(code, args, count, immediate)
+        program = self._code_cache.get(code)
+        if program is None:
+            program = self._chuck.compile_to_code(code)
+            if program is None:
+                return False, []
+            if len(self._code_cache) >= _CODE_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._code_cache[next(iter(self._code_cache))]
+            self._code_cache[code] = program
+        return True, self._chuck.spork_code(program, count, immediate)
 
     def compile_file(
         self,
@@ -191,15 +412,32 @@ class Chuck:
         *,
         output: NDArray[np.float32] | None = None,
         input: NDArray[np.float32] | None = None,
-        reuse: bool = False,
+        reuse: bool | Literal["pool"] = False,
     ) -> NDArray[np.float32]:
         """Run the VM for a number of frames, returning the output audio.
 
+        The GIL is released while the VM renders, so other Python threads
+        (e.g. one filling the next input block, one writing out the last
+        output) keep running. They must not touch ``output`` or ``input``
+        until this call returns.
+
+        Separate instances render concurrently from separate threads. On
+        one instance, each render holds a per-instance lock: renders from
+        several threads run one at a time, and global getters and setters
+        (get_int(), set_float(), global handles, ...) wait for the current
+        render to finish. Compiling, removing shreds and other VM changes
+        take no lock and must not overlap a render of the same instance.
+
         Args:
             num_frames: Number of audio frames to compute
-            output: Pre-allocated output buffer, or None to allocate
+            output: Pre-allocated output buffer, or None to allocate. Every
+                sample is overwritten, so it need not be zeroed
             input: Pre-allocated input buffer, or None for silence
-            reuse: If True and output is None, reuse internal buffer (zero GC)
+            reuse: If True and output is None, reuse internal buffer (zero GC).
+                If input is None, also read the internal input buffer once
+                input_memoryview() has created it. If "pool" and output is
+                None, return a fresh PooledArray whose memory is recycled
+                once it is released (see PooledArray.release()).
 
         Returns:
             Output audio as numpy array (num_frames * output_channels,)
@@ -209,51 +447,279 @@ class Chuck:
             audio = chuck.run(512)
 
             # Zero allocation with your buffer
-            buf = np.zeros(1024, dtype=np.float32)
+            buf = np.empty(1024, dtype=np.float32)
             chuck.run(512, output=buf)
 
             # Zero allocation with internal buffer
             audio = chuck.run(512, reuse=True)
 
+            # Distinct arrays per call, recycled after use
+            with chuck.run(512, reuse="pool") as audio:
+                process(audio)
+
             # Effect mode (both buffers)
             chuck.run(512, output=out_buf, input=in_buf)
         """
-        in_channels = self.input_channels
-        out_channels = self.output_channels
-
-        # Determine output buffer
-        if output is not None:
-            output_buf = output
+        if reuse == "pool":
+            if output is None:
+                output = _BufferPool.get(num_frames * self._out_channels)
         elif reuse:
-            # Use internal reusable buffer
-            if self._reuse_num_frames != num_frames or self._reuse_output_buf is None:
-                self._reuse_output_buf = np.zeros(
-                    num_frames * out_channels, dtype=np.float32
-                )
-                self._reuse_input_buf = np.zeros(
-                    num_frames * in_channels, dtype=np.float32
-                )
-                self._reuse_num_frames = num_frames
-            output_buf = self._reuse_output_buf
-        else:
-            output_buf = np.zeros(num_frames * out_channels, dtype=np.float32)
-
-        # Determine input buffer
-        if input is not None:
-            input_buf = input
-        elif reuse and self._reuse_input_buf is not None:
-            input_buf = self._reuse_input_buf
-        else:
-            input_buf = np.zeros(num_frames * in_channels, dtype=np.float32)
-
-        self._chuck.run(input_buf, output_buf, num_frames)
-        return output_buf
+            if output is None:
+                output = self._ensure_reuse(num_frames)
+            if input is None and self._reuse_input_storage.size:
+                input = self._ensure_reuse_input(num_frames)
+
+        # The extension allocates the output if needed and supplies silence
+        # for a missing input, so this is a single call into C++
+        return self._render(num_frames, output, input)
+
+    def run_int16(
+        self,
+        num_frames: int,
+        *,
+        output: NDArray[np.int16] | None = None,
+        input: NDArray[np.float32] | None = None,
+    ) -> NDArray[np.int16]:
+        """Run the VM and return the output as 16-bit PCM.
+
+        Samples are scaled to full scale and clipped in C++, giving half the
+        bytes of run() for recording or streaming, with no float32 array
+        round-tripping through NumPy.
+
+        Args:
+            num_frames: Number of audio frames to compute
+            output: Pre-allocated int16 output buffer, or None to allocate
+            input: Pre-allocated float32 input buffer, or None for silence
+
+        Returns:
+            Output audio as int16 numpy array (num_frames * output_channels,)
+
+        Example:
+            >>> wav.writeframes(chuck.run_int16(4096).tobytes())
+        """
+        return self._chuck.render_int16(num_frames, output, input)
+
+    def run_into(
+        self,
+        output: NDArray[np.float32],
+        input: NDArray[np.float32] | None = None,
+    ) -> int:
+        """Run the VM to fill a caller-owned output buffer in place.
+
+        The frame count is taken from the buffer size, so a real-time loop
+        can keep passing the same buffer with no allocation or size
+        arithmetic of its own.
+
+        Any writable, C-contiguous float32 buffer works, including a
+        memoryview onto another library's audio block, and the VM writes
+        into it directly. Other writable 1-D arrays (e.g. float64, or a
+        strided view) are filled by rendering into a temporary block and
+        copying across.
+
+        Args:
+            output: Output buffer, a multiple of output_channels in size
+            input: Pre-allocated input buffer, or None for silence
+
+        Returns:
+            Number of frames rendered
+
+        Example:
+            >>> buf = np.empty(512 * chuck.output_channels, dtype=np.float32)
+            >>> while playing:
+            ...     chuck.run_into(buf)
+            ...     stream.write(buf)
+        """
+        if self._out_channels == 0:
+            raise ValueError("run_into() requires at least one output channel")
+        num_frames = len(output) // self._out_channels
+        try:
+            self._render(num_frames, output, input)
+        except TypeError:
+            out = np.asarray(output)
+            direct = out.dtype == np.float32 and out.flags.c_contiguous
+            if direct or out.ndim != 1 or not out.flags.writeable:
+                raise
+            out[: num_frames * self._out_channels] = self._render(
+                num_frames, None, input
+            )
+        return num_frames
+
+    def specialize(
+        self,
+        block_frames: int = 128,
+        input: NDArray[np.float32] | None = None,
+    ) -> Callable[[], NDArray[np.float32]]:
+        """Return a zero-argument renderer for a fixed block size.
+
+        The block size, output buffer and input buffer are bound once, so
+        each call goes straight to the extension with no argument handling
+        or size arithmetic: suited to a real-time callback that always
+        asks for the same number of frames.
+
+        Args:
+            block_frames: Frames rendered per call (128 is a common real-time size)
+            input: Input buffer of block_frames * input_channels samples to
+                read on every call (refill it in place), or None for silence
+
+        Returns:
+            Callable rendering one block and returning the output buffer,
+            which is reused and overwritten by the next call
+
+        Raises:
+            ValueError: If block_frames is not positive or input has the wrong size
+
+        Example:
+            >>> run_block = chuck.specialize(128)
+            >>> def callback(outdata, frames, time, status):
+            ...     outdata[:] = run_block().reshape(frames, -1)
+        """
+        if block_frames <= 0:
+            raise ValueError("block_frames must be positive")
+        if input is not None and input.size != block_frames * self._in_channels:
+            raise ValueError(
+                f"input must have {block_frames * self._in_channels} samples, "
+                f"got {input.size}"
+            )
+        output = np.empty(block_frames * self._out_channels, dtype=np.float32)
+
+        def run_block(
+            _render: Callable[..., NDArray[np.float32]] = self._render,
+            _num_frames: int = block_frames,
+            _output: NDArray[np.float32] = output,
+            _input: NDArray[np.float32] | None = input,
+        ) -> NDArray[np.float32]:
+            return _render(_num_frames, _output, _input)
+
+        return run_block
+
+    def stream(
+        self, block_frames: int, total_frames: int
+    ) -> Iterator[NDArray[np.float32]]:
+        """Render total_frames of audio as a sequence of blocks.
+
+        Every block is rendered into the same buffer, allocated once per
+        stream, so long renders don't allocate per block. Each yielded array
+        is overwritten by the next one: copy it if you need to keep it.
+        The last block is shorter if total_frames isn't a multiple of
+        block_frames.
+
+        Args:
+            block_frames: Frames per yielded block
+            total_frames: Total number of frames to render
+
+        Returns:
+            Iterator of interleaved output blocks
+
+        Raises:
+            ValueError: If block_frames is not positive or total_frames is negative
+
+        Example:
+            >>> for block in chuck.stream(512, 44100 * 10):
+            ...     wav.writeframes(block.tobytes())
+        """
+        if block_frames <= 0:
+            raise ValueError("block_frames must be positive")
+        if total_frames < 0:
+            raise ValueError("total_frames must not be negative")
+        return self._stream(block_frames, total_frames)
+
+    def _stream(
+        self, block_frames: int, total_frames: int
+    ) -> Iterator[NDArray[np.float32]]:
+        """Generator behind stream(), so argument errors raise immediately."""
+        render = self._render
+        out = np.empty(block_frames * self._out_channels, dtype=np.float32)
+        for _ in range(total_frames // block_frames):
+            yield render(block_frames, out)
+        tail = total_frames % block_frames
+        if tail:
+            yield render(tail, out[: tail * self._out_channels])
+
+    def render_offline(
+        self, total_frames: int, chunk_frames: int = 65536
+    ) -> NDArray[np.float32]:
+        """Render total_frames of audio into a single array as fast as possible.
+
+        The output is allocated once and the VM writes each chunk straight
+        into its slice of it. Larger chunks mean fewer calls into the
+        extension; offline, the default is usually best.
+
+        Args:
+            total_frames: Total number of frames to render
+            chunk_frames: Frames rendered per call into the VM
+
+        Returns:
+            Output audio as numpy array (total_frames * output_channels,)
+
+        Raises:
+            ValueError: If chunk_frames is not positive or total_frames is negative
+
+        Example:
+            >>> audio = chuck.render_offline(chuck.sample_rate * 60)
+        """
+        if chunk_frames <= 0:
+            raise ValueError("chunk_frames must be positive")
+        if total_frames < 0:
+            raise ValueError("total_frames must not be negative")
+        render = self._render
+        channels = self._out_channels
+        out = np.empty(total_frames * channels, dtype=np.float32)
+        for start in range(0, total_frames, chunk_frames):
+            frames = min(chunk_frames, total_frames - start)
+            render(frames, out[start * channels : (start + frames) * channels])
+        return out
+
+    @classmethod
+    def render_many(
+        cls,
+        scripts: Sequence[str],
+        num_frames: int,
+        workers: int | None = None,
+        **kwargs: Any,
+    ) -> list[NDArray[np.float32]]:
+        """Render several ChucK programs offline in parallel.
+
+        Each script gets its own Chuck instance on a worker thread, closed
+        once its script is rendered. The VM runs with the GIL released, so
+        renders proceed concurrently.
+
+        Args:
+            scripts: ChucK source code, one program per output
+            num_frames: Number of frames to render for each script
+            workers: Maximum number of worker threads (default: executor default)
+            **kwargs: Constructor arguments for each instance (e.g. sample_rate)
+
+        Returns:
+            Rendered audio for each script, in the order given
+
+        Raises:
+            RuntimeError: If a script fails to compile
+
+        Example:
+            >>> presets = [f"SinOsc s => dac; {f} => s.freq; 1::second => now;"
+            ...            for f in (220, 440, 880)]
+            >>> outputs = Chuck.render_many(presets, 44100, workers=3)
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def render_one(item: tuple[int, str]) -> NDArray[np.float32]:
+            index, code = item
+            with cls(**kwargs) as chuck:
+                success, _ = chuck.compile(code)
+                if not success:
+                    raise RuntimeError(f"Failed to compile script {index}")
+                return chuck.render_offline(num_frames)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(render_one, enumerate(scripts)))
 
     def advance(self, num_frames: int) -> None:
         """Advance the VM by a number of frames without returning audio.
 
         Use when you only need to trigger callbacks or advance time,
-        and don't need the audio output.
+        and don't need the audio output. The VM renders into an internal
+        scratch block in the extension, so no output array is allocated,
+        returned or converted.
 
         Args:
             num_frames: Number of audio frames to compute
@@ -262,11 +728,154 @@ class Chuck:
             >>> chuck.get_int_async("myVar", lambda v: print(v))
             >>> chuck.advance(256)  # triggers callback
         """
-        in_channels = self.input_channels
-        out_channels = self.output_channels
-        input_buf = np.zeros(num_frames * in_channels, dtype=np.float32)
-        output_buf = np.zeros(num_frames * out_channels, dtype=np.float32)
-        self._chuck.run(input_buf, output_buf, num_frames)
+        self._chuck.advance(num_frames)
+
+    def run_planar(
+        self, num_frames: int, *, input: NDArray[np.float32] | None = None
+    ) -> NDArray[np.float32]:
+        """Run the VM and return the output as one row per channel.
+
+        The extension renders straight into a preallocated
+        ``(output_channels, num_frames)`` array, converting to and from the
+        VM's interleaved layout in the same call, so each channel is a
+        contiguous row ready for per-channel processing.
+
+        Args:
+            num_frames: Number of audio frames to compute
+            input: Planar input of shape (input_channels, num_frames), or
+                None for silence
+
+        Returns:
+            Planar output of shape (output_channels, num_frames). The array
+            is reused and overwritten by the next run_planar() call.
+
+        Example:
+            >>> left, right = chuck.run_planar(512)
+        """
+        planar = self._planar_buf
+        if planar is None or planar.shape[1] != num_frames:
+            planar = np.empty((self._out_channels, num_frames), dtype=np.float32)
+            self._planar_buf = planar
+        self._chuck.render_planar(planar, input)
+        return planar
+
+    def attach_input_ring(self, ring: _numchuck.AudioRing | None) -> None:
+        """Attach a ring that run_ring() reads VM input from (None detaches).
+
+        A producer thread (e.g. a microphone callback) writes interleaved
+        frames into the ring while run_ring() drains it, with no locking or
+        per-block arrays crossing into the extension.
+
+        Raises:
+            ValueError: If the ring's channel count doesn't match input_channels
+        """
+        if ring is not None and ring.channels != self._in_channels:
+            raise ValueError(
+                f"ring has {ring.channels} channels, expected {self._in_channels}"
+            )
+        self._input_ring = ring
+
+    def attach_output_ring(self, ring: _numchuck.AudioRing | None) -> None:
+        """Attach a ring that run_ring() writes VM output to (None detaches).
+
+        Raises:
+            ValueError: If the ring's channel count doesn't match output_channels
+        """
+        if ring is not None and ring.channels != self._out_channels:
+            raise ValueError(
+                f"ring has {ring.channels} channels, expected {self._out_channels}"
+            )
+        self._output_ring = ring
+
+    def run_ring(self, num_frames: int) -> int:
+        """Run the VM, moving audio through the attached rings in C++.
+
+        Input frames the producer hasn't supplied yet are treated as silence;
+        output frames that don't fit in a full output ring are dropped.
+
+        Args:
+            num_frames: Number of audio frames to compute
+
+        Returns:
+            Number of frames written to the output ring (0 if none attached)
+
+        Example:
+            >>> ring = numchuck.AudioRing(4096, chuck.input_channels)
+            >>> chuck.attach_input_ring(ring)
+            >>> # producer thread: ring.write(block)
+            >>> chuck.run_ring(512)
+        """
+        return self._chuck.render_ring(num_frames, self._input_ring, self._output_ring)
+
+    def output_memoryview(self, num_frames: int) -> memoryview:
+        """Return a memoryview of the internal output buffer.
+
+        The view has format ``'f'`` and shape ``(num_frames,
+        output_channels)`` and is filled by ``run(num_frames, reuse=True)``,
+        so buffer-protocol consumers can read rendered audio without an
+        intermediate NumPy copy.
+
+        The view is only valid until the internal buffer grows: a later
+        ``run(n, reuse=True)`` or ``output_memoryview(n)`` with ``n`` larger
+        than any size used before reallocates it, and the old view then
+        keeps showing stale samples. Smaller sizes reuse the same memory.
+        Create the view at the largest block size you will render.
+
+        Example:
+            >>> view = chuck.output_memoryview(512)
+            >>> def callback(outdata, frames, time, status):
+            ...     chuck.run(frames, reuse=True)
+            ...     outdata[:] = view
+        """
+        buf = self._ensure_reuse(num_frames)
+        return memoryview(buf.reshape(num_frames, self._out_channels))
+
+    def input_memoryview(self, num_frames: int) -> memoryview:
+        """Return a writable memoryview of the internal input buffer.
+
+        The view has format ``'f'`` and shape ``(num_frames,
+        input_channels)``. Once it exists, ``run(num_frames, reuse=True)``
+        reads its input from this buffer, so captured audio can be written
+        straight into it. The buffer starts out silent.
+
+        As with output_memoryview(), the view is only valid until a larger
+        ``num_frames`` grows the buffer; after that, writes to the old view
+        no longer reach the VM. Create it at the largest block size you
+        will render.
+
+        Example:
+            >>> view = chuck.input_memoryview(512)
+            >>> view[:] = mic_block  # e.g. from a sounddevice input callback
+            >>> out = chuck.run(512, reuse=True)
+        """
+        buf = self._ensure_reuse_input(num_frames)
+        return memoryview(buf.reshape(num_frames, self._in_channels))
+
+    def _ensure_reuse_input(self, num_frames: int) -> NDArray[np.float32]:
+        """Return the internal input buffer for num_frames (grown, not cleared)."""
+        needed = num_frames * self._in_channels
+        storage = self._reuse_input_storage
+        if storage.size < needed:
+            grown = _aligned_empty(needed)
+            grown[: storage.size] = storage
+            grown[storage.size :] = 0.0
+            self._reuse_input_storage = storage = grown
+        return storage[:needed]
+
+    def _ensure_reuse(self, num_frames: int) -> NDArray[np.float32]:
+        """Return the internal output buffer for num_frames.
+
+        The buffer is a view of storage that only grows, so switching sizes
+        (e.g. run(1, reuse=True) between run(512, reuse=True) calls) rarely allocates.
+        Repeated calls with the same size return the same array object.
+        """
+        if num_frames != self._reuse_num_frames or self._reuse_output_buf is None:
+            needed = num_frames * self._out_channels
+            if self._reuse_storage.size < needed:
+                self._reuse_storage = _aligned_empty(needed)
+            self._reuse_output_buf = self._reuse_storage[:needed]
+            self._reuse_num_frames = num_frames
+        return self._reuse_output_buf
 
     # -------------------------------------------------------------------------
     # Audio parameters (read-only after init)
@@ -275,99 +884,97 @@ class Chuck:
     @property
     def sample_rate(self) -> int:
         """Audio sample rate in Hz."""
-        return self._chuck.get_param_int(_numchuck.PARAM_SAMPLE_RATE)
+        return self._get_param_int(PARAM_SAMPLE_RATE)
 
     @property
     def input_channels(self) -> int:
         """Number of audio input channels."""
-        return self._chuck.get_param_int(_numchuck.PARAM_INPUT_CHANNELS)
+        return self._in_channels
 
     @property
     def output_channels(self) -> int:
         """Number of audio output channels."""
-        return self._chuck.get_param_int(_numchuck.PARAM_OUTPUT_CHANNELS)
+        return self._out_channels
 
     @property
     def working_directory(self) -> str:
         """Working directory for file operations."""
-        return self._chuck.get_param_string(_numchuck.PARAM_WORKING_DIRECTORY)
+        return self._chuck.get_param_string(PARAM_WORKING_DIRECTORY)
 
     @property
     def version(self) -> str:
         """ChucK version string (read-only)."""
-        return self._chuck.get_param_string(_numchuck.PARAM_VERSION)
+        return self._chuck.get_param_string(PARAM_VERSION)
 
     @property
     def chugin_enable(self) -> bool:
         """Whether chugin loading is enabled."""
-        return bool(self._chuck.get_param_int(_numchuck.PARAM_CHUGIN_ENABLE))
+        return bool(self._get_param_int(PARAM_CHUGIN_ENABLE))
 
     @property
     def vm_adaptive(self) -> bool:
         """Whether adaptive VM timing is enabled."""
-        return bool(self._chuck.get_param_int(_numchuck.PARAM_VM_ADAPTIVE))
+        return bool(self._get_param_int(PARAM_VM_ADAPTIVE))
 
     @property
     def vm_halt(self) -> bool:
         """Whether VM halts when no shreds remain."""
-        return bool(self._chuck.get_param_int(_numchuck.PARAM_VM_HALT))
+        return bool(self._get_param_int(PARAM_VM_HALT))
 
     @property
     def auto_depend(self) -> bool:
         """Whether automatic dependency resolution is enabled."""
-        return bool(self._chuck.get_param_int(_numchuck.PARAM_AUTO_DEPEND))
+        return bool(self._get_param_int(PARAM_AUTO_DEPEND))
 
     @property
     def deprecate_level(self) -> int:
         """Deprecation warning level (0=none, 1=warn, 2=error)."""
-        return self._chuck.get_param_int(_numchuck.PARAM_DEPRECATE_LEVEL)
+        return self._get_param_int(PARAM_DEPRECATE_LEVEL)
 
     @property
     def dump_instructions(self) -> bool:
         """Whether VM instruction dumping is enabled."""
-        return bool(self._chuck.get_param_int(_numchuck.PARAM_DUMP_INSTRUCTIONS))
+        return bool(self._get_param_int(PARAM_DUMP_INSTRUCTIONS))
 
     @property
     def otf_enable(self) -> bool:
         """Whether on-the-fly programming is enabled."""
-        return bool(self._chuck.get_param_int(_numchuck.PARAM_OTF_ENABLE))
+        return bool(self._get_param_int(PARAM_OTF_ENABLE))
 
     @property
     def otf_port(self) -> int:
         """Port for on-the-fly programming."""
-        return self._chuck.get_param_int(_numchuck.PARAM_OTF_PORT)
+        return self._get_param_int(PARAM_OTF_PORT)
 
     @property
     def tty_color(self) -> bool:
         """Whether colored terminal output is enabled."""
-        return bool(self._chuck.get_param_int(_numchuck.PARAM_TTY_COLOR))
+        return bool(self._get_param_int(PARAM_TTY_COLOR))
 
     @property
     def tty_width_hint(self) -> int:
         """Terminal width hint for formatting."""
-        return self._chuck.get_param_int(_numchuck.PARAM_TTY_WIDTH_HINT)
+        return self._get_param_int(PARAM_TTY_WIDTH_HINT)
 
     @property
     def user_chugins(self) -> list[str]:
         """List of user chugin paths."""
-        return self._chuck.get_param_string_list(_numchuck.PARAM_USER_CHUGINS)
+        return self._chuck.get_param_string_list(PARAM_USER_CHUGINS)
 
     @property
     def compiler_highlight_on_error(self) -> bool:
         """Whether syntax highlighting in error messages is enabled."""
-        return bool(
-            self._chuck.get_param_int(_numchuck.PARAM_COMPILER_HIGHLIGHT_ON_ERROR)
-        )
+        return bool(self._get_param_int(PARAM_COMPILER_HIGHLIGHT_ON_ERROR))
 
     @property
     def is_realtime_audio_hint(self) -> bool:
         """Hint for real-time audio mode."""
-        return bool(self._chuck.get_param_int(_numchuck.PARAM_IS_REALTIME_AUDIO_HINT))
+        return bool(self._get_param_int(PARAM_IS_REALTIME_AUDIO_HINT))
 
     @property
     def otf_print_warnings(self) -> bool:
         """Whether on-the-fly compiler warnings are printed."""
-        return bool(self._chuck.get_param_int(_numchuck.PARAM_OTF_PRINT_WARNINGS))
+        return bool(self._get_param_int(PARAM_OTF_PRINT_WARNINGS))
 
     # -------------------------------------------------------------------------
     # Shred management
@@ -415,6 +1022,7 @@ class Chuck:
             Not thread-safe during real-time audio playback.
             Call stop_audio() before clearing the VM.
         """
+        self._code_cache.clear()
         self._chuck.clear_vm()
 
     def reset_id(self) -> None:
@@ -427,51 +1035,61 @@ class Chuck:
 
     def set_int(self, name: str, value: int) -> None:
         """Set a global int variable."""
-        self._chuck.set_global_int(name, value)
+        handle = self._int_handles.get(name)
+        if handle is None:
+            handle = self._int_handles[name] = self._chuck.global_int_handle(name)
+        handle.value = value
 
     def get_int(self, name: str, run_frames: int = 256) -> int:
         """Get a global int variable.
 
+        The value is read directly from the VM without advancing time. While
+        real-time audio is running, it falls back to a callback request.
+
         Args:
             name: Variable name
-            run_frames: Number of frames to run for callback to execute
+            run_frames: Maximum number of frames to run for the callback to
+                execute (fallback path only)
 
         Returns:
             The variable value
         """
-        result: list[int] = []
-        self._chuck.get_global_int(name, lambda v: result.append(v))
-        self.run(run_frames)
-        if not result:
-            raise RuntimeError(
-                f"Failed to get global int '{name}' - callback not invoked. "
-                f"Try increasing run_frames (currently {run_frames})."
-            )
-        return result[0]
+        handle = self._int_handles.get(name)
+        if handle is None:
+            handle = self._int_handles[name] = self._chuck.global_int_handle(name)
+        value = handle.value
+        if value is not None:
+            return value
+        return self._get_global(self._chuck.get_global_int, "int", name, run_frames)
 
     def set_float(self, name: str, value: float) -> None:
         """Set a global float variable."""
-        self._chuck.set_global_float(name, value)
+        handle = self._float_handles.get(name)
+        if handle is None:
+            handle = self._float_handles[name] = self._chuck.global_float_handle(name)
+        handle.value = value
 
     def get_float(self, name: str, run_frames: int = 256) -> float:
         """Get a global float variable.
 
+        The value is read directly from the VM without advancing time. While
+        real-time audio is running, it falls back to a callback request.
+
         Args:
             name: Variable name
-            run_frames: Number of frames to run for callback to execute
+            run_frames: Maximum number of frames to run for the callback to
+                execute (fallback path only)
 
         Returns:
             The variable value
         """
-        result: list[float] = []
-        self._chuck.get_global_float(name, lambda v: result.append(v))
-        self.run(run_frames)
-        if not result:
-            raise RuntimeError(
-                f"Failed to get global float '{name}' - callback not invoked. "
-                f"Try increasing run_frames (currently {run_frames})."
-            )
-        return result[0]
+        handle = self._float_handles.get(name)
+        if handle is None:
+            handle = self._float_handles[name] = self._chuck.global_float_handle(name)
+        value = handle.value
+        if value is not None:
+            return value
+        return self._get_global(self._chuck.get_global_float, "float", name, run_frames)
 
     def set_string(self, name: str, value: str) -> None:
         """Set a global string variable."""
@@ -480,22 +1098,175 @@ class Chuck:
     def get_string(self, name: str, run_frames: int = 256) -> str:
         """Get a global string variable.
 
+        The value is read directly from the VM without advancing time. While
+        real-time audio is running, it falls back to a callback request.
+
         Args:
             name: Variable name
-            run_frames: Number of frames to run for callback to execute
+            run_frames: Maximum number of frames to run for the callback to
+                execute (fallback path only)
 
         Returns:
             The variable value
         """
-        result: list[str] = []
-        self._chuck.get_global_string(name, lambda v: result.append(v))
-        self.run(run_frames)
-        if not result:
+        value = self._chuck.get_global_string_sync(name)
+        if value is not None:
+            return value
+        return self._get_global(
+            self._chuck.get_global_string, "string", name, run_frames
+        )
+
+    def _get_global(
+        self,
+        getter: Callable[[str, Callable[[Any], None]], None],
+        kind: str,
+        name: str,
+        run_frames: int,
+    ) -> Any:
+        """Request a global via `getter` and run the VM until it is delivered.
+
+        Get requests are answered at the start of the VM's next tick, so a
+        single frame is normally enough; the remainder of `run_frames` is
+        only computed if the value still hasn't arrived.
+        """
+        slot = self._get_slot
+        slot[0] = _MISSING
+        getter(name, self._store)
+        if slot[0] is _MISSING:
+            self.advance(1)
+            if slot[0] is _MISSING and run_frames > 1:
+                self.advance(run_frames - 1)
+        value = slot[0]
+        if value is _MISSING:
             raise RuntimeError(
-                f"Failed to get global string '{name}' - callback not invoked. "
+                f"Failed to get global {kind} '{name}' - callback not invoked. "
                 f"Try increasing run_frames (currently {run_frames})."
             )
-        return result[0]
+        return value
+
+    def get_globals(
+        self, names: dict[str, type], run_frames: int = 256
+    ) -> dict[str, Any]:
+        """Get several global variables at once.
+
+        Values are read directly from the VM without advancing time. While
+        real-time audio is running, all names are requested together and
+        collected by a single VM advance rather than one per variable.
+
+        Args:
+            names: Mapping of variable name to its type (int, float or str)
+            run_frames: Maximum number of frames to run for the callbacks to
+                execute (fallback path only)
+
+        Returns:
+            Mapping of variable name to value
+
+        Raises:
+            TypeError: If a type is not int, float or str
+
+        Example:
+            >>> chuck.get_globals({"freq": float, "count": int, "label": str})
+            {'freq': 440.0, 'count': 3, 'label': 'lead'}
+        """
+        chuck = self._chuck
+        results: dict[str, Any] = {}
+        pending: list[tuple[str, str, str]] = []
+        for name, typ in names.items():
+            try:
+                kind, sync_getter, async_getter = _GLOBAL_GETTERS[typ]
+            except KeyError:
+                raise TypeError(
+                    f"unsupported type for global '{name}': {typ!r} "
+                    "(expected int, float or str)"
+                ) from None
+            value = getattr(chuck, sync_getter)(name)
+            if value is None:
+                pending.append((name, kind, async_getter))
+            else:
+                results[name] = value
+        if not pending:
+            return results
+
+        # Real-time audio owns the VM: request everything, then advance once
+        for name, _kind, async_getter in pending:
+            getattr(chuck, async_getter)(
+                name, lambda value, _name=name: results.__setitem__(_name, value)
+            )
+        self.advance(1)
+        if len(results) < len(names) and run_frames > 1:
+            self.advance(run_frames - 1)
+        for name, kind, _async_getter in pending:
+            if name not in results:
+                raise RuntimeError(
+                    f"Failed to get global {kind} '{name}' - callback not invoked. "
+                    f"Try increasing run_frames (currently {run_frames})."
+                )
+        return results
+
+    def bind_meter(self, name: str, kind: type = float) -> _numchuck.GlobalMeter:
+        """Bind a lock-free meter to a global int or float.
+
+        After every rendered block, including real-time audio blocks, the
+        thread running the VM copies the global into the meter. Reading
+        ``meter.value`` is then a plain atomic load: no callback, no VM
+        advance, and no waiting on the audio thread, so UI code can poll
+        it at any rate. The meter stops updating when it is garbage
+        collected, or the instance is closed or cleared.
+
+        Args:
+            name: Variable name
+            kind: int or float
+
+        Returns:
+            Meter whose ``value`` is the global as of the last block
+
+        Raises:
+            TypeError: If kind is not int or float
+            RuntimeError: If real-time audio is already running this instance
+
+        Example:
+            >>> level = chuck.bind_meter("level")
+            >>> chuck.run(512)
+            >>> level.value
+            0.42
+        """
+        if kind is float:
+            return self._chuck.bind_global_float_meter(name)
+        if kind is int:
+            return self._chuck.bind_global_int_meter(name)
+        raise TypeError(f"unsupported meter type {kind!r} (expected int or float)")
+
+    def global_handle(self, name: str, kind: type = int) -> _numchuck.GlobalHandle:
+        """Resolve a global int or float once for fast repeated access.
+
+        ``handle.value`` reads and writes the global through a pointer into
+        the VM, skipping the by-name lookup of get_int() / set_int(). Writes
+        take effect immediately; during real-time audio they are queued and
+        reads return None. Access waits for a render of this instance on
+        another thread to finish. The global is created if it does not
+        exist yet.
+
+        Args:
+            name: Variable name
+            kind: int or float
+
+        Returns:
+            Handle whose ``value`` is the global's current value
+
+        Raises:
+            TypeError: If kind is not int or float
+
+        Example:
+            >>> freq = chuck.global_handle("freq", float)
+            >>> for f in (220.0, 440.0):
+            ...     freq.value = f
+            ...     chuck.run(512)
+        """
+        if kind is float:
+            return self._chuck.global_float_handle(name)
+        if kind is int:
+            return self._chuck.global_int_handle(name)
+        raise TypeError(f"unsupported handle type {kind!r} (expected int or float)")
 
     def get_int_async(self, name: str, callback: Callable[[int], None]) -> None:
         """Get a global int variable asynchronously.
@@ -150,11 +150,9 @@ def cmd_run(args):
 
 def cmd_version(args):
     """Show version information."""
-    from .._numchuck import version
-    from .._version import __version__
+    from .version import format_version
 
-    print(f"numchuck version: {__version__}")
-    print(f"ChucK version: {version()}")
+    print(format_version())
 
 
 def cmd_info(args):
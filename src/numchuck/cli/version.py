@@ -0,0 +1,14 @@
+"""
+Version text for the numchuck CLI.
+
+Kept apart from cli.main so `python -m numchuck version` can print it
+without importing argparse or the command handlers.
+"""
+
+
+def format_version():
+    """Return the text printed by the version command."""
+    from .._numchuck import version
+    from .._version import __version__
+
+    return f"numchuck version: {__version__}\nChucK version: {version()}"
@@ -0,0 +1,107 @@
+"""
+Post-processing helpers for audio returned by Chuck.run().
+
+Gain, metering and mixing over float32 blocks, compiled with Numba when it
+is installed (``pip install numchuck[dsp]``) and falling back to NumPy
+otherwise. The in-place functions modify the buffer they are given, so they
+compose with ``run(..., reuse=True)`` and ``run_into()`` without allocating.
+
+Example:
+    >>> from numchuck import Chuck, dsp
+    >>> chuck = Chuck()
+    >>> out = chuck.run(512)
+    >>> dsp.apply_gain(out, 0.5)
+    >>> level = dsp.peak(out)
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+__all__ = ["HAVE_NUMBA", "apply_gain", "mix_into", "peak", "rms"]
+
+HAVE_NUMBA = njit is not None
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _gain(buf, gain):
+        for i in range(buf.size):
+            buf[i] *= gain
+
+    @njit(cache=True, fastmath=True)
+    def _peak(buf):
+        level = 0.0
+        for i in range(buf.size):
+            level = max(level, abs(buf[i]))
+        return level
+
+    @njit(cache=True, fastmath=True)
+    def _sum_squares(buf):
+        total = 0.0
+        for i in range(buf.size):
+            total += float(buf[i]) * float(buf[i])
+        return total
+
+    @njit(cache=True, fastmath=True)
+    def _mix(dst, src, gain):
+        for i in range(dst.size):
+            dst[i] += src[i] * gain
+
+else:
+
+    def _gain(buf, gain):
+        buf *= gain
+
+    def _peak(buf):
+        return max(float(buf.max()), -float(buf.min())) if buf.size else 0.0
+
+    def _sum_squares(buf):
+        return float(np.dot(buf, buf))
+
+    def _mix(dst, src, gain):
+        dst += src if gain == 1.0 else src * gain
+
+
+def _flat(buf: NDArray[np.float32], name: str) -> NDArray[np.float32]:
+    """Return a 1-D view of a C-contiguous buffer (never a copy)."""
+    if not buf.flags.c_contiguous:
+        raise ValueError(f"{name} must be C-contiguous")
+    return buf.reshape(-1)
+
+
+def apply_gain(buf: NDArray[np.float32], gain: float) -> None:
+    """Scale a buffer in place by a linear gain."""
+    _gain(_flat(buf, "buf"), np.float32(gain))
+
+
+def peak(buf: NDArray[np.float32]) -> float:
+    """Return the peak absolute sample value of a buffer."""
+    return float(_peak(_flat(buf, "buf")))
+
+
+def rms(buf: NDArray[np.float32]) -> float:
+    """Return the root-mean-square level of a buffer (0.0 if empty)."""
+    flat = _flat(buf, "buf")
+    if flat.size == 0:
+        return 0.0
+    return float(np.sqrt(_sum_squares(flat) / flat.size))
+
+
+def mix_into(
+    dst: NDArray[np.float32], src: NDArray[np.float32], gain: float = 1.0
+) -> None:
+    """Add ``src * gain`` into ``dst`` in place.
+
+    Raises:
+        ValueError: If the buffers differ in size
+    """
+    if dst.size != src.size:
+        raise ValueError(f"size mismatch: dst has {dst.size}, src has {src.size}")
+    _mix(_flat(dst, "dst"), np.ravel(src), np.float32(gain))
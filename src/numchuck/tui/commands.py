@@ -291,8 +291,8 @@ class CommandExecutor:
             return f"Shred {shred_id} not found"
 
         shred_info = self.session.shreds[shred_id]
-        source = shred_info["source"]
-        shred_type = shred_info["type"]
+        source = shred_info.source
+        shred_type = shred_info.type
 
         # Get editor from environment or use default
         editor = os.environ.get("EDITOR", "nano")
@@ -319,7 +319,7 @@ class CommandExecutor:
                         self.session.replace_shred(shred_id, new_code)
 
                     self.session.remove_shred(shred_id)
-                    name = shred_info["name"]
+                    name = shred_info.name
                     self.session.add_shred(
                         new_id, name, content=new_code, shred_type=shred_type
                     )
@@ -8,8 +8,12 @@ Provides base class with common functionality:
 - Common key bindings
 """
 
-from pathlib import Path
+import os
+from collections import deque
+from functools import lru_cache
+from typing import Optional, Union
 
+from prompt_toolkit.document import Document
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.layout.containers import ConditionalContainer, Window
 from prompt_toolkit.layout.controls import FormattedTextControl
@@ -20,6 +24,38 @@ from prompt_toolkit.widgets import TextArea
 from .._numchuck import ChucK, PARAM_SAMPLE_RATE
 from .session import ChuckSession
 
+# Minimum delay between log-triggered redraws (caps them at ~60/sec)
+LOG_FLUSH_INTERVAL = 1 / 60
+
+# Keys bound by get_common_key_bindings() -> ChuckApplication handler method
+_COMMON_KEY_BINDINGS = (
+    ("c-q", "exit_app"),
+    ("f1", "toggle_help"),
+    ("f2", "toggle_shreds"),
+    ("f3", "toggle_log"),
+)
+
+# Shreds table header and separator lines, built once
+_HEADER_PIPES = (
+    "ID   | Name                                                    | Elapsed",
+    "-" * 78,
+)
+_HEADER_SPACES = (
+    "ID    Name                                                    Elapsed",
+    "\u2500" * 78,  # Unicode box drawing character
+)
+
+# Shreds table column separators (rows are padded with str.ljust, which is
+# cheaper per row than format-spec padding)
+_SEP_PIPES = " | "
+_SEP_SPACES = " "
+
+
+@lru_cache(maxsize=4096)
+def _format_tenths(tenths: int) -> str:
+    """Format a sub-minute time given in tenths of a second, e.g. 52 -> '5.2s'."""
+    return f"{tenths / 10:.1f}s"
+
 
 def format_elapsed_time(elapsed_sec: float) -> str:
     """Format elapsed time in human-readable format.
@@ -31,6 +67,12 @@ def format_elapsed_time(elapsed_sec: float) -> str:
         Formatted string like "5.2s", "2m30.5s", or "1h05m"
     """
     if elapsed_sec < 60:
+        # Most shreds are under a minute old; reuse their formatted strings.
+        # Rounding to tenths here matches :.1f except for negative times and
+        # times within rounding error of a tie, which are formatted directly.
+        scaled = elapsed_sec * 10
+        if scaled > 0 and abs(scaled % 1 - 0.5) > 1e-6:
+            return _format_tenths(int(scaled + 0.5))
         return f"{elapsed_sec:.1f}s"
     elif elapsed_sec < 3600:
         mins = int(elapsed_sec / 60)
@@ -42,9 +84,13 @@ def format_elapsed_time(elapsed_sec: float) -> str:
         return f"{hours}h{mins:02d}m"
 
 
+@lru_cache(maxsize=512)
 def format_shred_name(full_name: str, max_len: int = 56) -> str:
     """Format shred name for display, showing parent/filename.
 
+    Results are cached, since the shreds table reformats the same names on
+    every redraw.
+
     Args:
         full_name: Full path or name of the shred
         max_len: Maximum length for the name
@@ -52,28 +98,50 @@ def format_shred_name(full_name: str, max_len: int = 56) -> str:
     Returns:
         Formatted name truncated to max_len
     """
-    try:
-        path = Path(full_name)
-        if path.parent.name:
-            name = f"{path.parent.name}/{path.name}"
-        else:
-            name = path.name
-    except (ValueError, TypeError):
-        name = full_name
+    # Plain string splitting; pathlib is far heavier than needed here
+    if os.sep != "/":
+        full_name = full_name.replace(os.sep, "/")
+    head, sep, name = full_name.rstrip("/").rpartition("/")
+    if sep:
+        parent = head.rpartition("/")[2]
+        if parent:
+            name = f"{parent}/{name}"
     return name[:max_len]
 
 
+def probe_sample_rate(chuck, default: int = 44100) -> int:
+    """Query a ChucK instance's sample rate, falling back to default.
+
+    The rate is fixed once the VM is initialized, so callers that render
+    repeatedly should probe once and pass the result along.
+
+    Args:
+        chuck: ChucK instance to query
+        default: Value used if the query fails
+
+    Returns:
+        Sample rate in Hz
+    """
+    try:
+        return chuck.get_param_int(PARAM_SAMPLE_RATE)
+    except (RuntimeError, AttributeError, ValueError):
+        return default
+
+
 def generate_shreds_table(
-    shreds: dict,
+    shreds: Union[dict, list],
     chuck,
     use_pipes: bool = False,
+    sample_rate: Optional[int] = None,
 ) -> str:
     """Generate formatted table of active shreds.
 
     Args:
-        shreds: Dictionary of shred_id -> shred info
+        shreds: Dictionary of shred_id -> Shred, or a list of
+            (shred_id, Shred) pairs already sorted by ID
         chuck: ChucK instance for querying VM time and sample rate
         use_pipes: If True, use pipe separators; if False, use spaces
+        sample_rate: Known VM sample rate, or None to query chuck
 
     Returns:
         Formatted table string
@@ -81,19 +149,12 @@ def generate_shreds_table(
     if not shreds:
         return "No active shreds"
 
-    lines = []
-
-    # Header
     if use_pipes:
-        lines.append(
-            "ID   | Name                                                    | Elapsed"
-        )
-        lines.append("-" * 78)
+        lines = list(_HEADER_PIPES)
+        sep = _SEP_PIPES
     else:
-        lines.append(
-            "ID    Name                                                    Elapsed"
-        )
-        lines.append("\u2500" * 78)  # Unicode box drawing character
+        lines = list(_HEADER_SPACES)
+        sep = _SEP_SPACES
 
     # Get current VM time for elapsed calculation
     try:
@@ -101,25 +162,20 @@ def generate_shreds_table(
     except (RuntimeError, AttributeError):
         current_time = 0.0
 
-    # Get sample rate
-    try:
-        sample_rate = chuck.get_param_int(PARAM_SAMPLE_RATE)
-    except (RuntimeError, AttributeError, ValueError):
-        sample_rate = 44100
+    # Get sample rate, unless the caller already knows it
+    if sample_rate is None:
+        sample_rate = probe_sample_rate(chuck)
 
-    for shred_id, info in sorted(shreds.items()):
-        name = format_shred_name(info["name"])
+    items = sorted(shreds.items()) if isinstance(shreds, dict) else shreds
+    for shred_id, info in items:
+        name = format_shred_name(info.name)
 
         # Calculate elapsed time in seconds
-        spork_time = info.get("time", 0.0)
-        elapsed_samples = current_time - spork_time
+        elapsed_samples = current_time - info.time
         elapsed_sec = elapsed_samples / sample_rate if sample_rate > 0 else 0.0
         time_str = format_elapsed_time(elapsed_sec)
 
-        if use_pipes:
-            lines.append(f"{shred_id:<5d} | {name:<56s} | {time_str}")
-        else:
-            lines.append(f"{shred_id:<5} {name:<56} {time_str}")
+        lines.append(str(shred_id).ljust(5) + sep + name.ljust(56) + sep + time_str)
 
     return "\n".join(lines)
 
@@ -136,37 +192,58 @@ class ChuckApplication:
         self.show_shreds = False
         self.show_log = False
 
-        # Log tracking
-        self.log_messages = []
+        # Log tracking: bounded history, copied into the log window only
+        # when it is shown and has changed
+        self.log_messages = deque(maxlen=1000)
+        # Messages not yet copied into the log window, and the length of
+        # each message the window holds, oldest first
+        self._log_pending = deque(maxlen=self.log_messages.maxlen)
+        self._log_lengths = deque()
+        self._log_dirty = False
+        self._log_flush_scheduled = False
+
+        # Running prompt_toolkit Application, set by the owning UI so log
+        # output can schedule redraws
+        self.app = None
+
+        # Sample rate is fixed once the VM is initialized; read it lazily
+        self._sample_rate = None
+
+        # Last shreds table as ((shreds_version, time_bucket), text)
+        self._table_cache = None
+
+    @property
+    def sample_rate(self):
+        """VM sample rate, cached after init (None before init)."""
+        if self._sample_rate is None and self.chuck.is_init():
+            self._sample_rate = probe_sample_rate(self.chuck)
+        return self._sample_rate
 
     def get_common_key_bindings(self):
         """Common key bindings shared across editor and REPL."""
         kb = KeyBindings()
+        for key, handler in _COMMON_KEY_BINDINGS:
+            kb.add(key)(getattr(self, handler))
+        return kb
 
-        @kb.add("c-q")
-        def exit_app(event):
-            """Exit application"""
-            event.app.exit()
-
-        @kb.add("f1")
-        def toggle_help(event):
-            """Toggle help window"""
-            self.show_help = not self.show_help
-            event.app.invalidate()
-
-        @kb.add("f2")
-        def toggle_shreds(event):
-            """Toggle shreds table"""
-            self.show_shreds = not self.show_shreds
-            event.app.invalidate()
-
-        @kb.add("f3")
-        def toggle_log(event):
-            """Toggle log window"""
-            self.show_log = not self.show_log
-            event.app.invalidate()
+    def exit_app(self, event):
+        """Exit application"""
+        event.app.exit()
 
-        return kb
+    def toggle_help(self, event):
+        """Toggle help window"""
+        self.show_help = not self.show_help
+        event.app.invalidate()
+
+    def toggle_shreds(self, event):
+        """Toggle shreds table"""
+        self.show_shreds = not self.show_shreds
+        event.app.invalidate()
+
+    def toggle_log(self, event):
+        """Toggle log window"""
+        self.show_log = not self.show_log
+        event.app.invalidate()
 
     def create_help_window(self, help_text):
         """Create help window that toggles with F1."""
@@ -189,9 +266,26 @@ class ChuckApplication:
         """Create shreds table that toggles with F2."""
 
         def get_text():
-            return generate_shreds_table(
-                self.session.shreds, self.chuck, use_pipes=True
+            # The table only changes when shreds are added/removed or when
+            # VM time crosses a 0.1s step (the elapsed column's resolution),
+            # so keystroke redraws in between reuse the last text
+            sample_rate = self.sample_rate
+            if sample_rate:
+                key = (
+                    self.session.shreds_version,
+                    int(self.chuck.now() // (sample_rate * 0.1)),
+                )
+                if self._table_cache is not None and self._table_cache[0] == key:
+                    return self._table_cache[1]
+            text = generate_shreds_table(
+                self.session.sorted_shred_items(),
+                self.chuck,
+                use_pipes=True,
+                sample_rate=sample_rate,
             )
+            if sample_rate:
+                self._table_cache = (key, text)
+            return text
 
         return ConditionalContainer(
             Window(content=FormattedTextControl(get_text), height=D(min=5, max=15)),
@@ -202,20 +296,63 @@ class ChuckApplication:
         """Create log window that toggles with F3."""
         log_area = TextArea(text="", scrollbar=True, focusable=False, read_only=True)
 
-        def log_callback(msg):
-            """Callback for ChucK output"""
-            self.log_messages.append(msg)
-            log_area.text += msg
-            if len(self.log_messages) > 1000:
-                # Trim old messages
-                self.log_messages = self.log_messages[-500:]
-                log_area.text = "".join(self.log_messages[-500:])
-
-        # Set ChucK output callbacks
-        self.chuck.set_chout_callback(log_callback)
-        self.chuck.set_cherr_callback(log_callback)
-
-        return ConditionalContainer(log_area, filter=Condition(lambda: self.show_log))
+        def log_visible():
+            # Evaluated on every render: update the text at most once per
+            # frame, and only while the window is visible
+            if self.show_log and self._log_dirty:
+                self._log_dirty = False
+                # popleft() is atomic, so output arriving meanwhile on the
+                # audio thread simply waits for the next frame
+                pending = self._log_pending
+                new = []
+                while pending:
+                    new.append(pending.popleft())
+                # Drop the messages the history has evicted from the front
+                # of the text, and append the new ones
+                lengths = self._log_lengths
+                lengths.extend(map(len, new))
+                evicted = 0
+                while len(lengths) > self.log_messages.maxlen:
+                    evicted += lengths.popleft()
+                text = log_area.text[evicted:] + "".join(new)
+                cursor = min(log_area.buffer.cursor_position, len(text))
+                log_area.document = Document(text, cursor)
+            return self.show_log
+
+        # Route chout and cherr into one sink
+        self.chuck.set_chout_callback(self._log_output)
+        self.chuck.set_cherr_callback(self._log_output)
+
+        return ConditionalContainer(log_area, filter=Condition(log_visible))
+
+    def _log_output(self, msg):
+        """Sink for ChucK chout/cherr output (may run on the audio thread).
+
+        Only records the message; during a burst, every message after the
+        first finds a flush already scheduled and returns straight away.
+        """
+        self.log_messages.append(msg)
+        self._log_pending.append(msg)
+        self._log_dirty = True
+        if not self._log_flush_scheduled:
+            self._schedule_log_flush()
+
+    def _schedule_log_flush(self):
+        """Coalesce log output into one redraw per LOG_FLUSH_INTERVAL."""
+        if self._log_flush_scheduled or not self.show_log:
+            return
+        app = self.app
+        loop = app.loop if app is not None else None
+        if loop is None or loop.is_closed():
+            return
+        self._log_flush_scheduled = True
+        loop.call_soon_threadsafe(loop.call_later, LOG_FLUSH_INTERVAL, self._flush_log)
+
+    def _flush_log(self):
+        """Redraw once for all log output received since the last flush."""
+        self._log_flush_scheduled = False
+        if self._log_dirty and self.show_log and self.app is not None:
+            self.app.invalidate()
 
     def create_status_bar(self, status_text_func):
         """Create status bar at bottom of screen."""
@@ -227,14 +364,17 @@ class ChuckApplication:
 
     def cleanup(self):
         """Cleanup ChucK resources."""
-        try:
-            self.chuck.remove_all_shreds()
-        except (RuntimeError, AttributeError):
-            pass
-
         # Break circular references to allow proper garbage collection
-        if hasattr(self, "session"):
+        if self.session is not None:
             self.session.chuck = None
-            del self.session
-        if hasattr(self, "chuck"):
-            del self.chuck
+            self.session = None
+
+        if self.chuck is not None:
+            try:
+                self.chuck.remove_all_shreds()
+            except (RuntimeError, AttributeError):
+                pass
+            # The extension holds the output sink, which references self
+            self.chuck.set_chout_callback(None)
+            self.chuck.set_cherr_callback(None)
+            self.chuck = None
@@ -203,7 +203,7 @@ class ChuckEditor:
                         self.app_state.session.replace_shred(old_id, tab.content)
 
                     # Update session tracking
-                    self.app_state.session.shreds.pop(old_id, None)
+                    self.app_state.session.remove_shred(old_id)
                     filename = tab.file_path.name if tab.file_path else "untitled.ck"
                     self.app_state.session.add_shred(
                         new_id,
@@ -568,6 +568,7 @@ Versioning: file.ck → file-1.ck (spork) → file-1-1.ck (replace)
             full_screen=True,
             mouse_support=True,
         )
+        self.app_state.app = self.app
 
         try:
             self.app.run()
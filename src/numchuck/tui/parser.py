@@ -1,13 +1,87 @@
 import ast
 import re
 from dataclasses import dataclass
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
+_WORD_CHAR = re.compile(r"\w")
 
-@dataclass
+# Maximum number of parsed commands each CommandParser keeps
+_PARSE_CACHE_SIZE = 256
+
+
+def _first_char(pattern: str) -> Optional[str]:
+    """Return the literal first character of an anchored pattern.
+
+    Returns None if the pattern starts with a group, which in this parser
+    is always a \\w+ capture.
+    """
+    head = pattern[1:]  # skip "^"
+    if head.startswith("("):
+        return None
+    if head.startswith("\\"):
+        return head[1]
+    return head[0]
+
+
+class _ScannedMatch(tuple):
+    """Groups of a _QuotedPattern match, read like a re.Match."""
+
+    def group(self, index):
+        return self[index - 1]
+
+
+class _QuotedPattern:
+    """A pattern ending in a quoted payload, matched without backtracking.
+
+    ``head`` is the regex for everything before the opening quote; the
+    closing quote is found with str.find, so a long or unterminated payload
+    is scanned once. Matches exactly what ``head + '"([^"]+)"$'`` does.
+    """
+
+    def __init__(self, head: str, quote: str):
+        self.head = re.compile(head)
+        self.quote = quote
+
+    def match(self, text: str) -> Optional[_ScannedMatch]:
+        m = self.head.match(text)
+        if m is None:
+            return None
+        start = m.end()
+        if not text.startswith(self.quote, start):
+            return None
+        end = text.find(self.quote, start + 1)
+        # Non-empty payload, and nothing after the closing quote but the
+        # trailing newline "$" allows
+        if end <= start + 1 or text[end + 1 :] not in ("", "\n"):
+            return None
+        return _ScannedMatch(m.groups() + (text[start + 1 : end],))
+
+
+def _compile(pattern: str):
+    """Compile a command pattern, scanning a quoted payload by hand."""
+    for quote in ('"', "'"):
+        tail = f"{quote}([^{quote}]+){quote}$"
+        if pattern.endswith(tail):
+            return _QuotedPattern(pattern[: -len(tail)], quote)
+    return re.compile(pattern)
+
+
+@dataclass(frozen=True)
 class Command:
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = ("args", "type")
+
     type: str
-    args: dict
+    args: Mapping[str, Any]
+
+    def __post_init__(self):
+        # Parsed commands are cached and shared, so their args are read-only
+        object.__setattr__(self, "args", MappingProxyType(self.args))
+
+    def __reduce__(self):
+        # Rebuild through __init__: copy and pickle can't set frozen slots
+        return (Command, (self.type, dict(self.args)))
 
 
 class CommandParser:
@@ -23,7 +97,7 @@ class CommandParser:
             # Shred management (shortcut symbols)
             (r"^\+\s+(.+\.ck)$", self._spork_file),
             (r'^\+\s+"([^"]+)"$', self._spork_code),
-            (r"^\+\s+\'([^\']+)\'$", self._spork_code),
+            (r"^\+\s+'([^']+)'$", self._spork_code),
             (r"^-\s+all$", self._remove_all),
             (r"^-\s*(\d+)$", self._remove_shred),  # Accept "- 1" or "-1"
             (r'^~\s+(\d+)\s+"([^"]+)"$', self._replace_shred),
@@ -58,11 +132,48 @@ class CommandParser:
             (r"^@(\w+)$", self._load_snippet),
         ]
 
+        # Compile each pattern once, tagged with the character its matches
+        # must start with (None for patterns that start with a \w group)
+        self._compiled = [
+            (_first_char(pattern), _compile(pattern), handler)
+            for pattern, handler in self.patterns
+        ]
+        # First character -> candidate patterns, in their original order
+        self._dispatch: dict[str, list] = {}
+        # Input text -> parsed command, so repeated commands skip matching
+        self._cache: dict[str, Command] = {}
+
+    def _candidates(self, first: str) -> list:
+        """Return the patterns that can match text starting with first."""
+        candidates = self._dispatch.get(first)
+        if candidates is None:
+            is_word = _WORD_CHAR.match(first) is not None
+            candidates = [
+                (pattern, handler)
+                for char, pattern, handler in self._compiled
+                if char == first or (char is None and is_word)
+            ]
+            self._dispatch[first] = candidates
+        return candidates
+
     def parse(self, text: str) -> Optional[Command]:
-        for pattern, handler in self.patterns:
-            match = re.match(pattern, text)
+        cmd = self._cache.get(text)
+        if cmd is not None:
+            return cmd
+        if not text:
+            return None
+        for pattern, handler in self._candidates(text[0]):
+            match = pattern.match(text)
             if match:
-                return handler(match)
+                cmd = handler(match)
+                # Cached commands are shared, so only cache immutable args
+                # (a set_global array value is a list the caller may mutate)
+                if not any(isinstance(v, list) for v in cmd.args.values()):
+                    if len(self._cache) >= _PARSE_CACHE_SIZE:
+                        # Evict the oldest entry (dicts keep insertion order)
+                        del self._cache[next(iter(self._cache))]
+                    self._cache[text] = cmd
+                return cmd
 
         # Return None for potential ChucK code (will be handled by REPL)
         # Don't generate error for things that look like ChucK code
@@ -9,19 +9,25 @@ Provides centralized management of user directories and files for:
 - Configuration
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=None)
 def get_numchuck_home() -> Path:
     """
     Get the numchuck home directory (~/.numchuck).
 
+    Computed once per process, like the other fixed paths below.
+
     Returns:
         Path to ~/.numchuck directory
     """
     return Path.home() / ".numchuck"
 
 
+@lru_cache(maxsize=None)
 def get_snippets_dir() -> Path:
     """
     Get the snippets directory (~/.numchuck/snippets).
@@ -35,6 +41,7 @@ def get_snippets_dir() -> Path:
     return get_numchuck_home() / "snippets"
 
 
+@lru_cache(maxsize=None)
 def get_history_file() -> Path:
     """
     Get the REPL history file path (~/.numchuck/history).
@@ -45,6 +52,7 @@ def get_history_file() -> Path:
     return get_numchuck_home() / "history"
 
 
+@lru_cache(maxsize=None)
 def get_sessions_dir() -> Path:
     """
     Get the sessions directory (~/.numchuck/sessions).
@@ -58,6 +66,7 @@ def get_sessions_dir() -> Path:
     return get_numchuck_home() / "sessions"
 
 
+@lru_cache(maxsize=None)
 def get_logs_dir() -> Path:
     """
     Get the logs directory (~/.numchuck/logs).
@@ -71,6 +80,7 @@ def get_logs_dir() -> Path:
     return get_numchuck_home() / "logs"
 
 
+@lru_cache(maxsize=None)
 def get_config_file() -> Path:
     """
     Get the configuration file path (~/.numchuck/config.toml).
@@ -87,6 +97,7 @@ def get_config_file() -> Path:
     return get_numchuck_home() / "config.toml"
 
 
+@lru_cache(maxsize=None)
 def get_projects_dir() -> Path:
     """
     Get the projects directory (~/.numchuck/projects).
@@ -103,6 +114,9 @@ def get_projects_dir() -> Path:
     return get_numchuck_home() / "projects"
 
 
+_directories_ensured = False
+
+
 def ensure_numchuck_directories():
     """
     Ensure all numchuck directories exist.
@@ -112,16 +126,34 @@ def ensure_numchuck_directories():
     - sessions/
     - logs/
     - projects/
+
+    Only the missing ones are created, found with a single scan of
+    ~/.numchuck; later calls in the same process do nothing.
     """
-    # Create main directory
-    numchuck_home = get_numchuck_home()
-    numchuck_home.mkdir(parents=True, exist_ok=True)
+    global _directories_ensured
+    if _directories_ensured:
+        return
 
-    # Create subdirectories
-    get_snippets_dir().mkdir(exist_ok=True)
-    get_sessions_dir().mkdir(exist_ok=True)
-    get_logs_dir().mkdir(exist_ok=True)
-    get_projects_dir().mkdir(exist_ok=True)
+    # Find existing subdirectories, creating the main directory if needed
+    numchuck_home = get_numchuck_home()
+    try:
+        with os.scandir(numchuck_home) as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        numchuck_home.mkdir(parents=True, exist_ok=True)
+        existing = set()
+
+    # Create missing subdirectories
+    for directory in (
+        get_snippets_dir(),
+        get_sessions_dir(),
+        get_logs_dir(),
+        get_projects_dir(),
+    ):
+        if directory.name not in existing:
+            directory.mkdir(exist_ok=True)
+
+    _directories_ensured = True
 
 
 def list_snippets() -> list[str]:
@@ -131,12 +163,17 @@ def list_snippets() -> list[str]:
     Returns:
         List of snippet names (without .ck extension)
     """
-    snippets_dir = get_snippets_dir()
-    if not snippets_dir.exists():
+    # scandir entries carry the file type, so no stat() per entry
+    try:
+        with os.scandir(get_snippets_dir()) as entries:
+            return [
+                entry.name[:-3]
+                for entry in entries
+                if entry.name.endswith(".ck") and entry.is_file()
+            ]
+    except FileNotFoundError:
         return []
 
-    return [f.stem for f in snippets_dir.glob("*.ck")]
-
 
 def get_snippet_path(name: str) -> Path:
     """
@@ -158,12 +195,12 @@ def list_projects() -> list[str]:
     Returns:
         List of project names (directory names in ~/.numchuck/projects/)
     """
-    projects_dir = get_projects_dir()
-    if not projects_dir.exists():
+    try:
+        with os.scandir(get_projects_dir()) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
         return []
 
-    return [d.name for d in projects_dir.iterdir() if d.is_dir()]
-
 
 def create_project(name: str) -> Path:
     """
@@ -1,5 +1,6 @@
 import sys
 import os
+from collections import deque
 from .._numchuck import (
     ChucK,
     stop_audio,
@@ -13,7 +14,7 @@ from .parser import CommandParser
 from .session import REPLSession
 from .commands import CommandExecutor
 from .paths import get_history_file, ensure_numchuck_directories
-from .common import generate_shreds_table
+from .common import generate_shreds_table, probe_sample_rate
 
 
 class ChuckREPL:
@@ -195,15 +196,18 @@ class ChuckREPL:
 
         # Log window visibility and buffer
         self.show_log_window = False
-        self.log_lines = []
         self.max_log_lines = 100  # Keep last 100 messages
+        self.log_lines = deque(maxlen=self.max_log_lines)
+
+        # VM sample rate, read once in setup() after init
+        self.sample_rate = None
 
         # Create topbar content function (simplified to show just IDs)
         def get_topbar_text():
             """Generate topbar content showing active shred IDs"""
             if self.session.shreds:
                 shred_ids = " ".join(
-                    f"[{sid}]" for sid in sorted(self.session.shreds.keys())
+                    f"[{sid}]" for sid in self.session.sorted_shred_ids()
                 )
                 return f"Shreds: {shred_ids}  (F2: table)"
             else:
@@ -267,7 +271,10 @@ OTHER COMMANDS                          KEYBOARD SHORTCUTS
         def get_shreds_table():
             """Generate formatted table of active shreds"""
             return generate_shreds_table(
-                self.session.shreds, self.chuck, use_pipes=False
+                self.session.sorted_shred_items(),
+                self.chuck,
+                use_pipes=False,
+                sample_rate=self.sample_rate,
             )
 
         # Store the shreds table generator function
@@ -519,10 +526,8 @@ OTHER COMMANDS                          KEYBOARD SHORTCUTS
         """Capture ChucK VM messages to log window"""
         msg = msg.rstrip("\n")
         if msg:
+            # Bounded deque drops the oldest message itself
             self.log_lines.append(msg)
-            # Keep only recent messages
-            if len(self.log_lines) > self.max_log_lines:
-                self.log_lines.pop(0)
             # Update the log area
             self.log_area.text = "\n".join(self.log_lines)
             # Scroll to bottom
@@ -539,6 +544,7 @@ OTHER COMMANDS                          KEYBOARD SHORTCUTS
         self.chuck.set_param(PARAM_OUTPUT_CHANNELS, 2)
         self.chuck.set_param(PARAM_INPUT_CHANNELS, 0)
         self.chuck.init()
+        self.sample_rate = probe_sample_rate(self.chuck)
 
         # Capture ChucK output (chout/cherr from user code)
         self.chuck.set_chout_callback(lambda msg: self.add_to_log(f"[out] {msg}"))
@@ -1,15 +1,26 @@
-from typing import Dict, Optional
+from bisect import bisect_left
+from collections import namedtuple
+from typing import Dict, List, Optional, Tuple
 
 from .paths import get_projects_dir
 from .project import Project
 
+# A tracked shred: ChucK shred ID, display name, VM time (samples) when it
+# was sporked, 'code' or 'file', and its source code or file path
+Shred = namedtuple("Shred", "id name time type source", defaults=("code", ""))
+
 
 class ChuckSession:
     """Session managing ChucK instance state with optional project support."""
 
     def __init__(self, chuck, project_name: Optional[str] = None):
         self.chuck = chuck
-        self.shreds: Dict[int, Dict] = {}  # id -> {'name': 'file.ck', 'time': samples}
+        self.shreds: Dict[int, Shred] = {}
+        self.shreds_version = 0  # bumped whenever shreds changes
+
+        # shreds as (id, info) pairs kept sorted by id, for display
+        self._sorted_shred_ids: List[int] = []
+        self._sorted_shred_items: List[Tuple[int, Shred]] = []
         self.audio_running = False
         self.project = None
 
@@ -39,13 +50,18 @@ class ChuckSession:
         except (RuntimeError, AttributeError):
             chuck_time = 0.0
 
-        self.shreds[shred_id] = {
-            "id": shred_id,
-            "name": name,
-            "time": chuck_time,  # ChucK VM time in samples
-            "type": shred_type,  # 'code' or 'file'
-            "source": content or name,  # Store source code or file path
-        }
+        info = Shred(shred_id, name, chuck_time, shred_type, content or name)
+        self.shreds[shred_id] = info
+        self.shreds_version += 1
+
+        # Shred IDs are normally increasing, so this is usually an append
+        ids = self._sorted_shred_ids
+        i = bisect_left(ids, shred_id)
+        if i < len(ids) and ids[i] == shred_id:
+            self._sorted_shred_items[i] = (shred_id, info)
+        else:
+            ids.insert(i, shred_id)
+            self._sorted_shred_items.insert(i, (shred_id, info))
 
         # If we have a project and content, save versioned file
         if self.project and content:
@@ -72,15 +88,30 @@ class ChuckSession:
         """Remove a shred from tracking."""
         if shred_id in self.shreds:
             self.shreds.pop(shred_id)
+            self.shreds_version += 1
+            i = bisect_left(self._sorted_shred_ids, shred_id)
+            del self._sorted_shred_ids[i]
+            del self._sorted_shred_items[i]
 
     def clear_shreds(self):
         """Clear all tracked shreds."""
         self.shreds.clear()
+        self.shreds_version += 1
+        self._sorted_shred_ids.clear()
+        self._sorted_shred_items.clear()
+
+    def sorted_shred_ids(self) -> List[int]:
+        """Get tracked shred IDs in ascending order (do not modify)."""
+        return self._sorted_shred_ids
+
+    def sorted_shred_items(self) -> List[Tuple[int, Shred]]:
+        """Get tracked (shred_id, info) pairs sorted by ID (do not modify)."""
+        return self._sorted_shred_items
 
     def get_shred_name(self, shred_id: int) -> str:
         """Get display name for a shred."""
         if shred_id in self.shreds:
-            return self.shreds[shred_id]["name"]
+            return self.shreds[shred_id].name
         return f"shred-{shred_id}"
 
 
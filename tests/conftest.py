@@ -0,0 +1,69 @@
+"""Shared pytest fixtures."""
+
+from pathlib import Path
+
+import pytest
+from helpers import make_chuck
+
+from numchuck import Chuck
+
+
+@pytest.fixture(scope="session")
+def _chuck_session():
+    """One default Chuck instance, initialized once per test session."""
+    chuck = Chuck()
+    chuck.advance(1)  # Start the VM so clear() and reset_id() can queue messages
+    yield chuck
+    chuck.close()
+
+
+@pytest.fixture
+def chuck(_chuck_session):
+    """The session's Chuck instance with shreds, globals and shred IDs reset.
+
+    Use this in tests that need a default-configured VM but don't test
+    construction itself; it saves initializing a new VM per test.
+    """
+    _chuck_session.clear()
+    _chuck_session.reset_id()
+    # clear() and reset_id() are queued; run a frame to apply them
+    _chuck_session.advance(1)
+    return _chuck_session
+
+
+@pytest.fixture(scope="session")
+def _chuck_44k_stereo_session():
+    """One low-level ChucK at 44.1 kHz stereo, initialized once per session."""
+    chuck = make_chuck()
+    yield chuck
+    chuck.shutdown()
+
+
+@pytest.fixture
+def chuck_44k_stereo(_chuck_44k_stereo_session):
+    """The session's low-level ChucK instance, with its shreds removed afterwards.
+
+    Use this for _numchuck.ChucK tests that need no parameters beyond the
+    sample rate and output channels set before init().
+    """
+    yield _chuck_44k_stereo_session
+    _chuck_44k_stereo_session.remove_all_shreds()
+    # remove_all_shreds() is queued; run a frame to apply it
+    _chuck_44k_stereo_session.advance(1)
+
+
+@pytest.fixture(scope="session")
+def chugins():
+    """The dynamic chugins shipped in examples/chugins, scanned once.
+
+    Returns (chugins_dir, {name: path}), with chugins_dir normalized to
+    forward slashes for ChucK. The dict is empty if the directory doesn't
+    exist or holds no .chug files.
+    """
+    directory = (Path(__file__).parent / "../examples/chugins").resolve()
+    files = (
+        {path.stem: str(path) for path in directory.glob("*.chug")}
+        if directory.is_dir()
+        else {}
+    )
+    return str(directory).replace("\\", "/"), files
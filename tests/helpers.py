@@ -0,0 +1,21 @@
+"""Shared test helpers."""
+
+from numchuck import _numchuck
+
+
+def make_chuck(*, sample_rate=44100, output_channels=2, input_channels=None):
+    """Create and initialize a low-level ChucK.
+
+    Its parameters are applied with a single set_params() call. Input
+    channels are left at ChucK's default unless given.
+    """
+    chuck = _numchuck.ChucK()
+    params = {
+        _numchuck.PARAM_SAMPLE_RATE: sample_rate,
+        _numchuck.PARAM_OUTPUT_CHANNELS: output_channels,
+    }
+    if input_channels is not None:
+        params[_numchuck.PARAM_INPUT_CHANNELS] = input_channels
+    chuck.set_params(params)
+    chuck.init()
+    return chuck
@@ -1,9 +1,12 @@
 """Tests for the high-level numchuck.Chuck API."""
 
+import threading
+import time
+
 import numpy as np
 import pytest
 
-from numchuck import Chuck
+from numchuck import AudioRing, Chuck
 
 
 class TestChuckConstruction:
@@ -23,6 +26,15 @@ class TestChuckConstruction:
         assert chuck.output_channels == 1
         assert chuck.input_channels == 1
 
+    def test_vm_defaults_match_chuck(self):
+        """Test the defaults Chuck() skips sending match the VM's own."""
+        from numchuck import _numchuck
+        from numchuck.api import _VM_DEFAULTS
+
+        raw = _numchuck.ChucK()
+        for param, value in _VM_DEFAULTS.items():
+            assert raw.get_param_int(param) == value, param
+
     def test_version_property(self):
         """Test version property is accessible."""
         chuck = Chuck()
@@ -68,27 +80,46 @@ class TestChuckConstruction:
 class TestCompilation:
     """Test code compilation."""
 
-    def test_compile_simple_code(self):
+    def test_compile_simple_code(self, chuck):
         """Test compiling simple ChucK code."""
-        chuck = Chuck()
         success, shred_ids = chuck.compile("SinOsc s => dac;")
         assert success is True
         assert len(shred_ids) == 1
         assert shred_ids[0] > 0
 
-    def test_compile_multiple_shreds(self):
+    def test_compile_multiple_shreds(self, chuck):
         """Test compiling multiple shreds."""
-        chuck = Chuck()
         success, shred_ids = chuck.compile("SinOsc s => dac;", count=3)
         assert success is True
         assert len(shred_ids) == 3
 
-    def test_compile_invalid_code(self):
+    def test_compile_invalid_code(self, chuck):
         """Test compiling invalid code."""
-        chuck = Chuck()
         success, shred_ids = chuck.compile("invalid code here")
         assert success is False
 
+    def test_compile_reuses_compiled_code(self):
+        """Test recompiling the same source sporks the cached program."""
+        chuck = Chuck(output_channels=1)
+        code = "SinOsc s => dac; 440 => s.freq; 1::second => now;"
+        assert chuck.compile(code, cache=True) == (True, [1])
+        program = chuck._code_cache[code]
+        assert chuck.compile(code, count=2, cache=True) == (True, [2, 3])
+        assert chuck._code_cache[code] is program
+        assert len(chuck.shreds) == 0  # Sporked on the next block
+        chuck.run(256)
+        assert len(chuck.shreds) == 3
+        chuck.clear()
+        assert not chuck._code_cache
+        chuck.close()
+        assert not program.valid
+
+    def test_compile_does_not_cache_by_default(self):
+        """Test compile() only caches programs when asked to."""
+        chuck = Chuck(output_channels=1)
+        assert chuck.compile("1::second => now;") == (True, [1])
+        assert not chuck._code_cache
+
 
 class TestRunning:
     """Test running the VM."""
@@ -111,6 +142,149 @@ class TestRunning:
         output = chuck.run(500)
         assert len(output) == 1000  # 500 frames * 2 channels
 
+    def test_stream(self):
+        """Test stream yields blocks from one buffer matching run() output."""
+        code = "SinOsc s => dac; 440 => s.freq; 1::second => now;"
+        chuck = Chuck(output_channels=1)
+        chuck.compile(code)
+        blocks = list(chuck.stream(256, 1000))
+        assert [len(b) for b in blocks] == [256, 256, 256, 232]
+        assert all(np.shares_memory(b, blocks[0]) for b in blocks)
+
+        reference = Chuck(output_channels=1)
+        reference.compile(code)
+        expected = reference.run(1000)
+        chuck2 = Chuck(output_channels=1)
+        chuck2.compile(code)
+        streamed = np.concatenate([b.copy() for b in chuck2.stream(256, 1000)])
+        np.testing.assert_array_equal(streamed, expected)
+
+    def test_stream_invalid_block(self, chuck):
+        """Test stream rejects a non-positive block size immediately."""
+        with pytest.raises(ValueError):
+            chuck.stream(0, 100)
+
+    def test_render_offline(self):
+        """Test chunked offline rendering matches a single run() call."""
+        code = "SinOsc s => dac; 440 => s.freq; 1::second => now;"
+        chuck = Chuck(output_channels=2)
+        chuck.compile(code)
+        audio = chuck.render_offline(1000, chunk_frames=300)
+        assert audio.shape == (2000,)
+
+        reference = Chuck(output_channels=2)
+        reference.compile(code)
+        np.testing.assert_array_equal(audio, reference.run(1000))
+
+    def test_render_many(self):
+        """Test parallel rendering matches rendering each script alone."""
+        scripts = [
+            f"SinOsc s => dac; {freq} => s.freq; 1::second => now;"
+            for freq in (220, 440, 880)
+        ]
+        outputs = Chuck.render_many(scripts, 1000, workers=3, output_channels=1)
+        assert len(outputs) == 3
+        for code, audio in zip(scripts, outputs):
+            reference = Chuck(output_channels=1)
+            reference.compile(code)
+            np.testing.assert_array_equal(audio, reference.run(1000))
+
+    def test_render_many_compile_error(self):
+        """Test a script that fails to compile raises."""
+        with pytest.raises(RuntimeError):
+            Chuck.render_many(["this is not chuck;"], 100)
+
+    def test_render_many_closes_instances(self, monkeypatch):
+        """Test every instance is closed, including after a compile error."""
+        closed = []
+        close = Chuck.close
+
+        def tracking_close(chuck):
+            closed.append(chuck)
+            close(chuck)
+
+        monkeypatch.setattr(Chuck, "close", tracking_close)
+        Chuck.render_many(["1::second => now;"] * 2, 100, workers=2)
+        assert len(closed) == 2
+        with pytest.raises(RuntimeError):
+            Chuck.render_many(["this is not chuck;"], 100)
+        assert len(closed) == 3
+
+    def test_specialize(self):
+        """Test a specialized renderer reuses its buffer and matches run()."""
+        code = "SinOsc s => dac; 440 => s.freq; 1::second => now;"
+        chuck = Chuck(output_channels=2)
+        chuck.compile(code)
+        run_block = chuck.specialize(128)
+        first = run_block().copy()
+        second = run_block()
+        assert second is run_block()
+        assert second.shape == (256,)
+
+        reference = Chuck(output_channels=2)
+        reference.compile(code)
+        np.testing.assert_array_equal(first, reference.run(128))
+
+    def test_specialize_input_size(self):
+        """Test specialize validates the bound input buffer up front."""
+        chuck = Chuck(input_channels=1)
+        with pytest.raises(ValueError):
+            chuck.specialize(128, input=np.zeros(64, dtype=np.float32))
+
+    def test_run_int16(self):
+        """Test 16-bit output matches scaled, rounded float output."""
+        code = "SinOsc s => dac; 440 => s.freq; 1::second => now;"
+        chuck = Chuck(output_channels=2)
+        chuck.compile(code)
+        pcm = chuck.run_int16(512)
+        assert pcm.dtype == np.int16
+        assert pcm.shape == (1024,)
+
+        reference = Chuck(output_channels=2)
+        reference.compile(code)
+        expected = np.round(reference.run(512) * 32767).astype(np.int16)
+        np.testing.assert_allclose(pcm, expected, atol=1)
+
+    def test_run_int16_clips(self):
+        """Test out-of-range samples saturate instead of wrapping."""
+        chuck = Chuck(output_channels=1)
+        chuck.compile("Step s => dac; 2.0 => s.next; 1::second => now;")
+        out = np.empty(64, dtype=np.int16)
+        assert chuck.run_int16(64, output=out) is out
+        assert np.all(out[1:] == 32767)
+
+    def test_run_planar(self):
+        """Test run_planar matches the de-interleaved run() output."""
+        chuck = Chuck(output_channels=2)
+        chuck.compile("SinOsc s => dac.left; Noise n => dac.right; 1::second => now;")
+        planar = chuck.run_planar(500)
+        assert planar.shape == (2, 500)
+        assert planar.flags.c_contiguous
+
+        reference = Chuck(output_channels=2)
+        reference.compile("SinOsc s => dac.left; Noise n => dac.right; 1::second => now;")
+        expected = reference.run(500).reshape(500, 2).T
+        np.testing.assert_array_equal(planar[0], expected[0])
+        assert not np.array_equal(planar[0], planar[1])
+
+    def test_run_planar_input(self):
+        """Test planar input reaches the VM channel by channel."""
+        chuck = Chuck(input_channels=2, output_channels=2)
+        chuck.compile("adc.left => dac.left; adc.right => dac.right; 1::second => now;")
+        planes = np.empty((2, 256), dtype=np.float32)
+        planes[0] = 0.25
+        planes[1] = -0.5
+        chuck.run_planar(256, input=planes)
+        out = chuck.run_planar(256, input=planes)
+        np.testing.assert_allclose(out[0], 0.25)
+        np.testing.assert_allclose(out[1], -0.5)
+
+    def test_run_planar_input_shape(self):
+        """Test a mis-shaped planar input is rejected."""
+        chuck = Chuck(input_channels=2)
+        with pytest.raises(ValueError):
+            chuck.run_planar(256, input=np.zeros((1, 256), dtype=np.float32))
+
     def test_run_with_output_buffer(self):
         """Test run with pre-allocated output buffer."""
         chuck = Chuck(output_channels=1)
@@ -145,9 +319,8 @@ class TestRunning:
         # Output should have audio
         assert output_buf.max() > 0
 
-    def test_advance_discards_output(self):
+    def test_advance_discards_output(self, chuck):
         """Test advance() advances time without returning audio."""
-        chuck = Chuck()
         chuck.compile("global int counter; 0 => counter;")
         chuck.advance(100)
         # Just verify it doesn't crash and returns None
@@ -165,6 +338,31 @@ class TestRunning:
         # Buffer should have valid audio after loop
         assert output_buf.max() > 0
 
+    def test_run_into(self):
+        """Test run_into fills the given buffer and infers the frame count."""
+        chuck = Chuck(output_channels=2)
+        chuck.compile("SinOsc s => dac; 440 => s.freq; 1::second => now;")
+        buf = np.zeros(256 * 2, dtype=np.float32)
+        assert chuck.run_into(buf) == 256
+        assert buf.max() > 0
+        with pytest.raises(ValueError):
+            chuck.run_into(np.zeros(255, dtype=np.float32))
+
+    def test_run_into_converting_fallback(self):
+        """Test run_into fills non-float32 and strided buffers via a copy."""
+        chuck = Chuck(output_channels=1)
+        chuck.compile("SinOsc s => dac; 440 => s.freq; 1::second => now;")
+        buf = np.zeros(256, dtype=np.float64)
+        assert chuck.run_into(buf) == 256
+        assert buf.max() > 0
+        strided = np.zeros(512, dtype=np.float32)[::2]
+        assert chuck.run_into(strided) == 256
+        assert strided.max() > 0
+        readonly = np.zeros(256, dtype=np.float32)
+        readonly.flags.writeable = False
+        with pytest.raises(TypeError):
+            chuck.run_into(readonly)
+
     def test_run_reuse_internal_buffer(self):
         """Test run with reuse=True for internal buffer management."""
         chuck = Chuck(output_channels=1)
@@ -189,21 +387,102 @@ class TestRunning:
         assert len(audio2) == 1024
         assert audio1 is not audio2  # Different buffer
 
+    def test_run_reuse_buffers_are_aligned(self):
+        """Test the reuse=True buffers start on a 64-byte boundary."""
+        chuck = Chuck(output_channels=2)
+        for num_frames in (1, 512, 4096):
+            assert chuck.run(num_frames, reuse=True).ctypes.data % 64 == 0
+        view = chuck.input_memoryview(256)
+        assert np.asarray(view).ctypes.data % 64 == 0
+        assert not np.asarray(view).any()
+
+    def test_run_reuse_keeps_high_water_storage(self):
+        """Test reuse=True shrinking back to a smaller size does not reallocate."""
+        chuck = Chuck(output_channels=1)
+        large = chuck.run(1024, reuse=True)
+        small = chuck.run(512, reuse=True)
+        assert len(small) == 512
+        assert np.shares_memory(small, large)
+        assert chuck.run(512, reuse=True) is small
+
+    def test_run_overwrites_uninitialized_output(self):
+        """Test run writes every sample, so np.empty buffers are safe."""
+        chuck = Chuck(output_channels=2)
+        output = np.full(1024, np.nan, dtype=np.float32)
+        chuck.run(512, output=output)
+        assert not np.isnan(output).any()
+        assert not output.any()  # No shreds: silence
+
+    def test_render_from_render_callback_is_refused(self):
+        """Test a callback fired mid-render cannot start another render."""
+        chuck = Chuck(output_channels=1)
+        other = Chuck(output_channels=1)
+        errors = []
+
+        def on_output(text):
+            for instance in (chuck, other):
+                try:
+                    instance.advance(16384)
+                except RuntimeError as e:
+                    errors.append(str(e))
+
+        chuck.raw.set_chout_callback(on_output)
+        chuck.compile('chout <= "x" <= IO.newline(); 1::second => now;')
+        chuck.run(256)
+        assert len(errors) == 2
+        assert "during a render" in errors[0]
+        # Rendering works again once the outer render has returned
+        chuck.run(256)
+        other.advance(16)
+        chuck.close()
+        other.close()
+
+    def test_run_reuse_pool(self):
+        """Test run with reuse="pool" recycles freed output blocks."""
+        from numchuck.api import PooledArray
+
+        chuck = Chuck(output_channels=1)
+        chuck.compile("SinOsc s => dac; 440 => s.freq; 1::second => now;")
+        audio1 = chuck.run(512, reuse="pool")
+        assert isinstance(audio1, PooledArray)
+        assert len(audio1) == 512
+        assert audio1.max() > 0
+        # Live blocks are never shared
+        audio2 = chuck.run(512, reuse="pool")
+        assert not np.shares_memory(audio1, audio2)
+        # A released block is handed out again
+        address = audio1.ctypes.data
+        audio1.release()
+        audio3 = chuck.run(512, reuse="pool")
+        assert audio3.ctypes.data == address
+        # Releasing twice returns the memory only once
+        with audio3:
+            pass
+        audio3.release()
+        audio4 = chuck.run(512, reuse="pool")
+        audio5 = chuck.run(512, reuse="pool")
+        assert not np.shares_memory(audio4, audio5)
+        # Blocks that are merely dropped are not recycled
+        view = audio4[:]
+        del audio4
+        audio6 = chuck.run(512, reuse="pool")
+        assert not np.shares_memory(view, audio6)
+        with pytest.raises(ValueError):
+            view[:256].release()
+
 
 class TestShredManagement:
     """Test shred management."""
 
-    def test_shreds_property(self):
+    def test_shreds_property(self, chuck):
         """Test shreds property."""
-        chuck = Chuck()
         chuck.compile("SinOsc s => dac; 1::second => now;")
         chuck.run(100)
         # Shred might have ended, just check it's a list
         assert isinstance(chuck.shreds, list)
 
-    def test_remove_shred(self):
+    def test_remove_shred(self, chuck):
         """Test removing a shred."""
-        chuck = Chuck()
         success, shred_ids = chuck.compile("SinOsc s => dac; 1::second => now;")
         chuck.run(100)
         if shred_ids:
@@ -227,40 +506,167 @@ class TestShredManagement:
 class TestGlobalVariables:
     """Test global variable operations."""
 
-    def test_set_get_int(self):
+    def test_set_get_int(self, chuck):
         """Test setting and getting global int."""
-        chuck = Chuck()
         chuck.compile("global int myInt;")
         chuck.run(100)
         chuck.set_int("myInt", 42)
         value = chuck.get_int("myInt")
         assert value == 42
 
-    def test_set_get_float(self):
+    def test_set_get_float(self, chuck):
         """Test setting and getting global float."""
-        chuck = Chuck()
         chuck.compile("global float myFloat;")
         chuck.run(100)
         chuck.set_float("myFloat", 3.14159)
         value = chuck.get_float("myFloat")
         assert abs(value - 3.14159) < 0.0001
 
-    def test_set_get_string(self):
+    def test_set_get_string(self, chuck):
         """Test setting and getting global string."""
-        chuck = Chuck()
         chuck.compile('global string myStr;')
         chuck.run(100)
         chuck.set_string("myStr", "hello")
         value = chuck.get_string("myStr")
         assert value == "hello"
 
+    def test_set_get_string_utf8(self, chuck):
+        """Test non-ASCII strings round-trip through the VM as UTF-8."""
+        chuck.compile('global string myStr;')
+        chuck.run(100)
+        chuck.set_string("myStr", "héllo → ♪")
+        assert chuck.get_string("myStr") == "héllo → ♪"
+
+    def test_set_string_before_first_run(self):
+        """Test a queued set starts the VM rather than failing before any run."""
+        chuck = Chuck()
+        chuck.compile("global string myStr;")
+        chuck.set_string("myStr", "early")
+        assert chuck.get_string("myStr") == "early"
+
+    def test_get_does_not_advance_time(self, chuck):
+        """Test getters read pending sets directly without running the VM."""
+        chuck.compile("global int myInt; global float myFloat; global string myStr;")
+        chuck.run(100)
+        chuck.set_int("myInt", 7)
+        chuck.set_float("myFloat", 0.5)
+        chuck.set_string("myStr", "hi")
+        before = chuck.raw.now()
+        assert chuck.get_int("myInt") == 7
+        assert chuck.get_float("myFloat") == 0.5
+        assert chuck.get_string("myStr") == "hi"
+        assert chuck.raw.now() == before
+
+    def test_get_while_rendering_on_another_thread(self):
+        """Test direct global access waits for a render on another thread."""
+        chuck = Chuck()
+        chuck.compile(
+            "global int x; global string s; "
+            'while (true) { x++; "n" + x => s; 1::samp => now; }'
+        )
+        done = threading.Event()
+
+        def render():
+            while not done.is_set():
+                chuck.run(44100)
+
+        thread = threading.Thread(target=render)
+        thread.start()
+        try:
+            deadline = time.monotonic() + 0.5
+            while time.monotonic() < deadline:
+                chuck.set_string("s", "hi")
+                assert chuck.get_string("s")
+                chuck.set_int("x", 3)
+                assert chuck.get_int("x") >= 3
+        finally:
+            done.set()
+            thread.join()
+
+    def test_bind_meter(self):
+        """Test meters track globals as blocks are rendered."""
+        chuck = Chuck()
+        count = chuck.bind_meter("count", int)
+        level = chuck.bind_meter("level")
+        assert count.value == 0
+        assert count.name == "count"
+        chuck.compile(
+            "global int count; global float level; "
+            "while (true) { count++; 0.5 => level; 100::samp => now; }"
+        )
+        chuck.run(1000)
+        assert count.value == 10
+        assert level.value == 0.5
+        chuck.run(1000)
+        assert count.value == 20
+
+    def test_bind_meter_unsupported_type(self):
+        """Test meters only support int and float."""
+        chuck = Chuck()
+        with pytest.raises(TypeError):
+            chuck.bind_meter("name", str)
+
+    def test_global_handle(self):
+        """Test handles read and write globals without a by-name lookup."""
+        chuck = Chuck()
+        chuck.compile("global int count; global float level; 0.25 => level;")
+        chuck.run(64)
+        count = chuck.global_handle("count")
+        level = chuck.global_handle("level", float)
+        assert count.name == "count"
+        assert level.value == 0.25
+        count.value = 7
+        assert chuck.get_int("count") == 7
+        chuck.set_float("level", 0.5)
+        assert level.value == 0.5
+        with pytest.raises(TypeError):
+            chuck.global_handle("name", str)
+
+    def test_global_handle_after_reinit(self):
+        """Test handles re-resolve once the instance is shut down and re-initialized."""
+        chuck = Chuck()
+        handle = chuck.global_handle("count")
+        handle.value = 3
+        chuck.raw.shutdown()
+        with pytest.raises(RuntimeError):
+            handle.value
+        chuck.raw.init()
+        assert handle.value == 0
+        handle.value = 4
+        assert chuck.raw.get_global_int_sync("count") == 4
+
+    def test_global_handle_after_clear(self, chuck):
+        """Test handles and meters survive the VM clearing its globals."""
+        chuck.set_int("count", 5)
+        meter = chuck.bind_meter("count", int)
+        chuck.clear()
+        assert chuck.get_int("count") == 0
+        chuck.set_int("count", 6)
+        chuck.run(64)
+        assert chuck.get_int("count") == 6
+        assert meter.value == 5  # Detached by clear()
+
+    def test_get_globals(self, chuck):
+        """Test fetching several globals of different types in one call."""
+        chuck.compile(
+            'global int myInt; global float myFloat; global string myStr; '
+            '3 => myInt; 1.5 => myFloat; "abc" => myStr; 1::second => now;'
+        )
+        chuck.run(10)
+        values = chuck.get_globals({"myInt": int, "myFloat": float, "myStr": str})
+        assert values == {"myInt": 3, "myFloat": 1.5, "myStr": "abc"}
+
+    def test_get_globals_unsupported_type(self, chuck):
+        """Test an unsupported type raises TypeError."""
+        with pytest.raises(TypeError):
+            chuck.get_globals({"x": list})
+
 
 class TestEventCallbacks:
     """Test event signaling and callbacks."""
 
-    def test_signal_event(self):
+    def test_signal_event(self, chuck):
         """Test signaling a global event."""
-        chuck = Chuck()
         chuck.compile("global Event myEvent; myEvent => now; 1::second => now;")
         chuck.run(100)  # Let shred start waiting
 
@@ -269,9 +675,8 @@ class TestEventCallbacks:
         chuck.run(100)
         # Test passes if no crash occurs
 
-    def test_broadcast_event(self):
+    def test_broadcast_event(self, chuck):
         """Test broadcasting a global event."""
-        chuck = Chuck()
         # Create two shreds waiting on same event
         chuck.compile("global Event myEvent; myEvent => now; 1::second => now;", count=2)
         chuck.run(100)
@@ -281,9 +686,8 @@ class TestEventCallbacks:
         chuck.run(100)
         # Test passes if no crash occurs
 
-    def test_on_event_callback(self):
+    def test_on_event_callback(self, chuck):
         """Test registering an event callback."""
-        chuck = Chuck()
         chuck.compile("global Event testEvent;")
         chuck.run(100)
 
@@ -301,9 +705,8 @@ class TestEventCallbacks:
 
         assert callback_count[0] >= 1
 
-    def test_on_event_single_shot(self):
+    def test_on_event_single_shot(self, chuck):
         """Test event callback with listen_forever=False."""
-        chuck = Chuck()
         chuck.compile("global Event testEvent;")
         chuck.run(100)
 
@@ -323,9 +726,33 @@ class TestEventCallbacks:
         # With listen_forever=False, callback should only fire once
         assert callback_count[0] == 1
 
-    def test_stop_listening_for_event(self):
+    def test_on_event_called_after_run(self, chuck):
+        """Test event callbacks fired during run() are called once the block is done."""
+        chuck.compile("global Event testEvent;")
+        chuck.run(100)
+
+        seen_now = []
+        chuck.on_event("testEvent", lambda: seen_now.append(chuck.raw.now()))
+        chuck.signal_event("testEvent")
+        chuck.run(256)
+
+        assert seen_now == [chuck.raw.now()]
+
+    def test_on_event_batch(self, chuck):
+        """Test every callback woken by one broadcast is dispatched after run()."""
+        chuck.compile("global Event testEvent;")
+        chuck.run(100)
+
+        calls = []
+        for i in range(3):
+            chuck.on_event("testEvent", lambda i=i: calls.append(i))
+        chuck.broadcast_event("testEvent")
+        chuck.run(256)
+
+        assert sorted(calls) == [0, 1, 2]
+
+    def test_stop_listening_for_event(self, chuck):
         """Test stopping event listener."""
-        chuck = Chuck()
         chuck.compile("global Event testEvent;")
         chuck.run(100)
 
@@ -354,9 +781,8 @@ class TestEventCallbacks:
 class TestAdvanceMethod:
     """Test advance() method behavior."""
 
-    def test_advance_triggers_callbacks(self):
+    def test_advance_triggers_callbacks(self, chuck):
         """Test that advance() triggers global variable callbacks."""
-        chuck = Chuck()
         chuck.compile("global int counter; 42 => counter;")
         chuck.run(100)
 
@@ -370,9 +796,8 @@ class TestAdvanceMethod:
 
         assert result[0] == 42
 
-    def test_advance_advances_vm_time(self):
+    def test_advance_advances_vm_time(self, chuck):
         """Test that advance() advances VM time."""
-        chuck = Chuck()
         chuck.compile("global int counter; 0 => counter;")
 
         # Get initial time via a shred that writes VM time
@@ -394,6 +819,14 @@ class TestAdvanceMethod:
 
         assert time2 > time1
 
+    def test_advance_long_span_without_output(self, chuck):
+        """Test advance() covers spans longer than its scratch block exactly."""
+        chuck.compile("global float vmTime; while (true) { now/samp => vmTime; 1::samp => now; }")
+        chuck.advance(1)
+        start = chuck.get_float("vmTime")
+        chuck.advance(10000)
+        assert chuck.get_float("vmTime") - start == 10000
+
 
 class TestBufferReuseModes:
     """Test different buffer management modes in run()."""
@@ -449,6 +882,108 @@ class TestBufferReuseModes:
         assert reuse_buf2 is reuse_buf
 
 
+class TestAudioRing:
+    """Test the lock-free ring buffer and run_ring()."""
+
+    def test_capacity_rounds_to_power_of_two(self):
+        """Test capacity is rounded up and space accounting is in frames."""
+        ring = AudioRing(100, 2)
+        assert ring.capacity == 128
+        assert ring.writable == 128
+        assert ring.write(np.ones(20, dtype=np.float32)) == 10
+        assert ring.readable == 10
+
+    def test_wraparound_preserves_order(self):
+        """Test reads return frames in write order across the wrap point."""
+        ring = AudioRing(8, 1)
+        out = np.empty(6, dtype=np.float32)
+        ring.write(np.arange(6, dtype=np.float32))
+        ring.read(out)
+        assert ring.write(np.arange(6, 12, dtype=np.float32)) == 6
+        assert ring.read(out) == 6
+        np.testing.assert_array_equal(out, np.arange(6, 12))
+
+    def test_full_and_empty(self):
+        """Test partial writes into a full ring and partial reads."""
+        ring = AudioRing(4, 1)
+        assert ring.write(np.ones(6, dtype=np.float32)) == 4
+        out = np.zeros(6, dtype=np.float32)
+        assert ring.read(out) == 4
+        assert ring.read(out) == 0
+
+    def test_misaligned_write_rejected(self):
+        """Test buffers must hold whole frames."""
+        ring = AudioRing(16, 2)
+        with pytest.raises(ValueError):
+            ring.write(np.ones(3, dtype=np.float32))
+
+    def test_run_ring_passes_input_to_output(self):
+        """Test adc input pulled from one ring arrives in the output ring."""
+        chuck = Chuck(input_channels=1, output_channels=1)
+        chuck.compile("adc => dac; 1::second => now;")
+        chuck.run(10)
+        in_ring = AudioRing(1024, 1)
+        out_ring = AudioRing(1024, 1)
+        chuck.attach_input_ring(in_ring)
+        chuck.attach_output_ring(out_ring)
+
+        in_ring.write(np.full(256, 0.5, dtype=np.float32))
+        assert chuck.run_ring(512) == 512
+        out = np.empty(512, dtype=np.float32)
+        out_ring.read(out)
+        assert in_ring.readable == 0
+        assert np.any(out[:256] != 0)
+        assert np.all(out[300:] == 0)
+
+    def test_attach_channel_mismatch(self):
+        """Test attaching a ring with the wrong channel count raises."""
+        chuck = Chuck(output_channels=2)
+        with pytest.raises(ValueError):
+            chuck.attach_output_ring(AudioRing(64, 1))
+
+
+class TestMemoryviews:
+    """Test buffer-protocol access to the internal buffers."""
+
+    def test_output_memoryview(self):
+        """Test the output view tracks run(reuse=True) output."""
+        chuck = Chuck(output_channels=2)
+        chuck.compile("SinOsc s => dac; 1::second => now;")
+        view = chuck.output_memoryview(256)
+        assert view.format == "f"
+        assert view.shape == (256, 2)
+        audio = chuck.run(256, reuse=True)
+        np.testing.assert_array_equal(np.asarray(view).reshape(-1), audio)
+
+    def test_input_memoryview_feeds_reuse_run(self):
+        """Test samples written to the input view reach the VM."""
+        chuck = Chuck(input_channels=1, output_channels=1)
+        chuck.compile("adc => dac; 1::second => now;")
+        view = chuck.input_memoryview(256)
+        assert view.shape == (256, 1)
+        assert not view.readonly
+        np.asarray(view)[:] = 0.5
+        chuck.run(256, reuse=True)
+        audio = chuck.run(256, reuse=True)
+        assert np.allclose(audio, 0.5)
+
+    def test_output_memoryview_survives_smaller_runs(self):
+        """Test a view stays live while runs use the same or fewer frames."""
+        chuck = Chuck(output_channels=2)
+        chuck.compile("SinOsc s => dac; 1::second => now;")
+        view = chuck.output_memoryview(256)
+        audio = chuck.run(128, reuse=True)
+        np.testing.assert_array_equal(np.asarray(view).reshape(-1)[:256], audio)
+
+    def test_run_into_memoryview(self):
+        """Test run_into accepts a float32 memoryview."""
+        chuck = Chuck(output_channels=2)
+        chuck.compile("SinOsc s => dac; 1::second => now;")
+        view = memoryview(bytearray(512 * 4)).cast("f")
+        assert chuck.run_into(view) == 256
+        assert max(view) > 0
+
+
 class TestRawAccess:
     """Test access to raw low-level API."""
 
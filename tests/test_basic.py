@@ -1,5 +1,6 @@
 import numchuck._numchuck as numchuck
 import numpy as np
+import pytest
 
 
 def test_version():
@@ -35,6 +36,27 @@ def test_chuck_init():
     assert chuck.get_param_int(numchuck.PARAM_OUTPUT_CHANNELS) == 2
 
 
+def test_chuck_set_params():
+    """Test setting several parameters in one call"""
+    chuck = numchuck.ChucK()
+    assert chuck.set_params({
+        numchuck.PARAM_SAMPLE_RATE: 48000,
+        numchuck.PARAM_INPUT_CHANNELS: 0,
+        numchuck.PARAM_OUTPUT_CHANNELS: 1,
+        numchuck.PARAM_VM_HALT: True,
+        numchuck.PARAM_WORKING_DIRECTORY: "/tmp",
+    })
+    assert chuck.init()
+
+    assert chuck.get_param_int(numchuck.PARAM_SAMPLE_RATE) == 48000
+    assert chuck.get_param_int(numchuck.PARAM_OUTPUT_CHANNELS) == 1
+    assert chuck.get_param_int(numchuck.PARAM_VM_HALT) == 1
+    assert chuck.get_param_string(numchuck.PARAM_WORKING_DIRECTORY).startswith("/tmp")
+
+    # Unknown names are reported rather than silently dropped
+    assert not chuck.set_params({"NOT_A_PARAM": 1})
+
+
 def test_chuck_compile_code():
     """Test compiling ChucK code"""
     chuck = numchuck.ChucK()
@@ -89,6 +111,37 @@ def test_chuck_audio_processing():
     assert np.abs(output_buffer).max() > 0
 
 
+def test_chuck_render():
+    """Test render() allocating or filling the output buffer"""
+    chuck = numchuck.ChucK()
+    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
+    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
+    chuck.init()
+
+    code = '''
+    SinOsc s => dac;
+    while(true) { 1::samp => now; }
+    '''
+    success, _ = chuck.compile_code(code)
+    assert success
+
+    # No output given: a new buffer is allocated, input defaults to silence
+    audio = chuck.render(256)
+    assert audio.dtype == np.float32
+    assert audio.shape == (256 * 2,)
+    assert audio.any()
+
+    # Output given: filled in place and returned as-is
+    output = np.zeros(256 * 2, dtype=np.float32)
+    assert chuck.render(256, output) is output
+    assert output.any()
+
+    with pytest.raises(TypeError):
+        chuck.render(256, np.zeros(256 * 2, dtype=np.float64))
+    with pytest.raises(ValueError):
+        chuck.render(256, np.zeros(10, dtype=np.float32))
+
+
 def test_chuck_now():
     """Test getting current ChucK time"""
     chuck = numchuck.ChucK()
@@ -110,6 +163,39 @@ def test_chuck_now():
     assert now_after > now
 
 
+def test_chuck_get_global_sync():
+    """Test reading globals synchronously without advancing time"""
+    chuck = numchuck.ChucK()
+    with pytest.raises(RuntimeError):
+        chuck.get_global_int_sync("x")
+    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 0)
+    chuck.init()
+    chuck.compile_code("global int x; 3 => x; 1::day => now;")
+    chuck.run(np.zeros(0, dtype=np.float32), np.zeros(2, dtype=np.float32), 1)
+
+    now = chuck.now()
+    assert chuck.get_global_int_sync("x") == 3
+    chuck.set_global_int("x", 4)
+    assert chuck.get_global_int_sync("x") == 4
+    assert chuck.now() == now
+
+
+@pytest.mark.parametrize("channels", [1, 2, 3])
+def test_interleave_roundtrip(channels):
+    """Test deinterleave/interleave against NumPy reshapes"""
+    interleaved = np.arange(channels * 7, dtype=np.float32)
+    planes = np.empty((channels, 7), dtype=np.float32)
+    numchuck.deinterleave(interleaved, planes)
+    np.testing.assert_array_equal(planes, interleaved.reshape(7, channels).T)
+
+    out = np.empty_like(interleaved)
+    numchuck.interleave(planes, out)
+    np.testing.assert_array_equal(out, interleaved)
+
+    with pytest.raises(ValueError):
+        numchuck.deinterleave(interleaved[:-1].copy(), planes)
+
+
 def test_parameters():
     """Test parameter constants are defined"""
     assert hasattr(numchuck, 'PARAM_SAMPLE_RATE')
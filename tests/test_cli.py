@@ -177,6 +177,20 @@ def test_version_command_output(capsys):
     assert 'ChucK version:' in captured.out
 
 
+def test_version_fast_path_matches_command(capsys, monkeypatch):
+    """Test `python -m numchuck version` prints what the version command does."""
+    from numchuck.__main__ import main as module_main
+    from numchuck.cli.main import cmd_version
+    from argparse import Namespace
+
+    monkeypatch.setattr(sys, 'argv', ['numchuck', 'version'])
+    module_main()
+    fast = capsys.readouterr().out
+
+    cmd_version(Namespace())
+    assert capsys.readouterr().out == fast
+
+
 def test_info_command_output(capsys):
     """Test info command produces output."""
     from numchuck.cli.main import cmd_info
@@ -14,295 +14,116 @@ def parser():
     return CommandParser()
 
 
-class TestShredManagement:
-    """Tests for shred management commands."""
-
-    def test_add_file(self, parser):
-        """Test 'add file.ck' command."""
-        cmd = parser.parse("add test.ck")
-        assert cmd.type == "spork_file"
-        assert cmd.args["path"] == "test.ck"
-
-    def test_add_file_with_path(self, parser):
-        """Test 'add path/to/file.ck' command."""
-        cmd = parser.parse("add path/to/file.ck")
-        assert cmd.type == "spork_file"
-        assert cmd.args["path"] == "path/to/file.ck"
-
-    def test_plus_file(self, parser):
-        """Test '+ file.ck' shortcut."""
+# (input, command type, command args) for every command form
+_COMMAND_CASES = [
+    # Shred management
+    ("add test.ck", "spork_file", {"path": "test.ck"}),
+    ("add path/to/file.ck", "spork_file", {"path": "path/to/file.ck"}),
+    ("+ test.ck", "spork_file", {"path": "test.ck"}),
+    ('+ "SinOsc s => dac;"', "spork_code", {"code": "SinOsc s => dac;"}),
+    ("+ 'SinOsc s => dac;'", "spork_code", {"code": "SinOsc s => dac;"}),
+    ("remove all", "remove_all", {}),
+    ("- all", "remove_all", {}),
+    ("remove 1", "remove_shred", {"id": 1}),
+    ("- 1", "remove_shred", {"id": 1}),
+    ("-1", "remove_shred", {"id": 1}),
+    ("replace 1 new.ck", "replace_shred_file", {"id": 1, "path": "new.ck"}),
+    ('~ 1 "new code"', "replace_shred", {"id": 1, "code": "new code"}),
+    # Status
+    ("status", "status", {}),
+    ("time", "current_time", {}),
+    (".", "current_time", {}),
+    ("?", "list_shreds", {}),
+    ("? 1", "shred_info", {"id": 1}),
+    ("?g", "list_globals", {}),
+    ("?a", "audio_info", {}),
+    # Globals
+    ("myvar::42", "set_global", {"name": "myvar", "value": 42}),
+    ("freq::440.0", "set_global", {"name": "freq", "value": 440.0}),
+    ('msg::"hello"', "set_global", {"name": "msg", "value": "hello"}),
+    ("arr::[1, 2, 3]", "set_global", {"name": "arr", "value": [1, 2, 3]}),
+    ("myvar?", "get_global", {"name": "myvar"}),
+    # Globals named like word commands
+    ("status?", "get_global", {"name": "status"}),
+    ("X::1", "set_global", {"name": "X", "value": 1}),
+    # Events
+    ("trigger!", "signal_event", {"name": "trigger"}),
+    ("trigger!!", "broadcast_event", {"name": "trigger"}),
+    # Audio
+    (">", "start_audio", {}),
+    ("||", "stop_audio", {}),
+    ("X", "shutdown_audio", {}),
+    # VM and screen
+    ("clear", "clear_vm", {}),
+    ("reset", "reset_id", {}),
+    ("cls", "clear_screen", {}),
+    # Files and snippets
+    (": test.ck", "compile_file", {"path": "test.ck"}),
+    ('! "<<< 1 >>>"', "exec_code", {"code": "<<< 1 >>>"}),
+    ("@sine", "load_snippet", {"name": "sine"}),
+    # Editing
+    ("edit 1", "edit_shred", {"id": 1}),
+    ("edit1", "edit_shred", {"id": 1}),
+    ("edit", "open_editor", {}),
+    # Misc
+    ("$ ls -la", "shell", {"cmd": "ls -la"}),
+    ("watch", "watch", {}),
+]
+
+# Input the parser leaves to the REPL as ChucK code
+_NON_COMMANDS = [
+    "SinOsc s => dac;",
+    "fun void foo() {\n  <<< 1 >>>;\n}",
+    "",
+    "   ",
+    # Unterminated quotes
+    '+ "SinOsc s => dac;',
+    pytest.param('! "' + "x" * 10000, id="'! \"xxx...'"),
+    # Text after the closing quote, inner quotes, empty payload
+    '+ "a" b',
+    '~ 1 "a"b"',
+    '! ""',
+]
+
+
+@pytest.mark.parametrize(
+    "text,cmd_type,cmd_args", _COMMAND_CASES, ids=[c[0] for c in _COMMAND_CASES]
+)
+def test_parse(parser, text, cmd_type, cmd_args):
+    """Test each command form parses to its type and arguments."""
+    cmd = parser.parse(text)
+    assert cmd.type == cmd_type
+    assert dict(cmd.args) == cmd_args
+
+
+@pytest.mark.parametrize("text", _NON_COMMANDS, ids=repr)
+def test_non_command_returns_none(parser, text):
+    """Test ChucK code and malformed commands return None."""
+    assert parser.parse(text) is None
+
+
+class TestParseCache:
+    """Tests for reuse of parsed commands."""
+
+    def test_repeated_command_is_reused(self, parser):
+        """Test parsing the same command twice returns the cached Command."""
         cmd = parser.parse("+ test.ck")
-        assert cmd.type == "spork_file"
-        assert cmd.args["path"] == "test.ck"
-
-    def test_plus_code_double_quotes(self, parser):
-        """Test '+ "code"' for inline code."""
-        cmd = parser.parse('+ "SinOsc s => dac;"')
-        assert cmd.type == "spork_code"
-        assert cmd.args["code"] == "SinOsc s => dac;"
+        assert parser.parse("+ test.ck") is cmd
 
-    def test_plus_code_single_quotes(self, parser):
-        """Test "+ 'code'" for inline code."""
-        cmd = parser.parse("+ 'SinOsc s => dac;'")
-        assert cmd.type == "spork_code"
-        assert cmd.args["code"] == "SinOsc s => dac;"
-
-    def test_remove_all(self, parser):
-        """Test 'remove all' command."""
-        cmd = parser.parse("remove all")
-        assert cmd.type == "remove_all"
-
-    def test_minus_all(self, parser):
-        """Test '- all' shortcut."""
-        cmd = parser.parse("- all")
-        assert cmd.type == "remove_all"
-
-    def test_remove_shred(self, parser):
-        """Test 'remove 1' command."""
+    def test_args_are_read_only(self, parser):
+        """Test cached command args cannot be modified."""
         cmd = parser.parse("remove 1")
-        assert cmd.type == "remove_shred"
-        assert cmd.args["id"] == 1
-
-    def test_minus_shred_with_space(self, parser):
-        """Test '- 1' shortcut with space."""
-        cmd = parser.parse("- 1")
-        assert cmd.type == "remove_shred"
-        assert cmd.args["id"] == 1
-
-    def test_minus_shred_without_space(self, parser):
-        """Test '-1' shortcut without space."""
-        cmd = parser.parse("-1")
-        assert cmd.type == "remove_shred"
-        assert cmd.args["id"] == 1
-
-    def test_replace_shred_file(self, parser):
-        """Test 'replace 1 file.ck' command."""
-        cmd = parser.parse("replace 1 new.ck")
-        assert cmd.type == "replace_shred_file"
-        assert cmd.args["id"] == 1
-        assert cmd.args["path"] == "new.ck"
-
-    def test_replace_shred_code(self, parser):
-        """Test '~ 1 "code"' shortcut."""
-        cmd = parser.parse('~ 1 "new code"')
-        assert cmd.type == "replace_shred"
-        assert cmd.args["id"] == 1
-        assert cmd.args["code"] == "new code"
-
-
-class TestStatusCommands:
-    """Tests for status and info commands."""
-
-    def test_status(self, parser):
-        """Test 'status' command."""
-        cmd = parser.parse("status")
-        assert cmd.type == "status"
-
-    def test_time(self, parser):
-        """Test 'time' command."""
-        cmd = parser.parse("time")
-        assert cmd.type == "current_time"
-
-    def test_dot_current_time(self, parser):
-        """Test '.' shortcut for current time."""
-        cmd = parser.parse(".")
-        assert cmd.type == "current_time"
+        with pytest.raises(TypeError):
+            cmd.args["id"] = 2
+        assert parser.parse("remove 1").args["id"] == 1
 
-    def test_question_list_shreds(self, parser):
-        """Test '?' shortcut for listing shreds."""
-        cmd = parser.parse("?")
-        assert cmd.type == "list_shreds"
+    def test_chuck_code_is_not_cached(self, parser):
+        """Test input that is not a command does not fill the cache."""
+        assert parser.parse("SinOsc s => dac;") is None
+        assert parser._cache == {}
 
-    def test_question_shred_info(self, parser):
-        """Test '? 1' for shred info."""
-        cmd = parser.parse("? 1")
-        assert cmd.type == "shred_info"
-        assert cmd.args["id"] == 1
-
-    def test_question_g_list_globals(self, parser):
-        """Test '?g' for listing globals."""
-        cmd = parser.parse("?g")
-        assert cmd.type == "list_globals"
-
-    def test_question_a_audio_info(self, parser):
-        """Test '?a' for audio info."""
-        cmd = parser.parse("?a")
-        assert cmd.type == "audio_info"
-
-
-class TestGlobalVariables:
-    """Tests for global variable commands."""
-
-    def test_set_global_int(self, parser):
-        """Test 'name::123' for setting int."""
-        cmd = parser.parse("myvar::42")
-        assert cmd.type == "set_global"
-        assert cmd.args["name"] == "myvar"
-        assert cmd.args["value"] == 42
-
-    def test_set_global_float(self, parser):
-        """Test 'name::1.5' for setting float."""
-        cmd = parser.parse("freq::440.0")
-        assert cmd.type == "set_global"
-        assert cmd.args["name"] == "freq"
-        assert cmd.args["value"] == 440.0
-
-    def test_set_global_string(self, parser):
-        """Test 'name::"value"' for setting string."""
-        cmd = parser.parse('msg::"hello"')
-        assert cmd.type == "set_global"
-        assert cmd.args["name"] == "msg"
-        assert cmd.args["value"] == "hello"
-
-    def test_set_global_array(self, parser):
-        """Test 'name::[1,2,3]' for setting array."""
+    def test_array_values_are_not_shared(self, parser):
+        """Test mutating a parsed array value does not affect later parses."""
         cmd = parser.parse("arr::[1, 2, 3]")
-        assert cmd.type == "set_global"
-        assert cmd.args["name"] == "arr"
-        assert cmd.args["value"] == [1, 2, 3]
-
-    def test_get_global(self, parser):
-        """Test 'name?' for getting global."""
-        cmd = parser.parse("myvar?")
-        assert cmd.type == "get_global"
-        assert cmd.args["name"] == "myvar"
-
-
-class TestEvents:
-    """Tests for event signaling commands."""
-
-    def test_signal_event(self, parser):
-        """Test 'name!' for signaling event."""
-        cmd = parser.parse("trigger!")
-        assert cmd.type == "signal_event"
-        assert cmd.args["name"] == "trigger"
-
-    def test_broadcast_event(self, parser):
-        """Test 'name!!' for broadcasting event."""
-        cmd = parser.parse("trigger!!")
-        assert cmd.type == "broadcast_event"
-        assert cmd.args["name"] == "trigger"
-
-
-class TestAudioControl:
-    """Tests for audio control commands."""
-
-    def test_start_audio(self, parser):
-        """Test '>' for start audio."""
-        cmd = parser.parse(">")
-        assert cmd.type == "start_audio"
-
-    def test_stop_audio(self, parser):
-        """Test '||' for stop audio."""
-        cmd = parser.parse("||")
-        assert cmd.type == "stop_audio"
-
-    def test_shutdown_audio(self, parser):
-        """Test 'X' for shutdown audio."""
-        cmd = parser.parse("X")
-        assert cmd.type == "shutdown_audio"
-
-
-class TestVMControl:
-    """Tests for VM control commands."""
-
-    def test_clear_vm(self, parser):
-        """Test 'clear' command."""
-        cmd = parser.parse("clear")
-        assert cmd.type == "clear_vm"
-
-    def test_reset_id(self, parser):
-        """Test 'reset' command."""
-        cmd = parser.parse("reset")
-        assert cmd.type == "reset_id"
-
-
-class TestScreenControl:
-    """Tests for screen control commands."""
-
-    def test_clear_screen(self, parser):
-        """Test 'cls' command."""
-        cmd = parser.parse("cls")
-        assert cmd.type == "clear_screen"
-
-
-class TestFileOperations:
-    """Tests for file operation commands."""
-
-    def test_compile_file(self, parser):
-        """Test ': file.ck' for compile file."""
-        cmd = parser.parse(": test.ck")
-        assert cmd.type == "compile_file"
-        assert cmd.args["path"] == "test.ck"
-
-    def test_exec_code(self, parser):
-        """Test '! "code"' for exec code."""
-        cmd = parser.parse('! "<<< 1 >>>"')
-        assert cmd.type == "exec_code"
-        assert cmd.args["code"] == "<<< 1 >>>"
-
-    def test_load_snippet(self, parser):
-        """Test '@name' for loading snippet."""
-        cmd = parser.parse("@sine")
-        assert cmd.type == "load_snippet"
-        assert cmd.args["name"] == "sine"
-
-
-class TestEditCommands:
-    """Tests for edit commands."""
-
-    def test_edit_shred(self, parser):
-        """Test 'edit 1' for editing shred."""
-        cmd = parser.parse("edit 1")
-        assert cmd.type == "edit_shred"
-        assert cmd.args["id"] == 1
-
-    def test_edit_shred_no_space(self, parser):
-        """Test 'edit1' works too."""
-        cmd = parser.parse("edit1")
-        assert cmd.type == "edit_shred"
-        assert cmd.args["id"] == 1
-
-    def test_open_editor(self, parser):
-        """Test 'edit' alone opens editor."""
-        cmd = parser.parse("edit")
-        assert cmd.type == "open_editor"
-
-
-class TestMiscCommands:
-    """Tests for miscellaneous commands."""
-
-    def test_shell(self, parser):
-        """Test '$ cmd' for shell command."""
-        cmd = parser.parse("$ ls -la")
-        assert cmd.type == "shell"
-        assert cmd.args["cmd"] == "ls -la"
-
-    def test_watch(self, parser):
-        """Test 'watch' command."""
-        cmd = parser.parse("watch")
-        assert cmd.type == "watch"
-
-
-class TestUnknownInput:
-    """Tests for unknown/ChucK code input."""
-
-    def test_chuck_code_returns_none(self, parser):
-        """Test that ChucK code returns None (handled by REPL)."""
-        cmd = parser.parse("SinOsc s => dac;")
-        assert cmd is None
-
-    def test_multiline_chuck_code(self, parser):
-        """Test multiline ChucK code returns None."""
-        cmd = parser.parse("fun void foo() {\n  <<< 1 >>>;\n}")
-        assert cmd is None
-
-    def test_empty_input(self, parser):
-        """Test empty input returns None."""
-        cmd = parser.parse("")
-        assert cmd is None
-
-    def test_whitespace_only(self, parser):
-        """Test whitespace-only input returns None."""
-        cmd = parser.parse("   ")
-        assert cmd is None
+        cmd.args["value"].append(4)
+        assert parser.parse("arr::[1, 2, 3]").args["value"] == [1, 2, 3]
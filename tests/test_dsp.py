@@ -0,0 +1,57 @@
+"""Tests for the numchuck.dsp post-processing helpers."""
+
+import numpy as np
+import pytest
+
+from numchuck import Chuck, dsp
+
+
+def test_apply_gain_in_place():
+    """Test gain scales the buffer without replacing it."""
+    buf = np.ones(8, dtype=np.float32)
+    dsp.apply_gain(buf, 0.5)
+    np.testing.assert_allclose(buf, 0.5)
+
+
+def test_apply_gain_planar():
+    """Test 2-D planar buffers are processed in place."""
+    buf = np.ones((2, 4), dtype=np.float32)
+    dsp.apply_gain(buf, 2.0)
+    np.testing.assert_allclose(buf, 2.0)
+
+
+def test_apply_gain_rejects_non_contiguous():
+    """Test a strided view is rejected rather than silently copied."""
+    buf = np.ones(8, dtype=np.float32)
+    with pytest.raises(ValueError):
+        dsp.apply_gain(buf[::2], 0.5)
+
+
+def test_peak_and_rms():
+    """Test metering against NumPy reference values."""
+    buf = np.array([0.5, -1.0, 0.25, 0.0], dtype=np.float32)
+    assert dsp.peak(buf) == 1.0
+    assert dsp.rms(buf) == pytest.approx(np.sqrt(np.mean(buf.astype(np.float64) ** 2)))
+    assert dsp.peak(np.empty(0, dtype=np.float32)) == 0.0
+    assert dsp.rms(np.empty(0, dtype=np.float32)) == 0.0
+
+
+def test_mix_into():
+    """Test mixing adds a scaled source into the destination."""
+    dst = np.ones(4, dtype=np.float32)
+    src = np.full(4, 2.0, dtype=np.float32)
+    dsp.mix_into(dst, src, 0.5)
+    np.testing.assert_allclose(dst, 2.0)
+    with pytest.raises(ValueError):
+        dsp.mix_into(dst, src[:2])
+
+
+def test_run_output():
+    """Test the helpers on real VM output."""
+    chuck = Chuck(output_channels=1)
+    chuck.compile("SinOsc s => dac; 1::second => now;")
+    out = chuck.run(4410)
+    before = dsp.peak(out)
+    dsp.apply_gain(out, 0.5)
+    assert dsp.peak(out) == pytest.approx(before * 0.5)
+    assert 0 < dsp.rms(out) < dsp.peak(out)
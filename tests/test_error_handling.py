@@ -11,6 +11,7 @@ Tests cover:
 
 import pytest
 import numchuck._numchuck as numchuck
+from helpers import make_chuck
 import numpy as np
 
 
@@ -20,10 +21,7 @@ import numpy as np
 
 def test_compile_code_empty_string():
     """Test that compiling empty code raises ValueError"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck()
 
     with pytest.raises(ValueError, match="Code cannot be empty"):
         chuck.compile_code("")
@@ -31,10 +29,7 @@ def test_compile_code_empty_string():
 
 def test_compile_code_zero_count():
     """Test that count=0 raises ValueError"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck()
 
     code = "SinOsc s => dac;"
     with pytest.raises(ValueError, match="Count must be at least 1"):
@@ -43,10 +38,7 @@ def test_compile_code_zero_count():
 
 def test_compile_file_empty_path():
     """Test that compiling with empty file path raises ValueError"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck()
 
     with pytest.raises(ValueError, match="File path cannot be empty"):
         chuck.compile_file("")
@@ -54,10 +46,7 @@ def test_compile_file_empty_path():
 
 def test_compile_file_zero_count():
     """Test that count=0 raises ValueError for file compilation"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck()
 
     with pytest.raises(ValueError, match="Count must be at least 1"):
         chuck.compile_file("test.ck", count=0)
@@ -109,11 +98,7 @@ def test_start_audio_not_initialized():
 
 def test_run_negative_frames():
     """Test that negative num_frames raises ValueError"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 0)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=0)
 
     input_buf = np.zeros(0, dtype=np.float32)
     output_buf = np.zeros(512 * 2, dtype=np.float32)
@@ -124,11 +109,7 @@ def test_run_negative_frames():
 
 def test_run_zero_frames():
     """Test that num_frames=0 raises ValueError"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 0)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=0)
 
     input_buf = np.zeros(0, dtype=np.float32)
     output_buf = np.zeros(512 * 2, dtype=np.float32)
@@ -139,11 +120,7 @@ def test_run_zero_frames():
 
 def test_run_wrong_input_buffer_size():
     """Test that wrong input buffer size raises ValueError"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)  # 2 input channels
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
 
     # Buffer too small (should be 512 * 2 = 1024)
     input_buf = np.zeros(512, dtype=np.float32)
@@ -155,11 +132,7 @@ def test_run_wrong_input_buffer_size():
 
 def test_run_wrong_output_buffer_size():
     """Test that wrong output buffer size raises ValueError"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 0)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=0)
 
     input_buf = np.zeros(0, dtype=np.float32)
     # Buffer too small (should be 512 * 2 = 1024)
@@ -178,11 +151,7 @@ def test_run_wrong_dtype_input():
 
     Both outcomes are valid - this test verifies neither crashes.
     """
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
 
     # Using float64 instead of float32
     input_buf = np.zeros(512 * 2, dtype=np.float64)
@@ -210,11 +179,7 @@ def test_run_wrong_dtype_output():
 
     Both outcomes are valid - this test verifies neither crashes.
     """
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 0)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=0)
 
     input_buf = np.zeros(0, dtype=np.float32)
     # Using float64 instead of float32
@@ -235,11 +200,7 @@ def test_run_wrong_dtype_output():
 
 def test_run_multidimensional_input():
     """Test that multidimensional input array is rejected by nanobind"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
 
     # 2D array instead of 1D - nanobind should reject at binding level
     input_buf = np.zeros((512, 2), dtype=np.float32)
@@ -252,11 +213,7 @@ def test_run_multidimensional_input():
 
 def test_run_multidimensional_output():
     """Test that multidimensional output array is rejected by nanobind"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 0)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=0)
 
     input_buf = np.zeros(0, dtype=np.float32)
     # 2D array instead of 1D - nanobind should reject at binding level
@@ -273,10 +230,7 @@ def test_run_multidimensional_output():
 
 def test_start_audio_zero_sample_rate():
     """Test that sample_rate=0 raises ValueError"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck()
 
     with pytest.raises(ValueError, match="Sample rate must be positive"):
         numchuck.start_audio(chuck, sample_rate=0)
@@ -284,10 +238,7 @@ def test_start_audio_zero_sample_rate():
 
 def test_start_audio_zero_channels():
     """Test that zero channels raises ValueError"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck()
 
     with pytest.raises(ValueError, match="At least one audio channel"):
         numchuck.start_audio(chuck, num_dac_channels=0, num_adc_channels=0)
@@ -295,10 +246,7 @@ def test_start_audio_zero_channels():
 
 def test_start_audio_zero_buffer_size():
     """Test that buffer_size=0 raises ValueError"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck()
 
     with pytest.raises(ValueError, match="Buffer size must be positive"):
         numchuck.start_audio(chuck, buffer_size=0)
@@ -310,10 +258,7 @@ def test_start_audio_zero_buffer_size():
 
 def test_compile_invalid_syntax():
     """Test that invalid ChucK syntax returns False"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck()
 
     # Invalid ChucK code
     code = "this is not valid chuck syntax!!!"
@@ -325,10 +270,7 @@ def test_compile_invalid_syntax():
 
 def test_compile_nonexistent_file():
     """Test that compiling non-existent file returns False"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck()
 
     success, shred_ids = chuck.compile_file("/nonexistent/path/to/file.ck")
 
@@ -338,10 +280,7 @@ def test_compile_nonexistent_file():
 
 def test_compile_undefined_class():
     """Test that using undefined class returns False"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck()
 
     # UndefinedClass doesn't exist
     code = "UndefinedClass obj;"
@@ -353,10 +292,7 @@ def test_compile_undefined_class():
 
 def test_compile_type_mismatch():
     """Test that type mismatch returns False"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck()
 
     # Type error: can't assign string to int
     code = 'int x; "hello" => x;'
@@ -372,10 +308,7 @@ def test_compile_type_mismatch():
 
 def test_compile_with_count_multiple():
     """Test compiling with count > 1 creates multiple shreds"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck()
 
     code = "SinOsc s => dac; 440 => s.freq; while(true) { 1::samp => now; }"
     success, shred_ids = chuck.compile_code(code, count=3)
@@ -390,11 +323,7 @@ def test_compile_with_count_multiple():
 
 def test_large_buffer_processing():
     """Test processing large buffer (stress test)"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 0)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=0)
 
     code = '''
     SinOsc s => dac;
@@ -421,11 +350,7 @@ def test_large_buffer_processing():
 
 def test_zero_input_channels_with_input():
     """Test that providing input when channels=0 still validates size"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 0)  # No input channels
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=0)
 
     # Providing input data when no input channels configured
     input_buf = np.zeros(512, dtype=np.float32)  # Wrong: should be size 0
@@ -459,10 +384,7 @@ def test_multiple_init_calls():
 
 def test_sequential_compile_and_remove():
     """Test sequential compilation and removal"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck()
 
     code = "SinOsc s => dac; while(true) { 1::samp => now; }"
 
@@ -1,5 +1,7 @@
+import functools
 import pytest
 import numchuck._numchuck as numchuck
+from helpers import make_chuck
 import os
 import tempfile
 import time
@@ -12,18 +14,21 @@ def normalize_path(path: str) -> str:
     return str(Path(path).resolve()).replace('\\', '/')
 
 
-def test_compile_from_file():
+# Example directories, resolved once per session (normalized for ChucK)
+_EXAMPLES_DIR = normalize_path(os.path.join(os.path.dirname(__file__), '../examples'))
+_BASIC_DIR = f'{_EXAMPLES_DIR}/basic'
+_CONVREV_DIR = f'{_EXAMPLES_DIR}/convrev'
+
+# How long the real-time tests let audio play
+_PLAY_SECONDS = 0.1
+
+
+def test_compile_from_file(chuck_44k_stereo):
     """Test compiling ChucK code from a file"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = chuck_44k_stereo
 
     # Path to a basic example file (normalize for Windows compatibility)
-    example_file = normalize_path(os.path.join(
-        os.path.dirname(__file__),
-        '../examples/basic/blit2.ck'
-    ))
+    example_file = f'{_BASIC_DIR}/blit2.ck'
 
     # Check if file exists
     assert os.path.exists(example_file), f"Example file not found: {example_file}"
@@ -33,9 +38,6 @@ def test_compile_from_file():
     assert success, "Failed to compile example file"
     assert len(shred_ids) > 0, "No shreds created"
 
-    # Clean up
-    chuck.remove_all_shreds()
-
 
 def test_file_with_working_directory():
     """Test that working directory parameter works correctly"""
@@ -44,22 +46,22 @@ def test_file_with_working_directory():
     chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
 
     # Set working directory to examples folder (normalize for Windows compatibility)
-    examples_dir = normalize_path(os.path.join(os.path.dirname(__file__), '../examples/basic'))
+    examples_dir = _BASIC_DIR
     chuck.set_param_string(numchuck.PARAM_WORKING_DIRECTORY, examples_dir)
     chuck.init()
 
     # Now we can reference files relative to working directory
-    full_path = normalize_path(os.path.join(examples_dir, 'blit2.ck'))
+    full_path = f'{examples_dir}/blit2.ck'
     success, _ = chuck.compile_file(full_path)
     assert success
 
 
-def test_chugin_loading():
+def test_chugin_loading(chugins):
     """Test loading and using chugins (lenient - works with static or dynamic)"""
-    # Check if Bitcrusher is available (static or dynamic)
-    is_available, is_static = _check_chugin_available("Bitcrusher")
+    chugins_dir, _ = chugins
 
-    chugins_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../examples/chugins'))
+    # Check if Bitcrusher is available (static or dynamic)
+    is_available, is_static = _check_chugin_available("Bitcrusher", chugins_dir)
 
     chuck = numchuck.ChucK()
     chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
@@ -101,74 +103,38 @@ def test_chugin_loading():
         assert success2, "ChucK should work even without chugins"
 
 
+@pytest.mark.slow
 def test_realtime_file_playback():
     """Test real-time playback of a file"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck()
 
-    # Create a simple test file (use tempfile for cross-platform compatibility)
-    test_file = os.path.join(tempfile.gettempdir(), 'test_chuck.ck')
-    with open(test_file, 'w') as f:
-        f.write('''
-SinOsc s => dac;
-440 => s.freq;
-0.3 => s.gain;
-while(true) { 1::samp => now; }
-''')
-
-    # Compile and play (normalize path for Windows compatibility)
-    success, _ = chuck.compile_file(normalize_path(test_file))
+    # Compile an example file and play it
+    success, _ = chuck.compile_file(f'{_BASIC_DIR}/fm.ck')
     assert success
 
     # Start real-time audio
     if numchuck.start_audio(chuck):
-        time.sleep(0.1)  # Play briefly
+        time.sleep(_PLAY_SECONDS)
         numchuck.stop_audio()
         numchuck.shutdown_audio()
 
-    # Clean up
-    os.remove(test_file)
-
 
-def test_multiple_file_compilation():
+def test_multiple_file_compilation(chuck_44k_stereo):
     """Test compiling multiple files"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
-
-    # Create two simple files (use tempfile for cross-platform compatibility)
-    file1 = os.path.join(tempfile.gettempdir(), 'test1.ck')
-    file2 = os.path.join(tempfile.gettempdir(), 'test2.ck')
-
-    with open(file1, 'w') as f:
-        f.write('SinOsc s1 => dac; 440 => s1.freq; 0.1 => s1.gain; while(true) { 1::samp => now; }')
-
-    with open(file2, 'w') as f:
-        f.write('SinOsc s2 => dac; 550 => s2.freq; 0.1 => s2.gain; while(true) { 1::samp => now; }')
+    chuck = chuck_44k_stereo
 
-    # Compile both (normalize paths for Windows compatibility)
-    success1, ids1 = chuck.compile_file(normalize_path(file1))
-    success2, ids2 = chuck.compile_file(normalize_path(file2))
+    # Compile two example files
+    success1, ids1 = chuck.compile_file(f'{_BASIC_DIR}/fm.ck')
+    success2, ids2 = chuck.compile_file(f'{_BASIC_DIR}/blit2.ck')
 
     assert success1 and success2
     assert len(ids1) > 0 and len(ids2) > 0
     assert ids1[0] != ids2[0], "Should have different shred IDs"
 
-    # Clean up
-    chuck.remove_all_shreds()
-    os.remove(file1)
-    os.remove(file2)
-
 
-def test_file_with_syntax_error():
+def test_file_with_syntax_error(chuck_44k_stereo):
     """Test that file with syntax error fails gracefully"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = chuck_44k_stereo
 
     # Create a file with syntax error (use tempfile for cross-platform compatibility)
     error_file = os.path.join(tempfile.gettempdir(), 'error.ck')
@@ -184,18 +150,12 @@ def test_file_with_syntax_error():
     os.remove(error_file)
 
 
-# Helper to check if dynamic chugins are available
-def _dynamic_chugins_available():
-    """Check if chugins directory exists and has .chug files"""
-    chugins_dir = os.path.join(os.path.dirname(__file__), '../examples/chugins')
-    if not os.path.exists(chugins_dir):
-        return False
-    chug_files = [f for f in os.listdir(chugins_dir) if f.endswith('.chug')]
-    return len(chug_files) > 0
-
+@functools.lru_cache(maxsize=None)
+def _check_chugin_available(chugin_name: str, chugins_dir: str) -> tuple[bool, bool]:
+    """Check if a chugin is available (static or dynamic from chugins_dir).
 
-def _check_chugin_available(chugin_name: str) -> tuple[bool, bool]:
-    """Check if a chugin is available (static or dynamic).
+    Cached per chugin name: the answer can't change during a test run, and
+    each check initializes up to two VMs.
 
     Returns:
         (is_available, is_static): Whether chugin is available and if it's statically linked
@@ -212,9 +172,8 @@ def _check_chugin_available(chugin_name: str) -> tuple[bool, bool]:
     if success:
         return (True, True)  # Available via static linking
 
-    # Try with dynamic chugins path
-    chugins_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../examples/chugins'))
-    if not os.path.exists(chugins_dir):
+    # Try with dynamic chugins path, if it has this chugin
+    if not os.path.exists(f'{chugins_dir}/{chugin_name}.chug'):
         return (False, False)
 
     chuck2 = numchuck.ChucK()
@@ -231,16 +190,22 @@ def _check_chugin_available(chugin_name: str) -> tuple[bool, bool]:
     return (False, False)
 
 
-def test_chugin_bitcrusher_strict():
+def _stereo_buffers(frames):
+    """Return zeroed stereo (input, output) buffers for frames."""
+    import numpy as np
+
+    return np.zeros(frames * 2, dtype=np.float32), np.zeros(frames * 2, dtype=np.float32)
+
+
+def test_chugin_bitcrusher_strict(chugins):
     """Strict test: Bitcrusher chugin must load and produce audio output"""
     import numpy as np
 
-    is_available, is_static = _check_chugin_available("Bitcrusher")
+    chugins_dir, _ = chugins
+    is_available, is_static = _check_chugin_available("Bitcrusher", chugins_dir)
     if not is_available:
         pytest.skip("Bitcrusher chugin not available (neither static nor dynamic)")
 
-    chugins_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../examples/chugins'))
-
     chuck = numchuck.ChucK()
     chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
     chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
@@ -267,8 +232,7 @@ def test_chugin_bitcrusher_strict():
 
     # Run and verify audio output
     frames = 1024
-    input_buf = np.zeros(frames * 2, dtype=np.float32)
-    output_buf = np.zeros(frames * 2, dtype=np.float32)
+    input_buf, output_buf = _stereo_buffers(frames)
     chuck.run(input_buf, output_buf, frames)
 
     # Verify non-zero output (audio is being generated)
@@ -278,16 +242,15 @@ def test_chugin_bitcrusher_strict():
     chuck.remove_all_shreds()
 
 
-def test_chugin_gverb_strict():
+def test_chugin_gverb_strict(chugins):
     """Strict test: GVerb chugin must load and process audio"""
     import numpy as np
 
-    is_available, is_static = _check_chugin_available("GVerb")
+    chugins_dir, _ = chugins
+    is_available, is_static = _check_chugin_available("GVerb", chugins_dir)
     if not is_available:
         pytest.skip("GVerb chugin not available (neither static nor dynamic)")
 
-    chugins_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../examples/chugins'))
-
     chuck = numchuck.ChucK()
     chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
     chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
@@ -311,8 +274,7 @@ def test_chugin_gverb_strict():
 
     # Run and verify audio output
     frames = 2048
-    input_buf = np.zeros(frames * 2, dtype=np.float32)
-    output_buf = np.zeros(frames * 2, dtype=np.float32)
+    input_buf, output_buf = _stereo_buffers(frames)
     chuck.run(input_buf, output_buf, frames)
 
     # GVerb should produce reverb tail from impulse
@@ -322,17 +284,16 @@ def test_chugin_gverb_strict():
     chuck.remove_all_shreds()
 
 
-def test_chugin_convrev_example():
+def test_chugin_convrev_example(chugins):
     """Test loading the ConvRev.ck example file that uses ConvRev chugin"""
     import numpy as np
 
-    is_available, is_static = _check_chugin_available("ConvRev")
+    chugins_dir, _ = chugins
+    is_available, is_static = _check_chugin_available("ConvRev", chugins_dir)
     if not is_available:
         pytest.skip("ConvRev chugin not available (neither static nor dynamic)")
-
-    chugins_dir = normalize_path(os.path.join(os.path.dirname(__file__), '../examples/chugins'))
-    example_file = normalize_path(os.path.join(os.path.dirname(__file__), '../examples/convrev/ConvRev.ck'))
-    ir_file = normalize_path(os.path.join(os.path.dirname(__file__), '../examples/convrev/IRs/hagia-sophia.wav'))
+    example_file = f'{_CONVREV_DIR}/ConvRev.ck'
+    ir_file = f'{_CONVREV_DIR}/IRs/hagia-sophia.wav'
 
     if not os.path.exists(example_file):
         pytest.skip("ConvRev.ck example not found")
@@ -348,7 +309,7 @@ def test_chugin_convrev_example():
         chuck.set_param_string_list(numchuck.PARAM_IMPORT_PATH_SYSTEM, [chugins_dir])
 
     # Set working directory so me.dir() works correctly
-    examples_convrev_dir = normalize_path(os.path.join(os.path.dirname(__file__), '../examples/convrev'))
+    examples_convrev_dir = _CONVREV_DIR
     chuck.set_param_string(numchuck.PARAM_WORKING_DIRECTORY, examples_convrev_dir)
 
     chuck.init()
@@ -359,8 +320,7 @@ def test_chugin_convrev_example():
 
     # Run for a bit and verify audio output
     frames = 4096
-    input_buf = np.zeros(frames * 2, dtype=np.float32)
-    output_buf = np.zeros(frames * 2, dtype=np.float32)
+    input_buf, output_buf = _stereo_buffers(frames)
     chuck.run(input_buf, output_buf, frames)
 
     # Should produce audio from the convolution reverb
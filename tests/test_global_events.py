@@ -4,6 +4,7 @@ Tests for ChucK global event management.
 
 import pytest
 import numchuck._numchuck as numchuck
+from helpers import make_chuck
 import numpy as np
 
 
@@ -19,11 +20,7 @@ def run_audio_cycles(chuck, cycles=5):
 
 def test_signal_global_event():
     """Test signaling a global event."""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
     chuck.start()
 
     # Define a global event
@@ -41,11 +38,7 @@ def test_signal_global_event():
 
 def test_broadcast_global_event():
     """Test broadcasting a global event."""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
     chuck.start()
 
     code = "global Event broadcastEvent;"
@@ -61,11 +54,7 @@ def test_broadcast_global_event():
 
 def test_event_nonexistent():
     """Test that signaling non-existent event doesn't crash."""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
     chuck.start()
 
     run_audio_cycles(chuck)
@@ -86,11 +75,7 @@ def test_event_nonexistent():
 
 def test_listen_for_event():
     """Test listening for global events with callback."""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
     chuck.start()
 
     # Create global event
@@ -120,11 +105,7 @@ def test_listen_for_event():
 
 def test_stop_listening_for_event():
     """Test stopping event listener to prevent memory leaks."""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
     chuck.start()
 
     # Create global event
@@ -162,11 +143,7 @@ def test_stop_listening_for_event():
 
 def test_multiple_event_listeners():
     """Test that listener cleanup API exists and works."""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
     chuck.start()
 
     # Create global event
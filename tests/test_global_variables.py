@@ -4,6 +4,7 @@ Tests for ChucK global variable management.
 
 import pytest
 import numchuck._numchuck as numchuck
+from helpers import make_chuck
 import numpy as np
 
 
@@ -19,11 +20,7 @@ def run_audio_cycles(chuck, cycles=5):
 
 def test_set_get_global_int():
     """Test setting and getting global int variables."""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
     chuck.start()
 
     # Define a global int variable
@@ -50,11 +47,7 @@ def test_set_get_global_int():
 
 def test_set_get_global_float():
     """Test setting and getting global float variables."""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
     chuck.start()
 
     code = "global float myFloat;"
@@ -78,11 +71,7 @@ def test_set_get_global_float():
 
 def test_set_get_global_string():
     """Test setting and getting global string variables."""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
     chuck.start()
 
     code = "global string myString;"
@@ -106,11 +95,7 @@ def test_set_get_global_string():
 
 def test_set_get_global_int_array():
     """Test setting and getting global int arrays."""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
     chuck.start()
 
     code = "global int myArray[0];"
@@ -136,11 +121,7 @@ def test_set_get_global_int_array():
 
 def test_set_global_int_array_value():
     """Test setting individual int array elements."""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
     chuck.start()
 
     code = "global int myArray[5];"
@@ -167,11 +148,7 @@ def test_set_global_int_array_value():
 
 def test_get_all_globals():
     """Test getting list of all global variables."""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
     chuck.start()
 
     code = """
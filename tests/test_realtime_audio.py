@@ -1,15 +1,16 @@
 import pytest
 import numchuck._numchuck as numchuck
+from helpers import make_chuck
 import time
 
+# How long the real-time test lets audio play
+_PLAY_SECONDS = 0.1
 
+
+@pytest.mark.slow
 def test_realtime_audio():
     """Test real-time audio playback"""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 0)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=0)
 
     # Compile audio code
     code = '''
@@ -33,7 +34,7 @@ def test_realtime_audio():
     assert info['buffer_size'] == 512
 
     # Let it play briefly
-    time.sleep(0.1)
+    time.sleep(_PLAY_SECONDS)
 
     # Stop audio
     numchuck.stop_audio()
@@ -4,6 +4,7 @@ Tests for ChucK shred management and introspection.
 
 import pytest
 import numchuck._numchuck as numchuck
+from helpers import make_chuck
 import numpy as np
 
 
@@ -19,11 +20,7 @@ def run_audio_cycles(chuck, cycles=5):
 
 def test_remove_shred():
     """Test removing a shred by ID."""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
     chuck.start()
 
     code = "while (true) { 100::ms => now; }"
@@ -46,11 +43,7 @@ def test_remove_shred():
 
 def test_get_all_shred_ids():
     """Test getting all running shred IDs."""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
     chuck.start()
 
     # Spork 3 shreds
@@ -71,11 +64,7 @@ def test_get_all_shred_ids():
 
 def test_get_shred_info():
     """Test getting detailed shred information."""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
     chuck.start()
 
     code = "1::second => now;"
@@ -93,11 +82,7 @@ def test_get_shred_info():
 
 def test_get_shred_info_nonexistent():
     """Test that getting info for non-existent shred raises error."""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
     chuck.start()
 
     with pytest.raises(RuntimeError, match="Shred .* not found"):
@@ -106,11 +91,7 @@ def test_get_shred_info_nonexistent():
 
 def test_clear_vm():
     """Test clearing the VM."""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
     chuck.start()
 
     # Spork multiple shreds
@@ -135,11 +116,7 @@ def test_clear_vm():
 
 def test_reset_shred_id():
     """Test resetting shred ID counter."""
-    chuck = numchuck.ChucK()
-    chuck.set_param(numchuck.PARAM_SAMPLE_RATE, 44100)
-    chuck.set_param(numchuck.PARAM_INPUT_CHANNELS, 2)
-    chuck.set_param(numchuck.PARAM_OUTPUT_CHANNELS, 2)
-    chuck.init()
+    chuck = make_chuck(input_channels=2)
     chuck.start()
 
     # Spork some shreds
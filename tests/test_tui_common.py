@@ -5,7 +5,13 @@ Tests the helper functions used for shreds table formatting.
 """
 
 import pytest
-from numchuck.tui.common import format_elapsed_time, format_shred_name, generate_shreds_table
+from numchuck.tui.common import (
+    ChuckApplication,
+    format_elapsed_time,
+    format_shred_name,
+    generate_shreds_table,
+)
+from numchuck.tui.session import Shred
 
 
 class TestFormatElapsedTime:
@@ -17,6 +23,14 @@ class TestFormatElapsedTime:
         assert format_elapsed_time(5.5) == "5.5s"
         assert format_elapsed_time(59.9) == "59.9s"
 
+    def test_seconds_match_plain_formatting(self):
+        """Test sub-minute times format exactly as :.1f, including negatives and ties."""
+        values = [i / 1000 for i in range(-5000, 60000, 7)]
+        values += [i / 20 for i in range(-100, 1200)]  # exact .x5 ties
+        values += [-0.0, -0.04, 0.05, 0.25, 0.35, 59.95, 59.96]
+        for value in values:
+            assert format_elapsed_time(value) == f"{value:.1f}s", value
+
     def test_minutes_and_seconds(self):
         """Test formatting between 1 minute and 1 hour."""
         assert format_elapsed_time(60.0) == "1m00.0s"
@@ -81,7 +95,7 @@ class TestGenerateShedsTable:
                 return 44100
 
         shreds = {
-            1: {"name": "test.ck", "time": 0.0},
+            1: Shred(1, "test.ck", 0.0),
         }
         result = generate_shreds_table(shreds, MockChuck(), use_pipes=True)
         assert "|" in result
@@ -102,7 +116,7 @@ class TestGenerateShedsTable:
                 return 44100
 
         shreds = {
-            1: {"name": "test.ck", "time": 0.0},
+            1: Shred(1, "test.ck", 0.0),
         }
         result = generate_shreds_table(shreds, MockChuck(), use_pipes=False)
         assert "|" not in result
@@ -120,8 +134,8 @@ class TestGenerateShedsTable:
                 return 44100
 
         shreds = {
-            1: {"name": "first.ck", "time": 0.0},
-            2: {"name": "second.ck", "time": 44100.0},
+            1: Shred(1, "first.ck", 0.0),
+            2: Shred(2, "second.ck", 44100.0),
         }
         result = generate_shreds_table(shreds, MockChuck(), use_pipes=True)
         assert "first.ck" in result
@@ -142,7 +156,7 @@ class TestGenerateShedsTable:
                 raise RuntimeError("ChucK not initialized")
 
         shreds = {
-            1: {"name": "test.ck", "time": 0.0},
+            1: Shred(1, "test.ck", 0.0),
         }
         # Should not raise, should use defaults
         result = generate_shreds_table(shreds, BrokenChuck(), use_pipes=True)
@@ -160,9 +174,9 @@ class TestGenerateShedsTable:
                 return 44100
 
         shreds = {
-            3: {"name": "third.ck", "time": 0.0},
-            1: {"name": "first.ck", "time": 0.0},
-            2: {"name": "second.ck", "time": 0.0},
+            3: Shred(3, "third.ck", 0.0),
+            1: Shred(1, "first.ck", 0.0),
+            2: Shred(2, "second.ck", 0.0),
         }
         result = generate_shreds_table(shreds, MockChuck(), use_pipes=True)
         lines = result.split("\n")
@@ -172,3 +186,61 @@ class TestGenerateShedsTable:
         assert "1" in lines[2] and "first.ck" in lines[2]
         assert "2" in lines[3] and "second.ck" in lines[3]
         assert "3" in lines[4] and "third.ck" in lines[4]
+
+    def test_explicit_sample_rate_skips_query(self):
+        """Test a known sample rate is used without querying ChucK."""
+
+        class MockChuck:
+            def now(self):
+                return 48000.0
+
+            def get_param_int(self, param):
+                raise AssertionError("sample rate should not be queried")
+
+        shreds = {
+            1: Shred(1, "test.ck", 0.0),
+        }
+        result = generate_shreds_table(
+            shreds, MockChuck(), use_pipes=True, sample_rate=48000
+        )
+        assert "1.0s" in result
+
+    def test_presorted_items(self):
+        """Test (id, info) pairs are used in the order given."""
+
+        class MockChuck:
+            def now(self):
+                return 0.0
+
+        items = [
+            (1, Shred(1, "first.ck", 0.0)),
+            (2, Shred(2, "second.ck", 0.0)),
+        ]
+        result = generate_shreds_table(items, MockChuck(), sample_rate=44100)
+        lines = result.split("\n")
+        assert "first.ck" in lines[2]
+        assert "second.ck" in lines[3]
+
+
+class TestLogWindow:
+    """Tests for the log window's incremental updates."""
+
+    def _render(self, window):
+        """Evaluate the window's filter, as a redraw does."""
+        window.filter()
+        return window.content.content.buffer.text
+
+    def test_text_matches_history_after_overflow(self):
+        """Test evicted messages leave the text once the history is full."""
+        app = ChuckApplication()
+        window = app.create_log_window()
+        app.show_log = True
+        limit = app.log_messages.maxlen
+        try:
+            for start in range(0, limit * 3, 350):
+                for i in range(start, start + 350):
+                    app._log_output(f"line {i}\n")
+                assert self._render(window) == "".join(app.log_messages)
+            assert self._render(window).startswith(f"line {limit * 3 + 150 - limit}\n")
+        finally:
+            app.cleanup()